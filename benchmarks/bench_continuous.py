@@ -0,0 +1,59 @@
+
+import numpy as np
+
+from pyqentangle.core.continuous import continuous_schmidt_decomposition, discretize_continuous_bipartitesys
+from pyqentangle.core.wavefunctions import AnalyticMultiDimWaveFunction
+from pyqentangle.quantumstates.harmonics import coupled_excited_harmonics, correlated_bipartite_gaussian_wavefcn
+
+
+def oscillators(vectorized):
+    return AnalyticMultiDimWaveFunction(
+        lambda x: np.exp(-0.5 * (x[0] + x[1]) ** 2) * np.exp(-(x[0] - x[1]) ** 2) * np.sqrt(np.sqrt(8.) / np.pi),
+        vectorized=vectorized
+    )
+
+
+class Discretization:
+    params = ([100, 400], ['oscillators', 'excited harmonics', 'gaussian'])
+    param_names = ['nb_x', 'state']
+
+    def setup(self, nb_x, state):
+        if state == 'oscillators':
+            self.wavefcn = oscillators(True)
+        elif state == 'excited harmonics':
+            self.wavefcn = coupled_excited_harmonics(3)
+        else:
+            self.wavefcn = correlated_bipartite_gaussian_wavefcn(np.array([[2., 0.5], [0.5, 1.]]))
+
+    def time_discretize(self, nb_x, state):
+        discretize_continuous_bipartitesys(self.wavefcn, -10., 10., -10., 10., nb_x1=nb_x, nb_x2=nb_x)
+
+
+class ScalarDiscretization:
+    params = [50, 100]
+    param_names = ['nb_x']
+
+    def setup(self, nb_x):
+        self.wavefcn = oscillators(False)
+
+    def time_discretize(self, nb_x):
+        discretize_continuous_bipartitesys(self.wavefcn, -10., 10., -10., 10., nb_x1=nb_x, nb_x2=nb_x)
+
+
+class ContinuousSchmidtDecomposition:
+    params = (
+        [100, 400],
+        ['numpy', 'tensornetwork', 'randomized'],
+        ['uniform', 'chebyshev', 'gauss-hermite'],
+        ['complex128', 'float64']
+    )
+    param_names = ['nb_x', 'approach', 'grid', 'dtype']
+
+    def setup(self, nb_x, approach, grid, dtype):
+        self.wavefcn = oscillators(True)
+
+    def time_continuous_schmidt_decomposition(self, nb_x, approach, grid, dtype):
+        continuous_schmidt_decomposition(
+            self.wavefcn, -10., 10., -10., 10., nb_x1=nb_x, nb_x2=nb_x, keep=10,
+            approach=approach, grid=grid, dtype=np.dtype(dtype)
+        )
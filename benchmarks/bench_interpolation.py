@@ -0,0 +1,32 @@
+
+import numpy as np
+
+from pyqentangle.core.wavefunctions import InterpolatingWaveFunction
+
+
+class Interpolation:
+    params = (
+        [100, 1000],
+        [10000],
+        ['linear', 'cubic', 'sinc', 'barycentric'],
+        [True, False]
+    )
+    param_names = ['nb_grid', 'nb_points', 'kind', 'uniform']
+
+    def setup(self, nb_grid, nb_points, kind, uniform):
+        if kind == 'sinc' and not uniform:
+            raise NotImplementedError()
+        if uniform:
+            xarray = np.linspace(-10., 10., nb_grid)
+        else:
+            xarray = -10. * np.cos(np.pi * np.arange(nb_grid) / (nb_grid - 1))
+        yarray = np.exp(-0.5 * xarray * xarray) * (1 + 0.1j * xarray)
+        self.wavefcn = InterpolatingWaveFunction(xarray, yarray, kind=kind)
+        self.points = np.random.default_rng(0).uniform(-9.9, 9.9, nb_points)
+
+    def time_interpolating_wavefunction(self, nb_grid, nb_points, kind, uniform):
+        self.wavefcn(self.points)
+
+    def time_interpolating_wavefunction_scalar(self, nb_grid, nb_points, kind, uniform):
+        for point in self.points[:100]:
+            self.wavefcn(point)
@@ -0,0 +1,62 @@
+
+import numpy as np
+
+from pyqentangle.core.tncompute import bipartitepurestate_densitymatrix, bipartitepurestate_reduceddensitymatrix
+from pyqentangle.metrics.metrics import entanglement_entropy, negativity
+
+from .bench_schmidt import random_state
+
+
+class PureStateNegativity:
+    params = ([8, 32], [False, True])
+    param_names = ['dimension', 'dense']
+
+    def setup(self, dimension, dense):
+        self.tensor = random_state((dimension, dimension), np.complex128)
+
+    def time_negativity(self, dimension, dense):
+        negativity(self.tensor, dense=dense)
+
+
+class DensityMatrixNegativity:
+    params = ([8, 24], ['eigvalsh', 'lanczos'])
+    param_names = ['dimension', 'eigensolver']
+
+    def setup(self, dimension, eigensolver):
+        # a weakly entangled state mixed with white noise, whose partial transpose has only
+        # a few negative eigenvalues
+        rng = np.random.default_rng(0)
+        vecs1, _ = np.linalg.qr(rng.standard_normal((dimension, dimension)))
+        vecs2, _ = np.linalg.qr(rng.standard_normal((dimension, dimension)))
+        coefs = np.power(0.3, np.arange(dimension))
+        tensor = vecs1 @ np.diag(coefs / np.linalg.norm(coefs)) @ vecs2.T
+        noise = np.reshape(np.eye(dimension * dimension), (dimension, dimension, dimension, dimension))
+        self.densitymatrix = 0.5 * bipartitepurestate_densitymatrix(tensor) + 0.5 * noise / dimension ** 2
+
+    def time_negativity(self, dimension, eigensolver):
+        negativity(self.densitymatrix, eigensolver=eigensolver, nb_eigenvalues=16)
+
+
+class ReducedDensityMatrix:
+    params = ([64, 512], ['numpy', 'tensornetwork'], ['complex128', 'complex64'])
+    param_names = ['dimension', 'backend', 'dtype']
+
+    def setup(self, dimension, backend, dtype):
+        if backend == 'tensornetwork' and dtype != 'complex128':
+            raise NotImplementedError()
+        self.tensor = random_state((dimension, dimension), np.dtype(dtype))
+
+    def time_reduced_density_matrix(self, dimension, backend, dtype):
+        bipartitepurestate_reduceddensitymatrix(self.tensor, 0, backend=backend)
+
+
+class BatchEntanglementEntropy:
+    params = [100, 10000]
+    param_names = ['batch_size']
+
+    def setup(self, batch_size):
+        coefficients = np.random.default_rng(0).uniform(size=(batch_size, 16))
+        self.coefficients = coefficients / np.linalg.norm(coefficients, axis=1, keepdims=True)
+
+    def time_entanglement_entropy(self, batch_size):
+        entanglement_entropy(self.coefficients)
@@ -0,0 +1,60 @@
+
+import numpy as np
+
+from pyqentangle.core.schmidt import schmidt_decomposition, schmidt_decomposition_batch, schmidt_coefficients_only
+
+
+def random_state(dims, dtype, seed=0):
+    rng = np.random.default_rng(seed)
+    tensor = rng.standard_normal(dims)
+    if np.issubdtype(dtype, np.complexfloating):
+        tensor = tensor + 1j * rng.standard_normal(dims)
+    tensor /= np.linalg.norm(tensor)
+    return tensor.astype(dtype)
+
+
+class SchmidtDecomposition:
+    params = (
+        [64, 256, 1024],
+        ['numpy', 'tensornetwork', 'randomized', 'gram'],
+        ['complex128', 'complex64', 'float64']
+    )
+    param_names = ['dimension', 'approach', 'dtype']
+
+    def setup(self, dimension, approach, dtype):
+        self.tensor = random_state((dimension, dimension // 2), np.dtype(dtype))
+
+    def time_schmidt_decomposition(self, dimension, approach, dtype):
+        schmidt_decomposition(self.tensor, approach=approach, keep=16)
+
+    def peakmem_schmidt_decomposition(self, dimension, approach, dtype):
+        schmidt_decomposition(self.tensor, approach=approach, keep=16)
+
+
+class SchmidtCoefficientsOnly:
+    params = ([(512, 512), (256, 8192)], ['svd', 'eigvalsh'])
+    param_names = ['shape', 'method']
+
+    def setup(self, shape, method):
+        self.tensor = random_state(shape, np.complex128)
+
+    def time_schmidt_coefficients_only(self, shape, method):
+        schmidt_coefficients_only(self.tensor, method=method)
+
+    def time_full_schmidt_decomposition(self, shape, method):
+        schmidt_decomposition(self.tensor, approach='numpy')
+
+
+class BatchSchmidtDecomposition:
+    params = ([16, 256], [4, 16])
+    param_names = ['batch_size', 'dimension']
+
+    def setup(self, batch_size, dimension):
+        self.tensors = random_state((batch_size, dimension, dimension), np.complex128)
+
+    def time_schmidt_decomposition_batch(self, batch_size, dimension):
+        schmidt_decomposition_batch(self.tensors)
+
+    def time_schmidt_decomposition_loop(self, batch_size, dimension):
+        for tensor in self.tensors:
+            schmidt_decomposition(tensor, approach='numpy')
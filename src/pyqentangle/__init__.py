@@ -1,8 +1,47 @@
 
-from . import quantumstates
+from importlib import import_module
 
 from .core.exceptions import OutOfRangeException, UnequalLengthException, InvalidQuantumStateException
-from .core.schmidt import schmidt_decomposition
-from .core.continuous import continuous_schmidt_decomposition
-from .metrics.metrics import entanglement_entropy, participation_ratio, negativity, concurrence, renyi_entanglement_entropy
-from .entangle import DiscreteSchmidtDecomposer, ContinuousSchmidtDecomposer
+from .core.schmidt import schmidt_decomposition, schmidt_decomposition_batch, schmidt_coefficients_only
+
+# The other public names are imported from their modules on first access, so that
+# `import pyqentangle` does not load Numba, tensornetwork and SciPy's interpolation
+# routines until they are needed.
+_lazy_attributes = {
+    'continuous_schmidt_decomposition': '.core.continuous',
+    'mps_decomposition': '.core.mps',
+    'entanglement_entropy': '.metrics.metrics',
+    'multipartite_entanglement_entropies': '.metrics.metrics',
+    'participation_ratio': '.metrics.metrics',
+    'negativity': '.metrics.metrics',
+    'log_negativity': '.metrics.metrics',
+    'concurrence': '.metrics.metrics',
+    'renyi_entanglement_entropy': '.metrics.metrics',
+    'DiscreteSchmidtDecomposer': '.entangle',
+    'ContinuousSchmidtDecomposer': '.entangle',
+    'GaussianSchmidtDecomposer': '.entangle',
+    'MultipartiteDecomposer': '.entangle',
+}
+_lazy_submodules = {'quantumstates', 'metrics'}
+
+__all__ = [
+    'OutOfRangeException', 'UnequalLengthException', 'InvalidQuantumStateException',
+    'schmidt_decomposition', 'schmidt_decomposition_batch', 'schmidt_coefficients_only',
+    *_lazy_attributes,
+    *sorted(_lazy_submodules)
+]
+
+
+def __getattr__(name):
+    if name in _lazy_attributes:
+        value = getattr(import_module(_lazy_attributes[name], __name__), name)
+    elif name in _lazy_submodules:
+        value = import_module('.' + name, __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _lazy_submodules)
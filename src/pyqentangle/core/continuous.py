@@ -1,15 +1,226 @@
 
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
 from itertools import product
+from math import ceil
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
 from typing import Optional, Literal
 
 import numpy as np
 import numpy.typing as npt
+from scipy.special import roots_hermite
 
-from .schmidt import schmidt_decomposition
+from .schmidt import schmidt_decomposition, _row_slices
 from .interpolate import numerical_continuous_function
 from .wavefunctions import InterpolatingWaveFunction, WaveFunction
 
 
+def _clenshaw_curtis_weights(nb: int) -> npt.NDArray[np.float64]:
+    """Return the Clenshaw–Curtis quadrature weights of the `nb` Chebyshev–Lobatto points on :math:`[-1, 1]`."""
+    if nb == 1:
+        return np.array([2.])
+    order = nb - 1
+    theta = np.pi * np.arange(nb) / order
+    weights = np.zeros(nb)
+    inner = np.ones(nb - 2)
+    if order % 2 == 0:
+        weights[0] = weights[-1] = 1. / (order * order - 1)
+        for k in range(1, order // 2):
+            inner -= 2 * np.cos(2 * k * theta[1:-1]) / (4 * k * k - 1)
+        inner -= np.cos(order * theta[1:-1]) / (order * order - 1)
+    else:
+        weights[0] = weights[-1] = 1. / (order * order)
+        for k in range(1, (order - 1) // 2 + 1):
+            inner -= 2 * np.cos(2 * k * theta[1:-1]) / (4 * k * k - 1)
+    weights[1:-1] = 2 * inner / order
+    return weights
+
+
+def _gauss_hermite_weights(nodes: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Return the Gauss–Hermite weights, multiplied by :math:`e^{t^2}`, at the `nodes`.
+
+    The weight of the node :math:`t_i` is :math:`1 / (n \\, \\psi_{n-1}(t_i)^2)`, where
+    :math:`\\psi_{n-1}` is the normalized Hermite function, computed by the three-term
+    recurrence with rescaling, so that neither :math:`e^{t^2}` nor the Hermite polynomials
+    overflow for large `n`.
+    """
+    nb = len(nodes)
+    # psi_k(t) = exp(log_scale - t^2/2) * current, starting from psi_0 = pi^(-1/4) exp(-t^2/2)
+    previous = np.zeros(nb)
+    current = np.full(nb, np.power(np.pi, -0.25))
+    log_scale = np.zeros(nb)
+    for k in range(nb - 1):
+        previous, current = current, np.sqrt(2. / (k + 1)) * nodes * current - np.sqrt(k / (k + 1.)) * previous
+        magnitude = np.maximum(np.abs(current), np.abs(previous))
+        rescale = magnitude > 1e100
+        previous[rescale] /= magnitude[rescale]
+        current[rescale] /= magnitude[rescale]
+        log_scale[rescale] += np.log(magnitude[rescale])
+    log_abs_psi = np.log(np.abs(current)) + log_scale - 0.5 * nodes * nodes
+    return np.exp(- np.log(nb) - 2 * log_abs_psi)
+
+
+def quadrature_grid(
+        x_lo: float,
+        x_hi: float,
+        nb_x: int,
+        grid: Literal["uniform", "chebyshev", "gauss-hermite"] = 'uniform'
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Return the grid points and the quadrature weights of a discretization of :math:`[x_{lo}, x_{hi}]`.
+
+    Three grids are supported:
+
+    * ``'uniform'``: equally spaced points from :func:`numpy.linspace`, all with the weight
+      :math:`\\Delta x`;
+    * ``'chebyshev'``: Chebyshev–Lobatto points, clustered towards the ends of the interval,
+      with Clenshaw–Curtis weights;
+    * ``'gauss-hermite'``: Gauss–Hermite nodes, linearly scaled so that the outermost nodes are
+      :math:`x_{lo}` and :math:`x_{hi}`, with the weights of the plain integral
+      :math:`\\int f(x)\\,dx` (the Gaussian weight of the Gauss–Hermite rule divided out).
+      This grid converges exponentially for Gaussian and harmonic-oscillator states.
+
+    Args:
+        x_lo (float): Lower bound of :math:`x`.
+        x_hi (float): Upper bound of :math:`x`.
+        nb_x (int): Number of grid points.
+        grid (str, optional): Either ``'uniform'``, ``'chebyshev'``, or ``'gauss-hermite'``.
+            Defaults to ``'uniform'``.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: Grid points in ascending order, and their quadrature weights.
+
+    Raises:
+        ValueError: If `grid` is not supported.
+    """
+    center, half_width = 0.5 * (x_hi + x_lo), 0.5 * (x_hi - x_lo)
+    if grid == 'uniform':
+        xarray = np.linspace(x_lo, x_hi, nb_x)
+        weights = np.full(nb_x, (x_hi - x_lo) / (nb_x - 1.))
+    elif grid == 'chebyshev':
+        nodes = -np.cos(np.pi * np.arange(nb_x) / max(nb_x - 1, 1))
+        xarray = center + half_width * nodes
+        weights = half_width * _clenshaw_curtis_weights(nb_x)
+    elif grid == 'gauss-hermite':
+        nodes, _ = roots_hermite(nb_x)
+        scale = half_width / np.max(nodes)
+        xarray = center + scale * nodes
+        weights = scale * _gauss_hermite_weights(nodes)
+    else:
+        raise ValueError(f"Grid is either 'uniform', 'chebyshev', or 'gauss-hermite', not {grid}.")
+    return xarray, weights
+
+
+def _discretize_rows(
+        fcn: callable,
+        x1: npt.NDArray[np.float64],
+        x2: npt.NDArray[np.float64],
+        tensor: npt.NDArray[np.complex128],
+        rows: slice
+) -> None:
+    """Evaluate `fcn` on the grid points of the given `rows`, and write the values into `tensor`."""
+    if isinstance(fcn, WaveFunction) and fcn.vectorized:
+        grid_x1, grid_x2 = np.meshgrid(x1[rows], x2, indexing='ij')
+        coordinates = np.stack([grid_x1.ravel(), grid_x2.ravel()], axis=1)
+        tensor[rows, :] = np.reshape(fcn(coordinates), grid_x1.shape)
+    else:
+        for i, j in product(range(*rows.indices(len(x1))), range(len(x2))):
+            tensor[i, j] = fcn(np.array([x1[i], x2[j]]))
+
+
+# function evaluated by the workers of a process pool created by discretize_continuous_bipartitesys,
+# sent once to every worker, and inherited without pickling by forked workers
+_tile_worker_fcn = None
+
+
+def _set_tile_worker_fcn(fcn: callable) -> None:
+    """Initialize a worker process with the function to discretize."""
+    global _tile_worker_fcn
+    _tile_worker_fcn = fcn
+
+
+def _discretize_tile(
+        fcn: Optional[callable],
+        storage: tuple[str, str, int],
+        shape: tuple[int, int],
+        dtype: npt.DTypeLike,
+        x1: npt.NDArray[np.float64],
+        x2: npt.NDArray[np.float64],
+        rows: slice
+) -> None:
+    """Discretize one tile of rows in a worker, writing it directly into the shared tensor.
+
+    The tensor is either a block of shared memory or a memory-mapped file, given by
+    `storage` as ``('shm', name, 0)`` or ``('memmap', filename, offset)``, so that only the
+    grid points and the function are sent to the worker, and nothing is sent back.
+    """
+    if fcn is None:
+        fcn = _tile_worker_fcn
+    kind, location, offset = storage
+    if kind == 'memmap':
+        tensor = np.memmap(location, dtype=dtype, mode='r+', offset=offset, shape=shape)
+        _discretize_rows(fcn, x1, x2, tensor, rows)
+        tensor.flush()
+        del tensor
+    else:
+        shared_memory = SharedMemory(name=location)
+        try:
+            tensor = np.ndarray(shape, dtype=dtype, buffer=shared_memory.buf)
+            _discretize_rows(fcn, x1, x2, tensor, rows)
+            del tensor
+        finally:
+            shared_memory.close()
+
+
+def _discretize_tiles_in_parallel(
+        fcn: callable,
+        x1: npt.NDArray[np.float64],
+        x2: npt.NDArray[np.float64],
+        tensor: npt.NDArray[np.complex128],
+        block_size: Optional[int],
+        n_jobs: Optional[int],
+        executor: Optional[Executor],
+        mp_context: Optional[BaseContext]
+) -> None:
+    """Discretize the tiles of rows of the grid on a pool of workers, writing into `tensor`."""
+    if n_jobs is None or n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    if block_size is None:
+        # a few tiles per worker, to balance the load
+        block_size = max(1, ceil(len(x1) / (4 * n_jobs)))
+
+    own_executor = executor is None
+    task_fcn = fcn
+    if own_executor:
+        executor = ProcessPoolExecutor(
+            n_jobs, mp_context=mp_context, initializer=_set_tile_worker_fcn, initargs=(fcn,)
+        )
+        task_fcn = None
+
+    shared_memory = None
+    try:
+        if isinstance(tensor, np.memmap) and tensor.filename is not None:
+            storage = ('memmap', tensor.filename, tensor.offset)
+            tensor.flush()
+        else:
+            shared_memory = SharedMemory(create=True, size=max(tensor.nbytes, 1))
+            storage = ('shm', shared_memory.name, 0)
+        futures = [
+            executor.submit(_discretize_tile, task_fcn, storage, tensor.shape, tensor.dtype, x1, x2, rows)
+            for rows in _row_slices(len(x1), block_size)
+        ]
+        for future in futures:
+            future.result()
+        if shared_memory is not None:
+            tensor[:, :] = np.ndarray(tensor.shape, dtype=tensor.dtype, buffer=shared_memory.buf)
+    finally:
+        if own_executor:
+            executor.shutdown()
+        if shared_memory is not None:
+            shared_memory.close()
+            shared_memory.unlink()
+
+
 def discretize_continuous_bipartitesys(
         fcn: callable,
         x1_lo: float,
@@ -17,7 +228,14 @@ def discretize_continuous_bipartitesys(
         x2_lo: float,
         x2_hi: float,
         nb_x1: int = 100,
-        nb_x2: int = 100
+        nb_x2: int = 100,
+        grid: Literal["uniform", "chebyshev", "gauss-hermite"] = 'uniform',
+        out: Optional[npt.NDArray[np.complex128]] = None,
+        block_size: Optional[int] = None,
+        n_jobs: Optional[int] = 1,
+        executor: Optional[Executor] = None,
+        mp_context: Optional[BaseContext] = None,
+        dtype: npt.DTypeLike = np.complex128
 ) -> npt.NDArray[np.complex128]:
     """Find the discretized representation of the continuous bipartite system.
 
@@ -25,6 +243,27 @@ def discretize_continuous_bipartitesys(
     find the discretized representation of the bipartite system, with
     the first system ranges from `x1_lo` to `x1_hi`, and second from `x2_lo` to `x2_hi`.
 
+    If `fcn` is a vectorized :class:`~pyqentangle.core.wavefunctions.WaveFunction`
+    (see :attr:`~pyqentangle.core.wavefunctions.WaveFunction.vectorized`), the whole grid
+    is passed to it as one ``(nb_x1*nb_x2, 2)`` coordinate block and evaluated in a single
+    call; otherwise, `fcn` is called once per grid point.
+
+    The tensor can be written into a preallocated array `out`, such as a :class:`numpy.memmap`
+    for grids too large for the memory, which is then filled one block of `block_size` rows
+    at a time, so that the coordinates and values of only one block are held in memory.
+
+    With `n_jobs` other than 1, or an `executor`, the blocks of rows are evaluated in parallel
+    as tiles, each written by its worker directly into shared memory, or into `out` if it is a
+    :class:`numpy.memmap`, so that no values are pickled back. The shared memory is copied
+    into the tensor once all the tiles are done, so that the peak memory of an in-memory
+    tensor is twice its size; a :class:`numpy.memmap` `out` avoids the copy.
+
+    A process pool created for `n_jobs` starts its workers with `mp_context`, the default
+    start method of the platform if `None`, and sends `fcn` once to every worker. `fcn` must
+    then be picklable, unless the workers are forked (``multiprocessing.get_context('fork')``),
+    so that, e.g., a lambda function is inherited. With an `executor` of processes, `fcn` is
+    pickled for every tile.
+
     Args:
         fcn (callable): Function with two input variables.
         x1_lo (float): Lower bound of :math:`x_1`.
@@ -33,18 +272,61 @@ def discretize_continuous_bipartitesys(
         x2_hi (float): Upper bound of :math:`x_2`.
         nb_x1 (int, optional): Number of :math:`x_1`. Defaults to 100.
         nb_x2 (int, optional): Number of :math:`x_2`. Defaults to 100.
+        grid (str, optional): Grid points, either `uniform`, `chebyshev`, or `gauss-hermite`
+            (see :func:`quadrature_grid`). Defaults to `uniform`.
+        out (numpy.ndarray, optional): Array of shape ``(nb_x1, nb_x2)`` into which the tensor is
+            written. If `None`, a new complex array is allocated. Defaults to `None`.
+        block_size (int, optional): Number of rows of the tensor evaluated at a time by a vectorized
+            `fcn`, and of the tiles evaluated in parallel. If `None`, the whole grid is evaluated at
+            once, or, in parallel, split into four tiles per worker. Defaults to `None`.
+        n_jobs (int, optional): Number of worker processes. `None` or a negative value uses all the
+            CPUs. Defaults to 1, which evaluates the grid in the calling process.
+        executor (concurrent.futures.Executor, optional): Executor on which the tiles are evaluated,
+            instead of a new process pool. Defaults to `None`.
+        mp_context (multiprocessing.context.BaseContext, optional): Context starting the workers
+            of the process pool created for `n_jobs`. Defaults to `None`, for the default start
+            method of the platform.
+        dtype (numpy.dtype, optional): Data type of the tensor allocated if `out` is `None`, e.g.,
+            `numpy.float64` for a real-valued `fcn`, or `numpy.complex64` or `numpy.float32` for
+            single precision. Defaults to `numpy.complex128`.
 
     Returns:
-        numpy.ndarray: Discretized tensor representation of the continuous bipartite system.
+        numpy.ndarray: Discretized tensor representation of the continuous bipartite system, which
+        is `out` if given.
+
+    Raises:
+        ValueError: If the shape of `out` is not ``(nb_x1, nb_x2)``, or if `n_jobs` is 0.
     """
-    x1 = np.linspace(x1_lo, x1_hi, nb_x1)
-    x2 = np.linspace(x2_lo, x2_hi, nb_x2)
-    tensor = np.zeros((len(x1), len(x2)), dtype=np.complex128)
-    for i, j in product(*map(range, tensor.shape)):
-        tensor[i, j] = fcn(np.array([x1[i], x2[j]]))
+    if n_jobs == 0:
+        raise ValueError("The number of worker processes must not be 0.")
+    x1, _ = quadrature_grid(x1_lo, x1_hi, nb_x1, grid=grid)
+    x2, _ = quadrature_grid(x2_lo, x2_hi, nb_x2, grid=grid)
+    if out is None:
+        tensor = np.empty((len(x1), len(x2)), dtype=dtype)
+    elif out.shape != (len(x1), len(x2)):
+        raise ValueError(f"Expected an output array of shape {(len(x1), len(x2))}, not {out.shape}.")
+    else:
+        tensor = out
+
+    if n_jobs == 1 and executor is None:
+        for rows in _row_slices(len(x1), block_size):
+            _discretize_rows(fcn, x1, x2, tensor, rows)
+    else:
+        _discretize_tiles_in_parallel(fcn, x1, x2, tensor, block_size, n_jobs, executor, mp_context)
     return tensor
 
 
+def _normalize_modes(modes: npt.NDArray[np.inexact], sqrt_weights: npt.NDArray[np.float64]) -> npt.NDArray[np.inexact]:
+    """Normalize the columns of `modes` and divide out the square roots of the quadrature weights.
+
+    The zero columns returned by the ``'gram'`` approach for the coefficients it cannot resolve
+    are left as zeros instead of being divided by their zero norm.
+    """
+    norms = np.linalg.norm(modes, axis=0)
+    normalized = np.divide(modes, norms, out=np.zeros_like(modes), where=norms > 0)
+    return normalized / sqrt_weights[:, None]
+
+
 def continuous_schmidt_decomposition(
         fcn: callable,
         x1_lo: float,
@@ -54,7 +336,17 @@ def continuous_schmidt_decomposition(
         nb_x1: int = 100,
         nb_x2: int = 100,
         keep: Optional[int] = None,
-        approach: Literal["tensornetwork", "numpy"] = 'tensornetwork'
+        approach: Literal["tensornetwork", "numpy", "randomized", "gram"] = 'tensornetwork',
+        oversampling: int = 10,
+        nb_power_iterations: int = 2,
+        interpolation: Optional[Literal["linear", "cubic", "sinc", "barycentric"]] = None,
+        grid: Literal["uniform", "chebyshev", "gauss-hermite"] = 'uniform',
+        out: Optional[npt.NDArray[np.complex128]] = None,
+        block_size: Optional[int] = None,
+        n_jobs: Optional[int] = 1,
+        executor: Optional[Executor] = None,
+        mp_context: Optional[BaseContext] = None,
+        dtype: npt.DTypeLike = np.complex128
 ) -> list[tuple[float, WaveFunction, WaveFunction]]:
     """Compute the Schmidt decomposition of a continuous bipartite quantum systems.
 
@@ -63,6 +355,16 @@ def continuous_schmidt_decomposition(
     the lambda function of the eigenmode in the first subsystem, and the lambda function
     of the eigenmode of the second subsystem.
 
+    The function is sampled on the grid points :math:`x_{1,i}`, :math:`x_{2,j}` given by
+    :func:`quadrature_grid`, and the singular value decomposition is applied to the matrix
+    :math:`\\sqrt{w_{1,i}} \\, \\psi(x_{1,i}, x_{2,j}) \\sqrt{w_{2,j}}` weighted by the quadrature
+    weights, whose singular vectors are then divided by the square roots of the weights to
+    give the eigenmodes on the grid.
+
+    For grids too large for the memory, the tensor can be stored in a preallocated array
+    `out`, such as a :class:`numpy.memmap`. With `block_size`, it is then discretized,
+    weighted, and, with ``approach='randomized'``, decomposed one block of rows at a time.
+
     Args:
         fcn (callable): Function with two input variables.
         x1_lo (float): Lower bound of :math:`x_1`.
@@ -73,40 +375,87 @@ def continuous_schmidt_decomposition(
         nb_x2 (int, optional): Number of :math:`x_2`. Defaults to 100.
         keep (int, optional): The number of Schmidt modes with the largest coefficients to return; 
             the smaller of `nb_x1` and `nb_x2` will be returned if `None` is given. Defaults to `None`.
-        approach (str, optional): Using `numpy` or `tensornetwork` in computation. Defaults to `tensornetwork`.
+        approach (str, optional): Using `numpy`, `tensornetwork`, `randomized`, or `gram` in computation.
+            `randomized` computes only the `keep` leading modes with a randomized SVD, and `gram` from
+            the reduced density matrix of the smaller subsystem. Defaults to `tensornetwork`.
+        oversampling (int, optional): Oversampling of the random sketch; only used when
+            `approach` is `randomized`. Defaults to 10.
+        nb_power_iterations (int, optional): Number of power iterations; only used when
+            `approach` is `randomized`. Defaults to 2.
+        interpolation (str, optional): Kind of interpolation of the eigenmodes between the grid
+            points, either `linear`, `cubic` (cubic spline), `sinc` (band-limited, uniform grid
+            only), or `barycentric` (polynomial, for the Chebyshev grid). The higher-order kinds
+            give smooth and accurate modes from much smaller grids. If `None`, `linear` is used
+            for the uniform grid, `barycentric` for the Chebyshev grid, and `cubic` for the
+            Gauss–Hermite grid. Defaults to `None`.
+        grid (str, optional): Grid points, either `uniform`, `chebyshev`, or `gauss-hermite`
+            (see :func:`quadrature_grid`). The non-uniform grids reach a given precision with far
+            fewer points for smooth states. Defaults to `uniform`.
+        out (numpy.ndarray, optional): Array of shape ``(nb_x1, nb_x2)`` in which the weighted
+            tensor is stored (see :func:`discretize_continuous_bipartitesys`). Defaults to `None`.
+        block_size (int, optional): Number of rows of the tensor processed at a time. Only the
+            `randomized` approach decomposes the tensor by blocks; the other approaches load it
+            whole. Defaults to `None`.
+        n_jobs (int, optional): Number of worker processes discretizing the state (see
+            :func:`discretize_continuous_bipartitesys`). Defaults to 1.
+        executor (concurrent.futures.Executor, optional): Executor on which the state is discretized,
+            instead of a new process pool. Defaults to `None`.
+        mp_context (multiprocessing.context.BaseContext, optional): Context starting the worker
+            processes (see :func:`discretize_continuous_bipartitesys`). Defaults to `None`.
+        dtype (numpy.dtype, optional): Data type of the discretized state and of its SVD: a real
+            type such as `numpy.float64` for a real-valued `fcn` gives a faster real SVD and real
+            eigenmodes, and `numpy.complex64` or `numpy.float32` halves the memory. The eigenmodes
+            are interpolated in double precision in any case. Ignored if `out` is given. Defaults
+            to `numpy.complex128`.
 
     Returns:
         list[tuple[float, WaveFunction, WaveFunction]]: List of tuples, where each contains a Schmidt
         coefficient, the interpolating wavefunction of the eigenmode of the first subsystem, and the
-        interpolating wavefunction of the eigenmode of the second subsystem.
+        interpolating wavefunction of the eigenmode of the second subsystem. With the `gram` approach,
+        the eigenmodes of the larger subsystem for vanishing coefficients are zero.
 
     Raises:
-        ValueError: If approach is not 'numpy' or 'tensornetwork'.
+        ValueError: If approach is not 'numpy', 'tensornetwork', 'randomized', or 'gram', if interpolation
+            is not 'linear', 'cubic', 'sinc', or 'barycentric', or if grid is not 'uniform',
+            'chebyshev', or 'gauss-hermite', if the shape of `out` is not ``(nb_x1, nb_x2)``, or if
+            `n_jobs` is 0.
     """
-    tensor = discretize_continuous_bipartitesys(fcn, x1_lo, x1_hi, x2_lo, x2_hi, nb_x1=nb_x1, nb_x2=nb_x2)
-    decomposition = schmidt_decomposition(tensor, approach=approach)
+    if interpolation is None:
+        interpolation = {'uniform': 'linear', 'chebyshev': 'barycentric', 'gauss-hermite': 'cubic'}.get(grid)
 
-    if keep is None:
-        keep = min(nb_x1, nb_x2)
-    else:
-        keep = len(decomposition) if keep > len(decomposition) else keep
-
-    x1array = np.linspace(x1_lo, x1_hi, nb_x1)
-    x2array = np.linspace(x2_lo, x2_hi, nb_x2)
-    dx1 = (x1_hi - x1_lo) / (nb_x1 - 1.)
-    dx2 = (x2_hi - x2_lo) / (nb_x2 - 1.)
-
-    renormalized_decomposition = []
-    sum_sq_eigvals = np.sum(list(map(lambda dec: dec[0]*dec[0], decomposition)))
-    for i in range(keep):
-        schmidt_weight, unnorm_modeA, unnorm_modeB = decomposition[i]
-        normA = np.linalg.norm(unnorm_modeA) * np.sqrt(dx1)
-        normB = np.linalg.norm(unnorm_modeB) * np.sqrt(dx2)
-        renormalized_decomposition.append(
-            (schmidt_weight / np.sqrt(sum_sq_eigvals),
-             InterpolatingWaveFunction(x1array, unnorm_modeA / normA),
-             InterpolatingWaveFunction(x2array, unnorm_modeB / normB)
-             )
-        )
+    x1array, weights1 = quadrature_grid(x1_lo, x1_hi, nb_x1, grid=grid)
+    x2array, weights2 = quadrature_grid(x2_lo, x2_hi, nb_x2, grid=grid)
+    sqrt_weights1, sqrt_weights2 = np.sqrt(weights1), np.sqrt(weights2)
+
+    tensor = discretize_continuous_bipartitesys(
+        fcn, x1_lo, x1_hi, x2_lo, x2_hi, nb_x1=nb_x1, nb_x2=nb_x2, grid=grid, out=out, block_size=block_size,
+        n_jobs=n_jobs, executor=executor, mp_context=mp_context, dtype=dtype
+    )
+    # sum of all squared singular values, available even if only the leading modes are computed
+    sum_sq_eigvals = 0.
+    for rows in _row_slices(tensor.shape[0], block_size):
+        tensor[rows] *= sqrt_weights1[rows, None] * sqrt_weights2[None, :]
+        sum_sq_eigvals += np.sum(np.square(np.abs(tensor[rows])))
+
+    decomposition = schmidt_decomposition(
+        tensor,
+        approach=approach,
+        keep=keep,
+        oversampling=oversampling,
+        nb_power_iterations=nb_power_iterations,
+        block_size=block_size
+    )
+
+    schmidt_weights = decomposition.schmidt_coefficients / np.sqrt(sum_sq_eigvals)
+    modesA = _normalize_modes(decomposition.modes1, sqrt_weights1)
+    modesB = _normalize_modes(decomposition.modes2, sqrt_weights2)
+
+    renormalized_decomposition = [
+        (schmidt_weights[i],
+         InterpolatingWaveFunction(x1array, modesA[:, i], kind=interpolation),
+         InterpolatingWaveFunction(x2array, modesB[:, i], kind=interpolation)
+         )
+        for i in range(len(decomposition))
+    ]
 
     return renormalized_decomposition
@@ -1,4 +1,6 @@
 
+from typing import Union
+
 import numba as nb
 import numpy as np
 import numpy.typing as npt
@@ -7,39 +9,139 @@ from deprecation import deprecated
 from .exceptions import UnequalLengthException, OutOfRangeException
 
 
-@nb.njit(nb.complex128(nb.float64[:], nb.complex128[:], nb.float64))
+@nb.njit([
+    nb.complex128(nb.float64[:], nb.complex128[:], nb.float64),
+    nb.float64(nb.float64[:], nb.float64[:], nb.float64)
+], cache=True)
 def interpolate(
         xarray: npt.NDArray[np.float64],
-        yarray: npt.NDArray[np.complex128],
+        yarray: Union[npt.NDArray[np.complex128], npt.NDArray[np.float64]],
         x: float
-) -> np.complex128:
-    """Perform linear interpolation to evaluate a complex-valued function at a given point.
+) -> Union[np.complex128, np.float64]:
+    """Perform linear interpolation to evaluate a complex- or real-valued function at a given point.
 
     Uses a binary search to locate the interval in `xarray` that contains `x`,
     then applies linear interpolation between the two surrounding `yarray` values.
-    This function is JIT-compiled with Numba for performance.
+    This function is JIT-compiled with Numba for performance, for complex128 and float64 values.
 
     Args:
         xarray (numpy.ndarray): Sorted array of independent variable values (grid points).
-        yarray (numpy.ndarray): Array of complex dependent variable values at the grid points.
+        yarray (numpy.ndarray): Array of complex or real dependent variable values at the grid points.
         x (float): The point at which to interpolate.
 
     Returns:
-        complex: Interpolated complex value at `x`.
+        complex or float: Interpolated value at `x`, of the type of `yarray`.
     """
-    left = 0
-    right = len(xarray) - 1
-    idx = right // 2
-    while (idx != 0 and idx != len(xarray) - 1) and (not (x >= xarray[idx] and x < xarray[idx + 1])):
-        if x >= xarray[idx + 1]:
-            left = idx + 1
-        elif x < xarray[idx]:
-            right = idx - 1
-        idx = (left + right) // 2
-
+    idx = min(max(np.searchsorted(xarray, x, side='right') - 1, 0), len(xarray) - 2)
     return yarray[idx] + (yarray[idx + 1] - yarray[idx]) / (xarray[idx + 1] - xarray[idx]) * (x - xarray[idx])
 
 
+@nb.njit([
+    nb.complex128[:](nb.float64[:], nb.complex128[:], nb.float64[:]),
+    nb.float64[:](nb.float64[:], nb.float64[:], nb.float64[:])
+], cache=True)
+def interpolate_array(
+        xarray: npt.NDArray[np.float64],
+        yarray: Union[npt.NDArray[np.complex128], npt.NDArray[np.float64]],
+        xs: npt.NDArray[np.float64]
+) -> Union[npt.NDArray[np.complex128], npt.NDArray[np.float64]]:
+    """Perform linear interpolation to evaluate a complex- or real-valued function at many points.
+
+    Batched counterpart of :func:`interpolate`: the intervals containing all the points in
+    `xs` are located with one call of :func:`numpy.searchsorted`, and the linear
+    interpolation is evaluated in a single compiled loop. The points are assumed to lie
+    within the range of `xarray`; no range check is performed. This function is JIT-compiled
+    with Numba for performance, for complex128 and float64 values.
+
+    Args:
+        xarray (numpy.ndarray): Sorted array of independent variable values (grid points).
+        yarray (numpy.ndarray): Array of complex or real dependent variable values at the grid points.
+        xs (numpy.ndarray): 1-D array of points at which to interpolate.
+
+    Returns:
+        numpy.ndarray: Interpolated values at `xs`, of the type of `yarray`.
+    """
+    indices = np.searchsorted(xarray, xs, side='right') - 1
+    values = np.empty(len(xs), dtype=yarray.dtype)
+    for i in range(len(xs)):
+        idx = min(max(indices[i], 0), len(xarray) - 2)
+        values[i] = yarray[idx] + (yarray[idx + 1] - yarray[idx]) / (xarray[idx + 1] - xarray[idx]) * (xs[i] - xarray[idx])
+    return values
+
+
+@nb.njit([
+    nb.complex128[:](nb.float64, nb.float64, nb.complex128[:], nb.float64[:]),
+    nb.float64[:](nb.float64, nb.float64, nb.float64[:], nb.float64[:])
+], cache=True)
+def interpolate_uniform_array(
+        x0: float,
+        dx: float,
+        yarray: Union[npt.NDArray[np.complex128], npt.NDArray[np.float64]],
+        xs: npt.NDArray[np.float64]
+) -> Union[npt.NDArray[np.complex128], npt.NDArray[np.float64]]:
+    """Perform linear interpolation on a uniform grid to evaluate a complex- or real-valued function at many points.
+
+    The grid points are :math:`x_0 + k\\,\\Delta x` for :math:`k = 0, \\ldots, n-1`, so that the
+    interval containing a point is found arithmetically in :math:`O(1)` instead of by a
+    search. The points are assumed to lie within the grid; no range check is performed.
+    This function is JIT-compiled with Numba for performance, for complex128 and float64 values.
+
+    Args:
+        x0 (float): First grid point.
+        dx (float): Grid spacing.
+        yarray (numpy.ndarray): Array of complex or real dependent variable values at the grid points.
+        xs (numpy.ndarray): 1-D array of points at which to interpolate.
+
+    Returns:
+        numpy.ndarray: Interpolated values at `xs`, of the type of `yarray`.
+    """
+    maxidx = len(yarray) - 2
+    values = np.empty(len(xs), dtype=yarray.dtype)
+    for i in range(len(xs)):
+        position = (xs[i] - x0) / dx
+        idx = min(max(int(np.floor(position)), 0), maxidx)
+        values[i] = yarray[idx] + (yarray[idx + 1] - yarray[idx]) * (position - idx)
+    return values
+
+
+def sinc_interpolate_array(
+        x0: float,
+        dx: float,
+        yarray: Union[npt.NDArray[np.complex128], npt.NDArray[np.float64]],
+        xs: npt.NDArray[np.float64],
+        chunk_size: int = 1024
+) -> Union[npt.NDArray[np.complex128], npt.NDArray[np.float64]]:
+    """Perform band-limited (Whittaker–Shannon) interpolation on a uniform grid.
+
+    Evaluates
+
+    .. math::
+
+        y(x) = \\sum_k y_k \\, \\mathrm{sinc}\\left(\\frac{x - x_0 - k\\,\\Delta x}{\\Delta x}\\right),
+
+    which is exact for functions band-limited to the Nyquist frequency of the grid and
+    converges spectrally for smooth functions that decay at the edges of the grid, such as
+    bound-state wavefunctions. The points are processed in chunks to bound the memory used
+    by the ``(chunk_size, n)`` sinc matrix.
+
+    Args:
+        x0 (float): First grid point.
+        dx (float): Grid spacing.
+        yarray (numpy.ndarray): Array of complex or real dependent variable values at the grid points.
+        xs (numpy.ndarray): 1-D array of points at which to interpolate.
+        chunk_size (int, optional): Number of points evaluated per matrix product. Defaults to 1024.
+
+    Returns:
+        numpy.ndarray: Interpolated values at `xs`, of the type of `yarray`.
+    """
+    positions = np.arange(len(yarray))
+    values = np.empty(len(xs), dtype=yarray.dtype)
+    for start in range(0, len(xs), chunk_size):
+        chunk = xs[start:start+chunk_size]
+        values[start:start+chunk_size] = np.sinc((chunk[:, None] - x0) / dx - positions[None, :]) @ yarray
+    return values
+
+
 def numerical_continuous_interpolation(
         xarray: npt.NDArray[np.float64],
         yarray: npt.NDArray[np.complex128],
@@ -0,0 +1,215 @@
+
+from collections.abc import Iterable
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+from scipy.linalg import eigvalsh
+
+from .tncompute import _hermitian_outer_product
+from ..schemas.schemas import MatrixProductState
+
+
+def _truncation_rank(
+        singular_values: npt.NDArray[np.floating],
+        max_rank: Optional[int],
+        max_discarded_weight: Optional[float]
+) -> int:
+    """Return the number of singular values kept under the rank and discarded-weight limits."""
+    rank = len(singular_values)
+    if max_discarded_weight is not None:
+        squares = np.square(singular_values)
+        # tails[i] is the weight discarded when only the first i values are kept
+        tails = np.cumsum(squares[::-1])[::-1]
+        rank = max(int(np.count_nonzero(tails > max_discarded_weight * tails[0])), 1)
+    if max_rank is not None:
+        rank = min(rank, max_rank)
+    return rank
+
+
+def mps_decomposition(
+        multipartitepurestate_tensor: npt.NDArray[np.complex128],
+        max_rank: Optional[int] = None,
+        max_discarded_weight: Optional[float] = None,
+        dtype: Optional[npt.DTypeLike] = None
+) -> MatrixProductState:
+    """Decompose a discrete multipartite pure state into a matrix product state.
+
+    The state of :math:`N` parties is decomposed by one left-to-right sweep of :math:`N - 1`
+    sequential SVDs (Vidal, 2003; Oseledets, 2011): at the ``k``-th step, the remainder of the
+    state, of shape ``(r_{k-1} d_k, d_{k+1} \\cdots d_{N-1})``, is split into a left-canonical
+    site tensor and the product of the singular values with the right singular vectors, which
+    becomes the remainder of the next step.  As all the site tensors on the left are
+    isometries, the singular values of the ``k``-th step are the Schmidt coefficients of the
+    bipartition ``(0..k | k+1..N-1)``, so that all the entanglement spectra are obtained from
+    SVDs of matrices that shrink along the sweep, instead of :math:`N - 1` full SVDs of
+    reshapings of the whole tensor.
+
+    The bond dimensions can be truncated, by rank with `max_rank`, or by keeping, at every
+    cut, the fewest Schmidt coefficients whose discarded squares sum to no more than a
+    fraction `max_discarded_weight` of the squared norm.  After a truncation, the spectra of
+    the later cuts are those of the truncated state.
+
+    Args:
+        multipartitepurestate_tensor (numpy.ndarray): N-D array of shape ``(d_0, ..., d_{N-1})``,
+            where element ``[i_0, ..., i_{N-1}]`` is the coefficient of the basis ket
+            :math:`|i_0 \\ldots i_{N-1}\\rangle`.
+        max_rank (int, optional): Maximum bond dimension. Defaults to ``None``, for no limit.
+        max_discarded_weight (float, optional): Maximum fraction of the squared norm discarded
+            at every cut. Defaults to ``None``, for no truncation.
+        dtype (numpy.dtype, optional): Data type in which the SVDs are computed, e.g.,
+            ``numpy.complex64``. Defaults to ``None``, which keeps the data type of the tensor.
+
+    Returns:
+        MatrixProductState: Site tensors, entanglement spectra of the :math:`N - 1` cuts between
+        consecutive parties, and the weights discarded at the cuts.
+
+    Raises:
+        ValueError: If the tensor has fewer than two dimensions, or if `max_rank` is not positive.
+    """
+    if multipartitepurestate_tensor.ndim < 2:
+        raise ValueError(f"Expected a tensor of at least two parties, not of shape {multipartitepurestate_tensor.shape}.")
+    if max_rank is not None and max_rank < 1:
+        raise ValueError(f"The maximum rank must be positive, not {max_rank}.")
+    if dtype is not None:
+        multipartitepurestate_tensor = np.asarray(multipartitepurestate_tensor, dtype=dtype)
+
+    dims = multipartitepurestate_tensor.shape
+    tensors = []
+    spectra = []
+    discarded_weights = np.zeros(len(dims) - 1)
+
+    remainder = multipartitepurestate_tensor.reshape(dims[0], -1)
+    bond_dim = 1
+    for k, dim in enumerate(dims[:-1]):
+        vecs1, diags, vecs2_h = np.linalg.svd(remainder, full_matrices=False)
+        rank = _truncation_rank(diags, max_rank, max_discarded_weight)
+        norm_sq = np.sum(np.square(diags))
+        if rank < len(diags) and norm_sq > 0:
+            discarded_weights[k] = np.sum(np.square(diags[rank:])) / norm_sq
+        vecs1, diags, vecs2_h = vecs1[:, :rank], diags[:rank], vecs2_h[:rank]
+
+        tensors.append(vecs1.reshape(bond_dim, dim, rank))
+        spectra.append(diags)
+        bond_dim = rank
+        remainder = (diags[:, None] * vecs2_h).reshape(rank * dims[k + 1], -1)
+
+    tensors.append(remainder.reshape(bond_dim, dims[-1], 1))
+
+    return MatrixProductState(tensors, spectra, discarded_weights)
+
+
+def _canonical_cut(subsystem: Iterable[int], dims: tuple[int, ...]) -> tuple[int, ...]:
+    """Return the side of a bipartition with the smaller dimension, as a sorted tuple of parties.
+
+    A bipartition and its complement have the same Schmidt coefficients, so that both are
+    represented by the same side.
+
+    Raises:
+        ValueError: If a party is out of range or repeated.
+    """
+    parties = tuple(sorted(subsystem))
+    if len(set(parties)) != len(parties) or any(party < 0 or party >= len(dims) for party in parties):
+        raise ValueError(f"Invalid subsystem {subsystem} of a state of {len(dims)} parties.")
+    complement = tuple(party for party in range(len(dims)) if party not in parties)
+    dim = np.prod([dims[party] for party in parties], dtype=np.int64)
+    complement_dim = np.prod([dims[party] for party in complement], dtype=np.int64)
+    if (dim, len(parties), parties) <= (complement_dim, len(complement), complement):
+        return parties
+    return complement
+
+
+def _partial_trace(
+        densitymatrix: npt.NDArray[np.inexact],
+        parties: tuple[int, ...],
+        kept: tuple[int, ...],
+        dims: tuple[int, ...]
+) -> npt.NDArray[np.inexact]:
+    """Trace the reduced density matrix of `parties` down to the parties in `kept`, a subset of them."""
+    nb_parties = len(parties)
+    tensor = densitymatrix.reshape([dims[party] for party in parties] * 2)
+    ket_labels = list(range(nb_parties))
+    bra_labels = [nb_parties + i if party in kept else i for i, party in enumerate(parties)]
+    out_labels = [i for i, party in enumerate(parties) if party in kept]
+    out_labels += [nb_parties + i for i in out_labels]
+    dim = np.prod([dims[party] for party in kept], dtype=np.int64)
+    return np.einsum(tensor, ket_labels + bra_labels, out_labels).reshape(dim, dim)
+
+
+def bipartition_schmidt_coefficients(
+        multipartitepurestate_tensor: npt.NDArray[np.complex128],
+        subsystems: Iterable[Iterable[int]]
+) -> list[npt.NDArray[np.floating]]:
+    """Compute the Schmidt coefficients of many bipartitions of a discrete multipartite pure state.
+
+    Each subsystem, given as a set of parties, defines the bipartition between these parties
+    and the others.  The work is shared among the bipartitions:
+
+    * a bipartition and its complement have the same Schmidt coefficients, so that every
+      bipartition is handled once, through its side of smaller dimension;
+    * the bipartitions between the first parties and the last ones, as in a scan of all the
+      cuts of a chain, are all given by one sweep of :func:`mps_decomposition`;
+    * for the other bipartitions, the reduced density matrix of the smaller side is computed
+      with one BLAS rank-k update of the permuted state, unless it can be obtained by a
+      partial trace of the already computed, and much smaller, reduced density matrix of a
+      larger subsystem that contains it.
+
+    The Schmidt coefficients are the square roots of the eigenvalues of the reduced density
+    matrices.
+
+    Args:
+        multipartitepurestate_tensor (numpy.ndarray): N-D array of shape ``(d_0, ..., d_{N-1})``,
+            where element ``[i_0, ..., i_{N-1}]`` is the coefficient of the basis ket
+            :math:`|i_0 \\ldots i_{N-1}\\rangle`.
+        subsystems (Iterable[Iterable[int]]): Subsystems, each an iterable of the indices of
+            its parties.
+
+    Returns:
+        list[numpy.ndarray]: The Schmidt coefficients, in descending order, of every bipartition,
+        in the order of `subsystems`.
+
+    Raises:
+        ValueError: If a subsystem has a party out of range or repeated.
+    """
+    tensor = multipartitepurestate_tensor
+    dims = tensor.shape
+    nb_parties = len(dims)
+    cuts = [_canonical_cut(subsystem, dims) for subsystem in subsystems]
+    unique_cuts = list(dict.fromkeys(cuts))
+
+    spectra = {}
+    for cut in unique_cuts:
+        if len(cut) == 0:
+            spectra[cut] = np.array([np.linalg.norm(tensor)])
+
+    # the cuts after the k-th party for all k, from a single sweep
+    chain_cuts = {
+        cut: len(cut) - 1 if cut[0] == 0 else cut[0] - 1
+        for cut in unique_cuts
+        if len(cut) > 0 and cut[-1] - cut[0] == len(cut) - 1 and (cut[0] == 0 or cut[-1] == nb_parties - 1)
+    }
+    if len(chain_cuts) > 0:
+        mps = mps_decomposition(tensor)
+        for cut, k in chain_cuts.items():
+            spectra[cut] = mps.schmidt_coefficients[k]
+
+    # the other cuts, the largest first, so that their reduced density matrices can be traced down
+    remaining = sorted((cut for cut in unique_cuts if cut not in spectra), key=len, reverse=True)
+    densitymatrices = {}
+    for i, cut in enumerate(remaining):
+        containing = [parties for parties in densitymatrices if set(cut) <= set(parties)]
+        if len(containing) > 0:
+            parties = min(containing, key=lambda parties: densitymatrices[parties].shape[0])
+            densitymatrix = _partial_trace(densitymatrices[parties], parties, cut, dims)
+        else:
+            rest = tuple(party for party in range(nb_parties) if party not in cut)
+            dim = np.prod([dims[party] for party in cut], dtype=np.int64)
+            densitymatrix = _hermitian_outer_product(np.transpose(tensor, cut + rest).reshape(dim, -1))
+        # kept only if a smaller cut inside it remains, otherwise overwritten by the eigensolver
+        reused = any(set(other) < set(cut) for other in remaining[i+1:])
+        if reused:
+            densitymatrices[cut] = densitymatrix
+        eigenvalues = eigvalsh(densitymatrix, overwrite_a=not reused, check_finite=False)
+        spectra[cut] = np.sqrt(np.clip(eigenvalues[::-1], 0., None))
+
+    return [spectra[cut] for cut in cuts]
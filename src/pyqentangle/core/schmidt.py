@@ -1,14 +1,26 @@
 
-from typing import Literal
+from typing import Iterator, Literal, Optional
 
 import numpy as np
 import numpy.typing as npt
-import tensornetwork as tn
+from scipy.linalg import eigh, eigvalsh
+
+from .tncompute import _hermitian_outer_product
+from ..schemas.schemas import SchmidtDecomposition
+
+
+def _row_slices(nb_rows: int, block_size: Optional[int]) -> Iterator[slice]:
+    """Yield the slices of consecutive blocks of `block_size` rows, or of all rows if `block_size` is ``None``."""
+    if block_size is None:
+        yield slice(0, nb_rows)
+        return
+    for start in range(0, nb_rows, block_size):
+        yield slice(start, min(start + block_size, nb_rows))
 
 
 def schmidt_decomposition_numpy(
         bipartitepurestate_tensor: npt.NDArray[np.complex128]
-) -> list[tuple[float, npt.NDArray[np.complex128], npt.NDArray[np.complex128]]]:
+) -> SchmidtDecomposition:
     """Compute the Schmidt decomposition of a discrete bipartite pure state using NumPy SVD.
 
     Called internally by :func:`schmidt_decomposition` when ``approach='numpy'``.
@@ -23,31 +35,19 @@ def schmidt_decomposition_numpy(
             is the coefficient of the basis ket :math:`|ij\\rangle`.
 
     Returns:
-        list[tuple[float, numpy.ndarray, numpy.ndarray]]:
-            A list of ``min(d1, d2)`` tuples ``(lambda_k, u_k, v_k)`` sorted by
-            descending Schmidt coefficient, where:
-
-            * ``lambda_k`` – real Schmidt coefficient (singular value).
-            * ``u_k`` – complex 1-D array; eigenmode of the first subsystem.
-            * ``v_k`` – complex 1-D array; eigenmode of the second subsystem.
+        SchmidtDecomposition: The ``min(d1, d2)`` Schmidt coefficients (singular values) sorted
+        in descending order, together with the eigenmodes of the first and second subsystems
+        stored as the columns of two matrices.
     """
-    state_dims = bipartitepurestate_tensor.shape
-    mindim = np.min(state_dims)
-
-    vecs1, diags, vecs2_h = np.linalg.svd(bipartitepurestate_tensor)
-    vecs2 = vecs2_h.transpose()
-
-    decomposition = [(diags[k], vecs1[:, k], vecs2[:, k])
-                     for k in range(mindim)]
+    # numpy returns the singular values in descending order
+    vecs1, diags, vecs2_h = np.linalg.svd(bipartitepurestate_tensor, full_matrices=False)
 
-    decomposition = sorted(decomposition, key=lambda dec: dec[0], reverse=True)
-
-    return decomposition
+    return SchmidtDecomposition(diags, vecs1, vecs2_h.transpose())
 
 
 def schmidt_decomposition_tensornetwork(
         bipartitepurestate_tensor: npt.NDArray[np.complex128]
-) -> list[tuple[float, npt.NDArray[np.complex128], npt.NDArray[np.complex128]]]:
+) -> SchmidtDecomposition:
     """Compute the Schmidt decomposition of a discrete bipartite pure state using TensorNetwork SVD.
 
     Called internally by :func:`schmidt_decomposition` when ``approach='tensornetwork'`` (the
@@ -61,32 +61,291 @@ def schmidt_decomposition_tensornetwork(
             is the coefficient of the basis ket :math:`|ij\\rangle`.
 
     Returns:
-        list[tuple[float, numpy.ndarray, numpy.ndarray]]:
-            A list of ``min(d1, d2)`` tuples ``(lambda_k, u_k, v_k)`` sorted by
-            descending Schmidt coefficient, where:
+        SchmidtDecomposition: The ``min(d1, d2)`` Schmidt coefficients (singular values) sorted
+        in descending order, together with the eigenmodes of the first and second subsystems
+        stored as the columns of two matrices.
+    """
+    # imported on demand, as tensornetwork and its backends are slow to import
+    import tensornetwork as tn
+
+    node = tn.Node(bipartitepurestate_tensor)
+    vecs1, diags, vecs2_h, _ = tn.split_node_full_svd(node, [node[0]], [node[1]])
+
+    schmidt_coefs = np.real(np.diagonal(diags.tensor))
+    vecs1, vecs2 = vecs1.tensor, vecs2_h.tensor.transpose()
+    if np.any(np.diff(schmidt_coefs) > 0):
+        order = np.argsort(-schmidt_coefs, kind='stable')
+        schmidt_coefs, vecs1, vecs2 = schmidt_coefs[order], vecs1[:, order], vecs2[:, order]
+
+    return SchmidtDecomposition(schmidt_coefs, vecs1, vecs2)
 
-            * ``lambda_k`` – real Schmidt coefficient (singular value).
-            * ``u_k`` – complex 1-D array; eigenmode of the first subsystem.
-            * ``v_k`` – complex 1-D array; eigenmode of the second subsystem.
+
+def schmidt_decomposition_randomized(
+        bipartitepurestate_tensor: npt.NDArray[np.complex128],
+        keep: int,
+        oversampling: int = 10,
+        nb_power_iterations: int = 2,
+        random_state: Optional[int] = None,
+        block_size: Optional[int] = None
+) -> SchmidtDecomposition:
+    """Compute the leading Schmidt modes of a discrete bipartite pure state using randomized SVD.
+
+    Called internally by :func:`schmidt_decomposition` when ``approach='randomized'``.
+
+    Only the ``keep`` largest Schmidt coefficients and their eigenmodes are computed.  The
+    range of the coefficient matrix :math:`A` is captured by a random sketch
+    :math:`Y = (AA^\\dagger)^q A\\Omega` with ``keep + oversampling`` columns, and the SVD of
+    the small projected matrix :math:`Q^\\dagger A` gives the leading singular triplets
+    (Halko, Martinsson and Tropp, 2011).  The cost is :math:`O(d_1 d_2 k)` instead of the
+    :math:`O(d_1 d_2 \\min(d_1, d_2))` of a full SVD.
+
+    The coefficient matrix is only accessed through products with thin matrices, which can
+    be accumulated over blocks of ``block_size`` rows, so that it can be an out-of-core
+    array such as a :class:`numpy.memmap` that is read one tile at a time, with
+    :math:`O((d_1 + d_2) k)` memory besides the tile.
+
+    Args:
+        bipartitepurestate_tensor (numpy.ndarray): 2-D complex array of shape ``(d1, d2)``
+            representing a normalised bipartite pure state, where element ``[i, j]``
+            is the coefficient of the basis ket :math:`|ij\\rangle`.
+        keep (int): Number of Schmidt modes with the largest coefficients to compute.
+        oversampling (int, optional): Number of extra random vectors used in the sketch to
+            improve accuracy. Defaults to 10.
+        nb_power_iterations (int, optional): Number of power iterations :math:`q`, which
+            sharpen the sketch when the Schmidt coefficients decay slowly. Defaults to 2.
+        random_state (int, optional): Seed of the random number generator. Defaults to ``None``.
+        block_size (int, optional): Number of rows of the coefficient matrix read at a time.
+            If ``None``, the whole matrix is used in every product. Defaults to ``None``.
+
+    Returns:
+        SchmidtDecomposition: The ``min(keep, d1, d2)`` largest Schmidt coefficients sorted in
+        descending order, together with the eigenmodes of the first and second subsystems
+        stored as the columns of two matrices.
     """
     state_dims = bipartitepurestate_tensor.shape
     mindim = np.min(state_dims)
+    nb_samples = min(keep + oversampling, mindim)
+
+    row_slices = list(_row_slices(state_dims[0], block_size))
+    # computations in the precision of the tensor, in double precision for integer tensors
+    dtype = np.result_type(bipartitepurestate_tensor.dtype, np.float32)
+
+    def multiply(matrix):
+        # A @ matrix, one block of rows of A at a time
+        product = np.empty((state_dims[0], matrix.shape[1]), dtype=np.result_type(dtype, matrix.dtype))
+        for rows in row_slices:
+            product[rows] = bipartitepurestate_tensor[rows] @ matrix
+        return product
+
+    def multiply_adjoint(matrix):
+        # A^dagger @ matrix = conj(A^T @ conj(matrix)), accumulated over the blocks of rows of A
+        product = np.zeros((state_dims[1], matrix.shape[1]), dtype=np.result_type(dtype, matrix.dtype))
+        for rows in row_slices:
+            product += bipartitepurestate_tensor[rows].T @ np.conj(matrix[rows])
+        return np.conj(product)
+
+    rng = np.random.default_rng(random_state)
+    omega = rng.standard_normal((state_dims[1], nb_samples))
+    if np.iscomplexobj(bipartitepurestate_tensor):
+        omega = omega + 1j * rng.standard_normal((state_dims[1], nb_samples))
+    omega = omega.astype(dtype, copy=False)
+
+    # range finder with power iterations, re-orthonormalized at every step
+    q, _ = np.linalg.qr(multiply(omega))
+    for _ in range(nb_power_iterations):
+        q, _ = np.linalg.qr(multiply_adjoint(q))
+        q, _ = np.linalg.qr(multiply(q))
+
+    # Q^dagger A = (A^dagger Q)^dagger
+    small_vecs1, diags, vecs2_h = np.linalg.svd(np.conj(multiply_adjoint(q).T), full_matrices=False)
+    vecs1 = q @ small_vecs1[:, :keep]
+
+    return SchmidtDecomposition(diags[:keep], vecs1, vecs2_h[:keep, :].transpose())
+
+
+def schmidt_decomposition_gram(
+        bipartitepurestate_tensor: npt.NDArray[np.complex128],
+        keep: Optional[int] = None
+) -> SchmidtDecomposition:
+    """Compute the Schmidt decomposition of a discrete bipartite pure state from its reduced density matrix.
 
-    node = tn.Node(bipartitepurestate_tensor)
-    vecs1, diags, vecs2_h, _ = tn.split_node_full_svd(node, [node[0]], [node[1]])
+    Called internally by :func:`schmidt_decomposition` when ``approach='gram'``.
+
+    For a coefficient matrix :math:`A` of shape ``(d1, d2)`` with :math:`d_1 \\ll d_2`, such as a
+    qubit coupled to a large bath, the reduced density matrix :math:`\\rho_1 = AA^\\dagger` of
+    the smaller subsystem is formed with one BLAS rank-k update, and only its ``keep`` largest
+    eigenpairs :math:`(\\lambda_n^2, u_n)` are computed with :func:`scipy.linalg.eigh`.  The
+    eigenmodes of the larger subsystem are then recovered for these coefficients only, as
+    :math:`v_n = A^T u_n^* / \\lambda_n`.  The cost is :math:`O(d_1^2 d_2)` with
+    :math:`O(d_1^2)` memory besides the returned modes, instead of a full SVD.  The case
+    :math:`d_1 > d_2` is handled symmetrically.
+
+    As the coefficients are square roots of the eigenvalues, coefficients smaller than about
+    :math:`10^{-8}` of the largest one (in double precision) are not resolved, and the
+    eigenmodes of the larger subsystem for vanishing coefficients are returned as zeros.
+
+    Args:
+        bipartitepurestate_tensor (numpy.ndarray): 2-D complex array of shape ``(d1, d2)``
+            representing a normalised bipartite pure state, where element ``[i, j]``
+            is the coefficient of the basis ket :math:`|ij\\rangle`.
+        keep (int, optional): Number of Schmidt modes with the largest coefficients to compute;
+            all ``min(d1, d2)`` modes are computed if ``None``. Defaults to ``None``.
+
+    Returns:
+        SchmidtDecomposition: The ``min(keep, d1, d2)`` largest Schmidt coefficients sorted in
+        descending order, together with the eigenmodes of the first and second subsystems
+        stored as the columns of two matrices.
+    """
+    dim1, dim2 = bipartitepurestate_tensor.shape
+    if dim1 > dim2:
+        # A^T = sum_n lambda_n v_n u_n^T: decompose it, and swap the subsystems
+        transposed = schmidt_decomposition_gram(bipartitepurestate_tensor.T, keep=keep)
+        return SchmidtDecomposition(transposed.schmidt_coefficients, transposed.modes2, transposed.modes1)
+
+    nb_modes = dim1 if keep is None else min(keep, dim1)
+    eigenvalues, vecs1 = eigh(
+        _hermitian_outer_product(bipartitepurestate_tensor),
+        subset_by_index=[dim1 - nb_modes, dim1 - 1],
+        overwrite_a=True,
+        check_finite=False
+    )
+    schmidt_coefs = np.sqrt(np.clip(eigenvalues[::-1], 0., None))
+    vecs1 = vecs1[:, ::-1]
+
+    # A = U Lambda V^T, so that V = A^T conj(U) Lambda^{-1}
+    vecs2 = bipartitepurestate_tensor.T @ np.conj(vecs1)
+    nonzero = schmidt_coefs > 0
+    vecs2 = np.divide(vecs2, schmidt_coefs, out=np.zeros_like(vecs2), where=nonzero)
+
+    return SchmidtDecomposition(schmidt_coefs, np.ascontiguousarray(vecs1), vecs2)
+
+
+def schmidt_coefficients_only(
+        bipartitepurestate_tensor: npt.NDArray[np.complex128],
+        keep: Optional[int] = None,
+        method: Literal["auto", "svd", "eigvalsh"] = 'auto',
+        dtype: Optional[npt.DTypeLike] = None
+) -> npt.NDArray[np.floating]:
+    """Compute the Schmidt coefficients of a discrete bipartite pure state without the eigenmodes.
+
+    The entanglement measures, such as :func:`~pyqentangle.metrics.metrics.entanglement_entropy`,
+    only need the Schmidt coefficients, whose computation is much cheaper than that of the full
+    decomposition, as the singular vectors are neither computed nor allocated.  Two methods
+    are available:
+
+    * ``'svd'``: :func:`numpy.linalg.svd` with ``compute_uv=False``;
+    * ``'eigvalsh'``: the eigenvalues of the reduced density matrix of the smaller subsystem,
+      of size :math:`\\min(d_1, d_2)`, computed with one BLAS rank-k update and
+      :func:`scipy.linalg.eigvalsh`.  This is several times faster than the SVD when
+      :math:`d_1 \\ll d_2` or :math:`d_1 \\gg d_2`, but, as the coefficients are square roots of
+      the eigenvalues, coefficients smaller than about :math:`10^{-8}` of the largest one
+      (in double precision) are not resolved.
+
+    ``'auto'`` chooses ``'eigvalsh'`` if one subsystem is at least twice as large as the
+    other, and ``'svd'`` otherwise.  As the absolute error of the eigenvalues is about
+    :math:`\\epsilon \\lambda_{\\max}`, for the machine precision :math:`\\epsilon`, ``'auto'``
+    falls back to ``'svd'`` if the smallest eigenvalue returned is below
+    :math:`\\sqrt{\\epsilon} \\lambda_{\\max}`, so that every coefficient it returns is accurate to
+    about :math:`\\sqrt{\\epsilon}` relative to itself; strongly decaying spectra are then not
+    computed faster, unless ``'eigvalsh'`` is chosen explicitly or `keep` excludes the smallest
+    coefficients.
+
+    Args:
+        bipartitepurestate_tensor (numpy.ndarray): 2-D complex array of shape ``(d1, d2)``
+            representing a normalised bipartite pure state, where element ``[i, j]``
+            is the coefficient of the basis ket :math:`|ij\\rangle`.
+        keep (int, optional): The number of largest Schmidt coefficients to return; all
+            ``min(d1, d2)`` coefficients are returned if ``None``.  Defaults to ``None``.
+        method (str, optional): Either ``'auto'``, ``'svd'``, or ``'eigvalsh'``.  Defaults to ``'auto'``.
+        dtype (numpy.dtype, optional): Data type to which the tensor is converted, e.g.,
+            ``numpy.complex64``.  Defaults to ``None``, which keeps the data type of the tensor.
+
+    Returns:
+        numpy.ndarray: The ``min(keep, d1, d2)`` largest Schmidt coefficients, in descending order.
 
-    decomposition = [(np.real(diags.tensor[k, k]), vecs1.tensor[:, k], vecs2_h.tensor[k, :])
-                     for k in range(mindim)]
+    Raises:
+        ValueError: If ``method`` is not ``'auto'``, ``'svd'``, or ``'eigvalsh'``.
+    """
+    if dtype is not None:
+        bipartitepurestate_tensor = np.asarray(bipartitepurestate_tensor, dtype=dtype)
+
+    dim1, dim2 = bipartitepurestate_tensor.shape
+    fallback = method == 'auto'
+    if method == 'auto':
+        method = 'eigvalsh' if max(dim1, dim2) >= 2 * min(dim1, dim2) else 'svd'
+
+    if method == 'eigvalsh':
+        # psi psi^dagger, or conj(psi^dagger psi), whichever is smaller; both have the same spectrum
+        densitymatrix = _hermitian_outer_product(
+            bipartitepurestate_tensor if dim1 <= dim2 else bipartitepurestate_tensor.T
+        )
+        eigenvalues = eigvalsh(densitymatrix, overwrite_a=True, check_finite=False)[::-1]
+        # the smallest eigenvalue returned, not resolved if of the order of the rounding errors
+        smallest = eigenvalues[:keep][-1:]
+        if fallback and np.any(smallest < np.sqrt(np.finfo(eigenvalues.dtype).eps) * eigenvalues[0]):
+            method = 'svd'
+        else:
+            schmidt_coefs = np.sqrt(np.clip(eigenvalues, 0., None))
+    if method == 'svd':
+        schmidt_coefs = np.linalg.svd(bipartitepurestate_tensor, compute_uv=False)
+    elif method != 'eigvalsh':
+        raise ValueError(f"Method is either 'auto', 'svd', or 'eigvalsh', not {method}.")
+
+    return schmidt_coefs if keep is None else schmidt_coefs[:keep]
+
+
+def schmidt_decomposition_batch(
+        bipartitepurestate_tensors: npt.NDArray[np.complex128],
+        keep: Optional[int] = None
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.complex128], npt.NDArray[np.complex128]]:
+    """Compute the Schmidt decompositions of a stack of discrete bipartite pure states.
+
+    All the states are decomposed with a single stacked call of :func:`numpy.linalg.svd`,
+    and the results are returned as arrays instead of lists of tuples, so that parameter
+    sweeps over many small states need no Python-level loops.
+
+    Args:
+        bipartitepurestate_tensors (numpy.ndarray): 3-D complex array of shape ``(B, d1, d2)``,
+            where ``bipartitepurestate_tensors[b]`` is the coefficient matrix of the ``b``-th
+            bipartite pure state.
+        keep (int, optional): The number of Schmidt modes with the largest coefficients to
+            return; all ``min(d1, d2)`` modes are returned if ``None``.  Defaults to ``None``.
 
-    decomposition = sorted(decomposition, key=lambda dec: dec[0], reverse=True)
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+            A tuple ``(coefficients, modes1, modes2)``, where, with ``k = min(keep, d1, d2)``:
+
+            * ``coefficients`` – real array of shape ``(B, k)``; Schmidt coefficients of each
+              state in descending order.
+            * ``modes1`` – complex array of shape ``(B, d1, k)``; ``modes1[b, :, n]`` is the
+              eigenmode of the first subsystem for the ``n``-th coefficient of state ``b``.
+            * ``modes2`` – complex array of shape ``(B, d2, k)``; ``modes2[b, :, n]`` is the
+              eigenmode of the second subsystem for the ``n``-th coefficient of state ``b``.
 
-    return decomposition
+    Raises:
+        ValueError: If ``bipartitepurestate_tensors`` is not a 3-D array.
+    """
+    if bipartitepurestate_tensors.ndim != 3:
+        raise ValueError(f"Expected an array of shape (B, d1, d2), not {bipartitepurestate_tensors.shape}.")
+
+    vecs1, diags, vecs2_h = np.linalg.svd(bipartitepurestate_tensors, full_matrices=False)
+    vecs2 = np.swapaxes(vecs2_h, 1, 2)
+
+    if keep is not None:
+        vecs1, diags, vecs2 = vecs1[:, :, :keep], diags[:, :keep], vecs2[:, :, :keep]
+
+    return diags, vecs1, vecs2
 
 
 def schmidt_decomposition(
         bipartitepurestate_tensor: npt.NDArray[np.complex128],
-        approach: Literal["tensornetwork", "numpy"] = 'tensornetwork'
-) -> list[tuple[float, npt.NDArray[np.complex128], npt.NDArray[np.complex128]]]:
+        approach: Literal["tensornetwork", "numpy", "randomized", "gram"] = 'tensornetwork',
+        keep: Optional[int] = None,
+        oversampling: int = 10,
+        nb_power_iterations: int = 2,
+        block_size: Optional[int] = None,
+        dtype: Optional[npt.DTypeLike] = None
+) -> SchmidtDecomposition:
     """Compute the Schmidt decomposition of a discrete bipartite pure state.
 
     Decomposes the state described by ``bipartitepurestate_tensor`` into Schmidt form:
@@ -100,31 +359,62 @@ def schmidt_decomposition(
     first and second subsystems respectively.
 
     The decomposition is obtained via singular value decomposition (SVD) of the coefficient
-    matrix.  Two backends are supported: ``'numpy'`` (uses :func:`numpy.linalg.svd`) and
-    ``'tensornetwork'`` (uses :func:`tensornetwork.split_node_full_svd`).
+    matrix.  Four backends are supported: ``'numpy'`` (uses :func:`numpy.linalg.svd`),
+    ``'tensornetwork'`` (uses :func:`tensornetwork.split_node_full_svd`),
+    ``'randomized'`` (uses :func:`schmidt_decomposition_randomized`, which computes only the
+    ``keep`` leading modes), and ``'gram'`` (uses :func:`schmidt_decomposition_gram`, which
+    diagonalizes the reduced density matrix of the smaller subsystem, and is much faster for
+    highly rectangular tensors).
+
+    The SVD is carried out in the precision of the tensor, or of `dtype` if given: a real
+    tensor gives a faster real SVD and real eigenmodes, and a single-precision tensor halves
+    the memory and the cost.
 
     Args:
         bipartitepurestate_tensor (numpy.ndarray): 2-D complex array of shape ``(d1, d2)``
             representing a normalised bipartite pure state, where element ``[i, j]``
             is the coefficient of the basis ket :math:`|ij\\rangle`.
-        approach (str, optional): Computational backend to use.  Either ``'numpy'`` or
-            ``'tensornetwork'``.  Defaults to ``'tensornetwork'``.
+        approach (str, optional): Computational backend to use.  Either ``'numpy'``,
+            ``'tensornetwork'``, ``'randomized'``, or ``'gram'``.  Defaults to ``'tensornetwork'``.
+        keep (int, optional): The number of Schmidt modes with the largest coefficients to
+            return; all ``min(d1, d2)`` modes are returned if ``None``.  Defaults to ``None``.
+        oversampling (int, optional): Oversampling of the random sketch; only used when
+            ``approach='randomized'``.  Defaults to 10.
+        nb_power_iterations (int, optional): Number of power iterations; only used when
+            ``approach='randomized'``.  Defaults to 2.
+        block_size (int, optional): Number of rows of the tensor read at a time, so that an
+            out-of-core tensor such as a :class:`numpy.memmap` is never loaded whole; only used
+            when ``approach='randomized'``.  Defaults to ``None``.
+        dtype (numpy.dtype, optional): Data type to which the tensor is converted before the SVD,
+            e.g., ``numpy.complex64``.  Defaults to ``None``, which keeps the data type of the tensor.
 
     Returns:
-        list[tuple[float, numpy.ndarray, numpy.ndarray]]:
-            A list of ``min(d1, d2)`` tuples ``(lambda_k, u_k, v_k)`` sorted in descending
-            order of Schmidt coefficient, where:
-
-            * ``lambda_k`` – real Schmidt coefficient.
-            * ``u_k`` – complex 1-D array; eigenmode of the first subsystem.
-            * ``v_k`` – complex 1-D array; eigenmode of the second subsystem.
+        SchmidtDecomposition: The ``min(keep, d1, d2)`` Schmidt coefficients sorted in descending
+        order, together with the eigenmodes of the first and second subsystems stored as the
+        columns of two matrices.  Iterating over it, or indexing it with an integer, yields
+        :class:`~pyqentangle.schemas.schemas.DiscreteSchmidtMode` objects.
 
     Raises:
-        ValueError: If ``approach`` is neither ``'numpy'`` nor ``'tensornetwork'``.
+        ValueError: If ``approach`` is not ``'numpy'``, ``'tensornetwork'``, ``'randomized'``, or ``'gram'``.
     """
+    if dtype is not None:
+        bipartitepurestate_tensor = np.asarray(bipartitepurestate_tensor, dtype=dtype)
+
     if approach == 'numpy':
-        return schmidt_decomposition_numpy(bipartitepurestate_tensor)
+        decomposition = schmidt_decomposition_numpy(bipartitepurestate_tensor)
     elif approach == 'tensornetwork':
-        return schmidt_decomposition_tensornetwork(bipartitepurestate_tensor)
+        decomposition = schmidt_decomposition_tensornetwork(bipartitepurestate_tensor)
+    elif approach == 'randomized':
+        return schmidt_decomposition_randomized(
+            bipartitepurestate_tensor,
+            np.min(bipartitepurestate_tensor.shape) if keep is None else keep,
+            oversampling=oversampling,
+            nb_power_iterations=nb_power_iterations,
+            block_size=block_size
+        )
+    elif approach == 'gram':
+        return schmidt_decomposition_gram(bipartitepurestate_tensor, keep=keep)
     else:
-        raise ValueError(f"Approach is either 'numpy' or 'tensorflow', not {approach}.")
+        raise ValueError(f"Approach is either 'numpy', 'tensornetwork', 'randomized', or 'gram', not {approach}.")
+
+    return decomposition if keep is None else decomposition[:keep]
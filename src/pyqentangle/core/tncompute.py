@@ -1,17 +1,63 @@
 
+from typing import Literal, Optional
+
 import numpy as np
 import numpy.typing as npt
-import tensornetwork as tn
+from scipy.linalg.blas import get_blas_funcs
+
+from ..schemas.schemas import SchmidtDecomposition
+
+
+def _check_backend(backend: str) -> None:
+    """Check that the backend of a tensor computation is supported.
+
+    Args:
+        backend (str): Name of the backend.
+
+    Raises:
+        ValueError: If ``backend`` is not ``'numpy'`` or ``'tensornetwork'``.
+    """
+    if backend not in ['numpy', 'tensornetwork']:
+        raise ValueError(f"Backend is either 'numpy' or 'tensornetwork', not {backend}.")
+
+
+def _hermitian_outer_product(matrix: npt.NDArray) -> npt.NDArray:
+    """Compute :math:`AA^\\dagger` with a single BLAS rank-k update.
+
+    Uses ``herk`` for complex and ``syrk`` for real matrices, which compute only one
+    triangle of the Hermitian result at half the cost of a general matrix product; the
+    other triangle is then filled in by symmetry.
+
+    Args:
+        matrix (numpy.ndarray): 2-D array :math:`A` of shape ``(n, k)``.
+
+    Returns:
+        numpy.ndarray: Hermitian array :math:`AA^\\dagger` of shape ``(n, n)``, of the same dtype
+        as ``matrix``.
+    """
+    is_complex = np.iscomplexobj(matrix)
+    rank_k_update = get_blas_funcs('herk' if is_complex else 'syrk', (matrix,))
+    if matrix.flags.c_contiguous:
+        # BLAS is column-major: pass the transpose, which is Fortran-contiguous and thus not
+        # copied, and use conj(A^H A)^T = A A^H
+        upper = rank_k_update(1., matrix.T, trans=2 if is_complex else 1)
+        if is_complex:
+            np.conjugate(upper, out=upper)
+    else:
+        upper = rank_k_update(1., matrix)
+    return upper + np.conj(np.triu(upper, 1).T)
 
 
 # total density matrix
 def bipartitepurestate_densitymatrix(
-        bipartitepurestate_tensor: npt.NDArray[np.complex128]
+        bipartitepurestate_tensor: npt.NDArray[np.complex128],
+        backend: Literal["numpy", "tensornetwork"] = "numpy"
 ) -> npt.NDArray[np.complex128]:
     """Compute the full density matrix of a discrete bipartite pure state.
 
     Constructs the rank-4 density matrix :math:`\\rho = |\\Psi\\rangle\\langle\\Psi|` via the
-    outer product of the ket and bra tensors using TensorNetwork.
+    outer product of the ket and bra tensors, using either :func:`numpy.multiply.outer` or
+    TensorNetwork.
 
     The resulting tensor has indices ordered as ``(i, j, i', j')``, corresponding to
     :math:`\\rho_{ij,i'j'} = \\psi_{ij}\\,\\psi^*_{i'j'}`.
@@ -20,11 +66,22 @@ def bipartitepurestate_densitymatrix(
         bipartitepurestate_tensor (npt.NDArray[numpy.complex128]): 2-D complex array of
             shape ``(d1, d2)`` representing a normalised bipartite pure state, where
             element ``[i, j]`` is the coefficient of the basis ket :math:`|ij\\rangle`.
+        backend (str, optional): Either ``'numpy'`` or ``'tensornetwork'``. Defaults to ``'numpy'``.
 
     Returns:
         npt.NDArray[numpy.complex128]: Rank-4 complex array of shape ``(d1, d2, d1, d2)``
         representing the full density matrix :math:`\\rho`.
+
+    Raises:
+        ValueError: If ``backend`` is not ``'numpy'`` or ``'tensornetwork'``.
     """
+    _check_backend(backend)
+    if backend == 'numpy':
+        return np.multiply.outer(bipartitepurestate_tensor, np.conj(bipartitepurestate_tensor))
+
+    # imported on demand, as tensornetwork and its backends are slow to import
+    import tensornetwork as tn
+
     ketnode = tn.Node(bipartitepurestate_tensor)
     branode = tn.Node(np.conj(bipartitepurestate_tensor))
     denmat_node = tn.outer_product(ketnode, branode)
@@ -33,12 +90,15 @@ def bipartitepurestate_densitymatrix(
 
 def bipartitepurestate_reduceddensitymatrix(
         bipartitepurestate_tensor: npt.NDArray[np.complex128],
-        kept: int
+        kept: int,
+        backend: Literal["numpy", "tensornetwork"] = "numpy",
+        dtype: Optional[npt.DTypeLike] = None
 ) -> npt.NDArray[np.complex128]:
     """Compute the reduced density matrix of one subsystem of a discrete bipartite pure state.
 
     Traces out the complementary subsystem by contracting the shared index between the ket
-    and bra tensors using TensorNetwork, yielding:
+    and bra tensors, either with a single Hermitian BLAS rank-k update (``herk``, or ``syrk``
+    for a real state) or using TensorNetwork, yielding:
 
     .. math::
 
@@ -53,17 +113,31 @@ def bipartitepurestate_reduceddensitymatrix(
         kept (int): Index of the subsystem whose reduced density matrix is returned.
             ``0`` retains the first subsystem (traces out the second);
             ``1`` retains the second subsystem (traces out the first).
+        backend (str, optional): Either ``'numpy'`` or ``'tensornetwork'``. Defaults to ``'numpy'``.
+        dtype (numpy.dtype, optional): Data type in which the computation is carried out, such as
+            ``numpy.complex64`` to halve the memory traffic at single precision. Defaults to
+            ``None``, which keeps the data type of ``bipartitepurestate_tensor``.
 
     Returns:
-        npt.NDArray[numpy.complex128]: 2-D complex array of shape ``(dk, dk)`` representing
+        npt.NDArray[numpy.complex128]: 2-D array of shape ``(dk, dk)`` representing
         the reduced density matrix of the kept subsystem, where ``dk`` is the dimension of
         that subsystem.
 
     Raises:
-        ValueError: If ``kept`` is not ``0`` or ``1``.
+        ValueError: If ``kept`` is not ``0`` or ``1``, or if ``backend`` is not ``'numpy'`` or
+            ``'tensornetwork'``.
     """
     if not (kept in [0, 1]):
         raise ValueError('kept can only be 0 or 1!')
+    _check_backend(backend)
+
+    if dtype is not None:
+        bipartitepurestate_tensor = np.asarray(bipartitepurestate_tensor, dtype=dtype)
+
+    if backend == 'numpy':
+        return _hermitian_outer_product(bipartitepurestate_tensor if kept == 0 else bipartitepurestate_tensor.T)
+
+    import tensornetwork as tn
 
     ketnode = tn.Node(bipartitepurestate_tensor)
     branode = tn.Node(np.conj(bipartitepurestate_tensor))
@@ -74,9 +148,59 @@ def bipartitepurestate_reduceddensitymatrix(
     return reddenmat_node.tensor
 
 
+def schmidt_reduceddensitymatrix(
+        schmidt_decomposition: SchmidtDecomposition,
+        kept: int,
+        dtype: Optional[npt.DTypeLike] = None
+) -> npt.NDArray[np.complex128]:
+    """Compute the reduced density matrix of one subsystem from a Schmidt decomposition.
+
+    With the state written as :math:`\\psi_{ij} = \\sum_k \\lambda_k U_{ik} V_{jk}`, where the columns
+    of :math:`U` and :math:`V` are the eigenmodes of the two subsystems, the reduced density
+    matrices are
+
+    .. math::
+
+        \\rho_A = U \\,\\mathrm{diag}(\\lambda^2)\\, U^\\dagger
+        \\quad \\text{and} \\quad
+        \\rho_B = V \\,\\mathrm{diag}(\\lambda^2)\\, V^\\dagger,
+
+    which are computed with a single BLAS rank-k update of the scaled eigenmodes. For a
+    state of Schmidt rank :math:`k`, such as the output of a truncated decomposition, the
+    cost is :math:`O(d_A^2 k)` instead of the :math:`O(d_A^2 d_B)` of
+    :func:`bipartitepurestate_reduceddensitymatrix`.
+
+    Args:
+        schmidt_decomposition (SchmidtDecomposition): Schmidt decomposition of the state, as
+            returned by :func:`~pyqentangle.core.schmidt.schmidt_decomposition`.
+        kept (int): Index of the subsystem whose reduced density matrix is returned.
+            ``0`` retains the first subsystem; ``1`` retains the second subsystem.
+        dtype (numpy.dtype, optional): Data type in which the computation is carried out, such as
+            ``numpy.complex64``. Defaults to ``None``, which keeps the data type of the eigenmodes.
+
+    Returns:
+        npt.NDArray[numpy.complex128]: 2-D array of shape ``(dk, dk)`` representing
+        the reduced density matrix of the kept subsystem, where ``dk`` is the dimension of
+        that subsystem.
+
+    Raises:
+        ValueError: If ``kept`` is not ``0`` or ``1``.
+    """
+    if not (kept in [0, 1]):
+        raise ValueError('kept can only be 0 or 1!')
+
+    modes = schmidt_decomposition.modes1 if kept == 0 else schmidt_decomposition.modes2
+    scaled_modes = modes * schmidt_decomposition.schmidt_coefficients[None, :]
+    if dtype is not None:
+        scaled_modes = scaled_modes.astype(dtype, copy=False)
+
+    return _hermitian_outer_product(scaled_modes)
+
+
 def bipartitepurestate_partialtranspose_densitymatrix(
         bipartite_tensor: npt.NDArray[np.complex128],
-        pt_subsys: int
+        pt_subsys: int,
+        backend: Literal["numpy", "tensornetwork"] = "numpy"
 ) -> npt.NDArray[np.complex128]:
     """Compute the partial transpose of the density matrix of a discrete bipartite pure state.
 
@@ -102,16 +226,29 @@ def bipartitepurestate_partialtranspose_densitymatrix(
             ``[i, j]`` is the coefficient of the basis ket :math:`|ij\\rangle`.
         pt_subsys (int): Subsystem on which the transpose is applied.
             ``0`` transposes the first subsystem; ``1`` transposes the second.
+        backend (str, optional): Either ``'numpy'`` or ``'tensornetwork'``. With ``'numpy'``,
+            the result is a strided view of the density matrix, so that the transposition
+            copies no data. Defaults to ``'numpy'``.
 
     Returns:
         npt.NDArray[numpy.complex128]: Rank-4 complex array of shape ``(d1, d2, d1, d2)``
         representing the partially transposed density matrix.
 
     Raises:
-        ValueError: If ``pt_subsys`` is not ``0`` or ``1``.
+        ValueError: If ``pt_subsys`` is not ``0`` or ``1``, or if ``backend`` is not ``'numpy'``
+            or ``'tensornetwork'``.
     """
     if not (pt_subsys in [0, 1]):
         raise ValueError('pt_subsys can only be 0 or 1!')
+    _check_backend(backend)
+
+    if backend == 'numpy':
+        return bipartite_densitymatrix_partialtranspose(
+            bipartitepurestate_densitymatrix(bipartite_tensor, backend='numpy'),
+            pt_subsys
+        )
+
+    import tensornetwork as tn
 
     ketnode = tn.Node(bipartite_tensor)
     branode = tn.Node(np.conj(bipartite_tensor))
@@ -126,8 +263,43 @@ def bipartitepurestate_partialtranspose_densitymatrix(
     return final_node.tensor
 
 
+def bipartite_densitymatrix_partialtranspose(
+        bipartite_densitymatrix: npt.NDArray[np.complex128],
+        pt_subsys: int
+) -> npt.NDArray[np.complex128]:
+    """Compute the partial transpose of a rank-4 bipartite density matrix.
+
+    Unlike :func:`bipartitepurestate_partialtranspose_densitymatrix`, the input is any
+    (possibly mixed) density matrix of shape ``(d1, d2, d1, d2)`` with index ordering
+    ``(i, j, i', j')``, such as the output of :func:`bipartitepurestate_densitymatrix`.
+    The transposition is a permutation of the axes, so the result is a view of the input
+    and no memory is allocated.
+
+    Args:
+        bipartite_densitymatrix (npt.NDArray[numpy.complex128]): Rank-4 complex array of shape
+            ``(d1, d2, d1, d2)`` representing the density matrix of a bipartite system.
+        pt_subsys (int): Subsystem on which the transpose is applied.
+            ``0`` transposes the first subsystem; ``1`` transposes the second.
+
+    Returns:
+        npt.NDArray[numpy.complex128]: Rank-4 view of shape ``(d1, d2, d1, d2)`` of the
+        partially transposed density matrix.
+
+    Raises:
+        ValueError: If ``pt_subsys`` is not ``0`` or ``1``.
+    """
+    if not (pt_subsys in [0, 1]):
+        raise ValueError('pt_subsys can only be 0 or 1!')
+
+    if pt_subsys == 0:
+        return np.transpose(bipartite_densitymatrix, (2, 1, 0, 3))
+    else:
+        return np.transpose(bipartite_densitymatrix, (0, 3, 2, 1))
+
+
 def flatten_bipartite_densitymatrix(
-        bipartite_tensor: npt.NDArray[np.complex128]
+        bipartite_tensor: npt.NDArray[np.complex128],
+        backend: Literal["numpy", "tensornetwork"] = "numpy"
 ) -> npt.NDArray[np.complex128]:
     """Flatten a rank-4 bipartite density matrix to a standard rank-2 matrix.
 
@@ -142,11 +314,26 @@ def flatten_bipartite_densitymatrix(
         bipartite_tensor (npt.NDArray[numpy.complex128]): Rank-4 complex array of shape
             ``(d1, d2, d1, d2)`` representing the density matrix of a bipartite system,
             with index ordering ``(i, j, i', j')``.
+        backend (str, optional): Either ``'numpy'`` or ``'tensornetwork'``. With ``'numpy'``,
+            the flattening is a :func:`numpy.reshape`, which returns a view of
+            ``bipartite_tensor`` whenever its memory layout allows it (e.g., if it is
+            C-contiguous), and copies it otherwise (e.g., for a partially transposed view).
+            Defaults to ``'numpy'``.
 
     Returns:
         npt.NDArray[numpy.complex128]: 2-D complex array of shape ``(d1*d2, d1*d2)`` –
         the flattened density matrix.
+
+    Raises:
+        ValueError: If ``backend`` is not ``'numpy'`` or ``'tensornetwork'``.
     """
+    _check_backend(backend)
+    if backend == 'numpy':
+        dim0, dim1 = bipartite_tensor.shape[:2]
+        return np.reshape(bipartite_tensor, (dim0 * dim1, dim0 * dim1))
+
+    import tensornetwork as tn
+
     denmat_node = tn.Node(bipartite_tensor)
     e0, e1, e2, e3 = denmat_node[0], denmat_node[1], denmat_node[2], denmat_node[3]
     tn.flatten_edges([e0, e1])
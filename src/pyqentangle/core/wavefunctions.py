@@ -1,7 +1,7 @@
 
 from abc import ABC, abstractmethod
 from types import LambdaType, FunctionType
-from typing import Union
+from typing import Union, Literal
 import sys
 
 import numpy as np
@@ -12,7 +12,8 @@ if sys.version_info < (3, 11):
 else:
     from typing import Self
 
-from .interpolate import numerical_continuous_interpolation
+from .interpolate import interpolate_array, interpolate_uniform_array, sinc_interpolate_array
+from .exceptions import UnequalLengthException, OutOfRangeException
 
 
 class WaveFunction(ABC):
@@ -38,6 +39,20 @@ class WaveFunction(ABC):
         """
         raise NotImplemented()
 
+    @property
+    def vectorized(self) -> bool:
+        """Whether the wavefunction can evaluate a whole block of coordinates in one call.
+
+        A vectorized multi-dimensional wavefunction accepts a 2-D coordinate array of shape
+        ``(N, D)`` and returns all ``N`` amplitudes at once, which allows
+        :func:`~pyqentangle.core.continuous.discretize_continuous_bipartitesys` to fill a
+        grid without looping over its points in Python.
+
+        Returns:
+            bool: ``True`` if batched evaluation is supported, ``False`` otherwise.
+        """
+        return False
+
     def prob_density(self, coordinates: Union[npt.NDArray[np.float64], float]) -> float:
         """Compute the probability density at the given coordinates.
 
@@ -64,6 +79,10 @@ class WaveFunction(ABC):
         class ResultingAddedWavefunction(WaveFunction):
             def __call__(self2, coordinates):
                 return self.__call__(coordinates) + other.__call__(coordinates)
+
+            @property
+            def vectorized(self2):
+                return self.vectorized and other.vectorized
         return ResultingAddedWavefunction()
 
     def __mul__(self, other: Union[Self, float, np.complex128]) -> Self:
@@ -79,11 +98,19 @@ class WaveFunction(ABC):
             class ResultingMulWaveFunction(WaveFunction):
                 def __call__(self2, coordiniates):
                     return self.__call__(coordiniates) * other.__call__(coordiniates)
+
+                @property
+                def vectorized(self2):
+                    return self.vectorized and other.vectorized
             return ResultingMulWaveFunction()
         else:
             class ResultingScalarMulWaveFunction(WaveFunction):
                 def __call__(self2, coordiniates):
                     return self.__call__(coordiniates) * other
+
+                @property
+                def vectorized(self2):
+                    return self.vectorized
             return ResultingScalarMulWaveFunction()
 
     def __rmul__(self, other: Union[Self, float, np.complex128]) -> Self:
@@ -159,17 +186,26 @@ class AnalyticMultiDimWaveFunction(AnalyticWaveFunction):
     or 2-D for a batch of points) and returns the complex amplitude. The callable
     must **not** be a :class:`numpy.vectorize` instance, as vectorization is
     handled internally.
+
+    If the callable is written with NumPy operations only (e.g.
+    ``lambda x: np.exp(-x[0]**2 - x[1]**2)``), it can be declared ``vectorized``: a batch
+    of points of shape ``(N, D)`` is then passed to it in a single call as the transposed
+    array of shape ``(D, N)``, so that ``x[0]``, ``x[1]``, ... are whole coordinate arrays.
     """
 
     def __init__(
             self,
-            lambda_func: Union[LambdaType, FunctionType]   # do not put a vectorize function
+            lambda_func: Union[LambdaType, FunctionType],   # do not put a vectorize function
+            vectorized: bool = False
     ):
         """Initialize the multi-dimensional analytic wavefunction.
 
         Args:
             lambda_func (callable): A function accepting a coordinate array and returning the
                 wavefunction amplitude. Must not be a :class:`numpy.vectorize` instance.
+            vectorized (bool, optional): If ``True``, `lambda_func` accepts an array of shape
+                ``(D, N)`` whose rows are the coordinates of ``N`` points, and returns the ``N``
+                amplitudes. Defaults to ``False``.
 
         Raises:
             ValueError: If `lambda_func` is a :class:`numpy.vectorize` instance.
@@ -177,6 +213,7 @@ class AnalyticMultiDimWaveFunction(AnalyticWaveFunction):
         if isinstance(lambda_func, np.vectorize):
             raise ValueError("Do not pass a numpy.vectorize function.")
         self._lambda_func = lambda_func
+        self._vectorized = vectorized
 
     def __call__(
             self,
@@ -201,6 +238,12 @@ class AnalyticMultiDimWaveFunction(AnalyticWaveFunction):
         if coordinates.ndim == 1:
             return self._lambda_func(coordinates)
         elif coordinates.ndim == 2:
+            if self._vectorized:
+                values = np.asarray(self._lambda_func(coordinates.T))
+                if values.shape != (coordinates.shape[0],):
+                    # e.g., a constant function returning a scalar
+                    values = np.full(coordinates.shape[0], values)
+                return values
             return np.array([
                 self._lambda_func(coordinates[i, :])
                 for i in range(coordinates.shape[0])
@@ -208,28 +251,93 @@ class AnalyticMultiDimWaveFunction(AnalyticWaveFunction):
         else:
             raise ValueError(f"The coordinates have the wrong shape: {coordinates.shape}")
 
+    @property
+    def vectorized(self) -> bool:
+        """Whether the wrapped callable evaluates a batch of points in one call.
+
+        Returns:
+            bool: ``True`` if the wavefunction was declared vectorized, ``False`` otherwise.
+        """
+        return self._vectorized
+
 
 class InterpolatingWaveFunction(WaveFunction):
     """A wavefunction defined by numerical interpolation over a discrete grid.
 
     Given arrays of independent variable values (`xarray`) and corresponding
     complex amplitudes (`yarray`), this wavefunction evaluates at arbitrary
-    coordinates using linear interpolation via :func:`~pyqentangle.core.interpolate.numerical_continuous_interpolation`.
+    coordinates by interpolation. The arrays are validated once at construction,
+    and whole arrays of coordinates are evaluated in one call.
+
+    Four kinds of interpolation are supported:
+
+    * ``'linear'``: piecewise-linear interpolation with
+      :func:`~pyqentangle.core.interpolate.interpolate_array`, or with
+      :func:`~pyqentangle.core.interpolate.interpolate_uniform_array` if the grid points
+      are equally spaced (as those produced by :func:`numpy.linspace`);
+    * ``'cubic'``: cubic spline interpolation with :class:`scipy.interpolate.CubicSpline`;
+    * ``'sinc'``: band-limited interpolation on a uniform grid with
+      :func:`~pyqentangle.core.interpolate.sinc_interpolate_array`, which converges
+      spectrally for smooth modes that vanish at the edges of the grid;
+    * ``'barycentric'``: polynomial interpolation through all the grid points with
+      :class:`scipy.interpolate.BarycentricInterpolator`, which converges spectrally on
+      Chebyshev points.
+
+    The higher-order kinds reach a given accuracy with far fewer grid points.
+
+    The interpolation always runs in double precision: single-precision amplitudes, such
+    as the eigenmodes of a decomposition computed in ``numpy.float32`` or ``numpy.complex64``,
+    are promoted once at construction, which costs little for 1-D grids, and the compiled
+    kernels are only built for ``float64`` and ``complex128`` values.
     """
 
     def __init__(
             self,
             xarray: npt.NDArray[np.float64],
-            yarray: npt.NDArray[np.complex128]
+            yarray: Union[npt.NDArray[np.complex128], npt.NDArray[np.float64]],
+            kind: Literal["linear", "cubic", "sinc", "barycentric"] = "linear"
     ):
         """Initialize the interpolating wavefunction.
 
         Args:
-            xarray (numpy.ndarray): Array of independent variable values (grid points).
-            yarray (numpy.ndarray): Array of complex wavefunction amplitudes at the grid points.
+            xarray (numpy.ndarray): Sorted array of independent variable values (grid points).
+            yarray (numpy.ndarray): Array of wavefunction amplitudes at the grid points. Real
+                amplitudes are kept real (in double precision), so that the wavefunction returns
+                real values; complex amplitudes are stored in double precision.
+            kind (str, optional): Kind of interpolation, either ``'linear'``, ``'cubic'``,
+                ``'sinc'``, or ``'barycentric'``. Defaults to ``'linear'``.
+
+        Raises:
+            UnequalLengthException: If the lengths of `xarray` and `yarray` are not equal.
+            ValueError: If `kind` is not supported, or if `kind` is ``'sinc'`` but the grid
+                is not uniform.
         """
-        self._xarray = xarray
-        self._yarray = yarray
+        if len(xarray) != len(yarray):
+            raise UnequalLengthException(xarray, yarray)
+        self._xarray = np.ascontiguousarray(xarray, dtype=np.float64)
+        self._yarray = np.ascontiguousarray(yarray, dtype=np.complex128 if np.iscomplexobj(yarray) else np.float64)
+        self._minx = np.min(self._xarray)
+        self._maxx = np.max(self._xarray)
+
+        # record the origin and the spacing of a uniform grid for O(1) interval lookup
+        self._x0, self._dx = None, None
+        if len(self._xarray) > 1:
+            dx = (self._xarray[-1] - self._xarray[0]) / (len(self._xarray) - 1)
+            if dx > 0 and np.allclose(np.diff(self._xarray), dx, rtol=1e-8, atol=0.):
+                self._x0, self._dx = self._xarray[0], dx
+
+        self._kind = kind
+        if kind == 'cubic':
+            from scipy.interpolate import CubicSpline
+            self._interpolator = CubicSpline(self._xarray, self._yarray)
+        elif kind == 'barycentric':
+            from scipy.interpolate import BarycentricInterpolator
+            self._interpolator = BarycentricInterpolator(self._xarray, self._yarray)
+        elif kind == 'sinc':
+            if self._dx is None:
+                raise ValueError("Sinc interpolation requires a uniform grid.")
+        elif kind != 'linear':
+            raise ValueError(f"Interpolation kind is either 'linear', 'cubic', 'sinc', or 'barycentric', not {kind}.")
 
     def __call__(
             self,
@@ -242,12 +350,40 @@ class InterpolatingWaveFunction(WaveFunction):
                 A float evaluates at a single point; an array evaluates at each element.
 
         Returns:
-            numpy.ndarray: Interpolated complex amplitude(s) at the given coordinates.
+            numpy.ndarray: Interpolated amplitude(s) at the given coordinates, real if the
+            amplitudes at the grid points are real, and complex otherwise.
+
+        Raises:
+            OutOfRangeException: If any of the coordinates is outside the range of the grid.
         """
-        if isinstance(coordinates, float):
-            return numerical_continuous_interpolation(self._xarray, self._yarray, coordinates)
+        coordinates = np.asarray(coordinates, dtype=np.float64)
+        outside = (coordinates < self._minx) | (coordinates > self._maxx)
+        if np.any(outside):
+            raise OutOfRangeException(coordinates[outside][0] if coordinates.ndim > 0 else coordinates)
+        if self._kind in ('cubic', 'barycentric'):
+            values = self._interpolator(coordinates.ravel())
+        elif self._kind == 'sinc':
+            values = sinc_interpolate_array(self._x0, self._dx, self._yarray, coordinates.ravel())
+        elif self._dx is not None:
+            values = interpolate_uniform_array(self._x0, self._dx, self._yarray, coordinates.ravel())
         else:
-            return np.array([
-                numerical_continuous_interpolation(self._xarray, self._yarray, coordinates[i])
-                for i in range(coordinates.shape[0])
-            ])
+            values = interpolate_array(self._xarray, self._yarray, coordinates.ravel())
+        return values[0] if coordinates.ndim == 0 else values.reshape(coordinates.shape)
+
+    @property
+    def uniform(self) -> bool:
+        """Whether the grid points are equally spaced.
+
+        Returns:
+            bool: ``True`` if the grid is uniform, ``False`` otherwise.
+        """
+        return self._dx is not None
+
+    @property
+    def kind(self) -> Literal["linear", "cubic", "sinc", "barycentric"]:
+        """The kind of interpolation.
+
+        Returns:
+            str: Either ``'linear'``, ``'cubic'``, ``'sinc'``, or ``'barycentric'``.
+        """
+        return self._kind
@@ -1,16 +1,135 @@
 
-from typing import Union, Literal, Generator, Optional
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from multiprocessing.context import BaseContext
+from typing import Union, Literal, Generator, Optional, Any, TYPE_CHECKING
 
 import numpy as np
 import numpy.typing as npt
 
-from .core.schmidt import schmidt_decomposition
-from .core.continuous import continuous_schmidt_decomposition
-from .core.wavefunctions import WaveFunction, AnalyticMultiDimWaveFunction
-from .schemas import DiscreteSchmidtMode, ContinuousSchmidtMode
+from .core.schmidt import schmidt_decomposition, schmidt_coefficients_only
+from .core.mps import mps_decomposition
+from .schemas import DiscreteSchmidtMode, ContinuousSchmidtMode, SchmidtDecomposition, MatrixProductState
 
+if TYPE_CHECKING:
+    from .core.wavefunctions import WaveFunction
+    from .quantumstates.harmonics import CorrelatedGaussianWaveFunction
 
-class DiscreteSchmidtDecomposer:
+
+class SchmidtDecomposer(ABC):
+    """Abstract base class of the Schmidt decomposers.
+
+    Handles the caching of the decomposition: the results are computed once, either
+    eagerly at construction, lazily at the first access, or ahead of the first access in
+    the background with :meth:`compute_async`, and then reused until :meth:`invalidate`
+    is called.
+    """
+
+    def __init__(self, lazy: bool = False):
+        """Initialize the caching state, and compute the decomposition unless `lazy`.
+
+        Args:
+            lazy (bool, optional): If ``True``, defer computation until the results are
+                first accessed. Defaults to ``False``.
+        """
+        self._lazy = lazy
+        self._results = None
+        self._future = None
+        self._calculated = False
+        if not self._lazy:
+            self._compute()
+
+    @abstractmethod
+    def _decompose(self) -> Any:
+        """Run the Schmidt decomposition and return the results."""
+        raise NotImplemented()
+
+    def _compute(self) -> None:
+        """Obtain the results, from the background computation if one was started, and store them."""
+        if self._future is not None:
+            # cleared before the result is read, so that a failed computation is not cached
+            future, self._future = self._future, None
+            self._results = future.result()
+        else:
+            self._results = self._decompose()
+        self._calculated = True
+
+    def compute_async(self, executor: Optional[Executor] = None) -> Future:
+        """Start computing the Schmidt decomposition in the background.
+
+        The results are picked up by the first subsequent call of :meth:`modes` or
+        :meth:`mode_iterator`, which blocks until the background computation finishes.
+        Most of the work is done in NumPy and LAPACK routines that release the GIL, so a
+        thread is enough to overlap it with other work.
+
+        Args:
+            executor (concurrent.futures.Executor, optional): Executor to run the computation
+                on. If ``None``, a new single-thread executor is used. Defaults to ``None``.
+
+        Returns:
+            concurrent.futures.Future: Future of the results of the decomposition.
+        """
+        if self._calculated:
+            future = Future()
+            future.set_result(self._results)
+            return future
+        if self._future is None:
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=1)
+                self._future = executor.submit(self._decompose)
+                executor.shutdown(wait=False)
+            else:
+                self._future = executor.submit(self._decompose)
+        return self._future
+
+    def _get_results(self) -> Any:
+        """Return the results, computing them first if they have not been computed yet."""
+        if not self._calculated:
+            # lazy mode, not calculated previously
+            self._compute()
+        return self._results
+
+    def modes(self) -> Any:
+        """Return the results of the decomposition.
+
+        If the decomposer was created in lazy mode and the decomposition has not yet
+        been computed, it is computed on first call; later calls reuse the results.
+
+        Returns:
+            Sequence of Schmidt modes, each containing a Schmidt coefficient and the
+            corresponding eigenmodes for both subsystems, of the type of the decomposer.
+        """
+        return self._get_results()
+
+    def mode_iterator(self) -> Generator[Any, None, None]:
+        """Iterate over the results of the decomposition one at a time.
+
+        If the decomposer was created in lazy mode and the decomposition has not yet
+        been computed, it is computed on first call; later calls reuse the results.
+
+        Yields:
+            Each Schmidt mode in turn.
+        """
+        for result in self.modes():
+            yield result
+
+    def invalidate(self) -> None:
+        """Discard the cached results, so that the decomposition is recomputed at the next access."""
+        self._results = None
+        self._future = None
+        self._calculated = False
+
+    @property
+    def calculated(self) -> bool:
+        """Whether the Schmidt decomposition has been computed.
+
+        Returns:
+            bool: ``True`` if the decomposition has been computed, ``False`` otherwise.
+        """
+        return self._calculated
+
+
+class DiscreteSchmidtDecomposer(SchmidtDecomposer):
     """Compute and store the Schmidt decomposition of a discrete bipartite quantum state.
 
     Given a 2-D tensor whose element ``tensor[i, j]`` is the coefficient of the ket
@@ -25,7 +144,13 @@ class DiscreteSchmidtDecomposer:
             self,
             tensor: Union[npt.NDArray[np.complex128], npt.NDArray[np.float64]],
             lazy: bool = False,
-            approach: Literal["tensornetwork", "numpy"] = "tensornetwork"
+            approach: Literal["tensornetwork", "numpy", "randomized", "gram"] = "tensornetwork",
+            keep: Optional[int] = None,
+            oversampling: int = 10,
+            nb_power_iterations: int = 2,
+            block_size: Optional[int] = None,
+            dtype: Optional[npt.DTypeLike] = None,
+            compute_modes: bool = True
     ):
         """Initialize the decomposer with a bipartite state tensor.
 
@@ -34,55 +159,86 @@ class DiscreteSchmidtDecomposer:
                 ``tensor[i, j]`` is the coefficient of :math:`|ij\\rangle`.
             lazy (bool, optional): If ``True``, defer computation until the results are
                 first accessed. Defaults to ``False``.
-            approach (str, optional): Backend to use for the SVD. Either ``'tensornetwork'``
-                or ``'numpy'``. Defaults to ``'tensornetwork'``.
+            approach (str, optional): Backend to use for the SVD. Either ``'tensornetwork'``,
+                ``'numpy'``, ``'randomized'``, or ``'gram'``. Defaults to ``'tensornetwork'``.
+            keep (int, optional): Number of Schmidt modes (with the largest coefficients) to
+                retain. If ``None``, all ``min(d1, d2)`` modes are kept. With
+                ``approach='randomized'`` or ``'gram'``, only these modes are computed. Defaults to ``None``.
+            oversampling (int, optional): Oversampling of the random sketch; only used when
+                ``approach='randomized'``. Defaults to 10.
+            nb_power_iterations (int, optional): Number of power iterations; only used when
+                ``approach='randomized'``. Defaults to 2.
+            block_size (int, optional): Number of rows of the tensor read at a time, e.g., from a
+                :class:`numpy.memmap`; only used when ``approach='randomized'``. Defaults to ``None``.
+            dtype (numpy.dtype, optional): Data type in which the SVD is computed, e.g.,
+                ``numpy.complex64``. Defaults to ``None``, which keeps the data type of `tensor`.
+            compute_modes (bool, optional): If ``False``, only the Schmidt coefficients are computed,
+                with :func:`~pyqentangle.core.schmidt.schmidt_coefficients_only`, and `approach`,
+                `oversampling`, `nb_power_iterations` and `block_size` are ignored; they are then
+                available from :meth:`schmidt_coefficients`, but not from :meth:`modes`.
+                Defaults to ``True``.
         """
         self._tensor = tensor
-        self._lazy = lazy
         self._approach = approach
+        self._keep = keep
+        self._oversampling = oversampling
+        self._nb_power_iterations = nb_power_iterations
+        self._block_size = block_size
+        self._dtype = dtype
+        self._compute_modes = compute_modes
+
+        super().__init__(lazy=lazy)
+
+    def _decompose(self) -> Union[SchmidtDecomposition, npt.NDArray[np.floating]]:
+        """Run the Schmidt decomposition, or compute the Schmidt coefficients only, and return the results."""
+        if not self._compute_modes:
+            return schmidt_coefficients_only(self._tensor, keep=self._keep, dtype=self._dtype)
+        return schmidt_decomposition(
+            self._tensor,
+            self._approach,
+            keep=self._keep,
+            oversampling=self._oversampling,
+            nb_power_iterations=self._nb_power_iterations,
+            block_size=self._block_size,
+            dtype=self._dtype
+        )
 
-        self._calculated = False
-        if not self._lazy:
-            self._compute()
-
-    def _compute(self) -> None:
-        """Run the Schmidt decomposition and store the results internally."""
-        raw_decomposed_results = schmidt_decomposition(self._tensor, self._approach)
-        self._results = [
-            DiscreteSchmidtMode(schmidt_coef=item[0], mode1=item[1], mode2=item[2])
-            for item in raw_decomposed_results
-        ]
-        self._calculated = True
-
-    def modes(self) -> list[DiscreteSchmidtMode]:
+    def modes(self) -> SchmidtDecomposition:
         """Return all Schmidt modes.
 
         If the decomposer was created in lazy mode and the decomposition has not yet
-        been computed, it is computed on first call.
+        been computed, it is computed on first call; later calls reuse the results.
 
         Returns:
-            list[DiscreteSchmidtMode]: List of Schmidt modes, each containing a Schmidt
-            coefficient and the corresponding eigenvectors for both subsystems.
+            SchmidtDecomposition: Sequence of Schmidt modes, each materialized as a
+            :class:`~pyqentangle.schemas.schemas.DiscreteSchmidtMode` containing a Schmidt
+            coefficient and the corresponding eigenvectors for both subsystems when indexed
+            or iterated over. The coefficients and eigenvectors are also available as arrays.
+
+        Raises:
+            ValueError: If the decomposer was created with ``compute_modes=False``.
         """
-        if not self._calculated:
-            # lazy mode, not calculated previously
-            self._compute()
-        return self._results
+        self._check_modes_computed()
+        return super().modes()
 
-    def mode_iterator(self) -> Generator[DiscreteSchmidtMode, None, None]:
-        """Iterate over all Schmidt modes one at a time.
+    def schmidt_coefficients(self) -> npt.NDArray[np.floating]:
+        """Return the Schmidt coefficients.
 
         If the decomposer was created in lazy mode and the decomposition has not yet
-        been computed, it is computed on first call.
+        been computed, it is computed on first call; later calls reuse the results.
 
-        Yields:
-            DiscreteSchmidtMode: Each Schmidt mode in turn.
+        Returns:
+            numpy.ndarray: 1-D array of Schmidt coefficients, in descending order.
         """
-        if not self._calculated:
-            # lazy mode, not calculated previously
-            self._compute()
-        for result in self._results:
-            yield result
+        results = self._get_results()
+        if not self._compute_modes:
+            return results
+        return results.schmidt_coefficients
+
+    def _check_modes_computed(self) -> None:
+        """Raise a ValueError if only the Schmidt coefficients are computed."""
+        if not self._compute_modes:
+            raise ValueError("The Schmidt modes are not computed with compute_modes=False; use schmidt_coefficients().")
 
     @property
     def tensor(self) -> Union[npt.NDArray[np.complex128], npt.NDArray[np.float64]]:
@@ -94,25 +250,114 @@ class DiscreteSchmidtDecomposer:
         return self._tensor
 
     @property
-    def calculated(self) -> bool:
-        """Whether the Schmidt decomposition has been computed.
+    def approach(self) -> Literal["tensornetwork", "numpy", "randomized", "gram"]:
+        """The computational backend used for the SVD.
 
         Returns:
-            bool: ``True`` if the decomposition has been computed, ``False`` otherwise.
+            str: Either ``'tensornetwork'``, ``'numpy'``, ``'randomized'``, or ``'gram'``.
         """
-        return self._calculated
+        return self._approach
+
+
+class MultipartiteDecomposer(SchmidtDecomposer):
+    """Compute and store the matrix product state of a discrete multipartite quantum state.
+
+    Given an N-D tensor whose element ``tensor[i_0, ..., i_{N-1}]`` is the coefficient of the
+    ket :math:`|i_0 \\ldots i_{N-1}\\rangle`, this class decomposes the state into a matrix
+    product state with one sweep of sequential SVDs (see
+    :func:`~pyqentangle.core.mps.mps_decomposition`), which also gives the Schmidt coefficients
+    of all the bipartitions between consecutive parties.
+
+    The decomposition can be computed eagerly (default) or lazily (deferred until the
+    first access of the results).
+    """
+
+    def __init__(
+            self,
+            tensor: Union[npt.NDArray[np.complex128], npt.NDArray[np.float64]],
+            lazy: bool = False,
+            max_rank: Optional[int] = None,
+            max_discarded_weight: Optional[float] = None,
+            dtype: Optional[npt.DTypeLike] = None
+    ):
+        """Initialize the decomposer with a multipartite state tensor.
+
+        Args:
+            tensor (numpy.ndarray): N-D array describing the multipartite state, where
+                ``tensor[i_0, ..., i_{N-1}]`` is the coefficient of :math:`|i_0 \\ldots i_{N-1}\\rangle`.
+            lazy (bool, optional): If ``True``, defer computation until the results are
+                first accessed. Defaults to ``False``.
+            max_rank (int, optional): Maximum bond dimension of the matrix product state.
+                Defaults to ``None``, for no limit.
+            max_discarded_weight (float, optional): Maximum fraction of the squared norm discarded
+                at every cut. Defaults to ``None``, for no truncation.
+            dtype (numpy.dtype, optional): Data type in which the SVDs are computed, e.g.,
+                ``numpy.complex64``. Defaults to ``None``, which keeps the data type of `tensor`.
+        """
+        self._tensor = tensor
+        self._max_rank = max_rank
+        self._max_discarded_weight = max_discarded_weight
+        self._dtype = dtype
+
+        super().__init__(lazy=lazy)
+
+    def _decompose(self) -> MatrixProductState:
+        """Run the sweep of SVDs and return the matrix product state."""
+        return mps_decomposition(
+            self._tensor,
+            max_rank=self._max_rank,
+            max_discarded_weight=self._max_discarded_weight,
+            dtype=self._dtype
+        )
+
+    def mps(self) -> MatrixProductState:
+        """Return the matrix product state.
+
+        If the decomposer was created in lazy mode and the decomposition has not yet
+        been computed, it is computed on first call; later calls reuse the results.
+
+        Returns:
+            MatrixProductState: Site tensors, entanglement spectra of the cuts between
+            consecutive parties, and the weights discarded at the cuts.
+        """
+        return self._get_results()
+
+    def entanglement_spectra(self) -> list[npt.NDArray[np.floating]]:
+        """Return the Schmidt coefficients of all the bipartitions between consecutive parties.
+
+        Returns:
+            list[numpy.ndarray]: The ``k``-th array holds the Schmidt coefficients, in descending
+            order, of the bipartition ``(0..k | k+1..N-1)``.
+        """
+        return self.mps().schmidt_coefficients
+
+    def modes(self) -> Any:
+        """Not available for a multipartite state, which has no Schmidt modes of its own.
+
+        Raises:
+            ValueError: Always; use :meth:`mps` or :meth:`entanglement_spectra` instead.
+        """
+        raise ValueError("A multipartite state has no Schmidt modes; use mps() or entanglement_spectra().")
+
+    def mode_iterator(self) -> Generator[Any, None, None]:
+        """Not available for a multipartite state, which has no Schmidt modes of its own.
+
+        Raises:
+            ValueError: Always; use :meth:`mps` or :meth:`entanglement_spectra` instead.
+        """
+        return self.modes()
 
     @property
-    def approach(self) -> Literal["tensornetwork", "numpy"]:
-        """The computational backend used for the SVD.
+    def tensor(self) -> Union[npt.NDArray[np.complex128], npt.NDArray[np.float64]]:
+        """The multipartite state tensor used for the decomposition.
 
         Returns:
-            str: Either ``'tensornetwork'`` or ``'numpy'``.
+            numpy.ndarray: The original N-D state tensor.
         """
-        return self._approach
+        return self._tensor
 
 
-class ContinuousSchmidtDecomposer:
+class ContinuousSchmidtDecomposer(SchmidtDecomposer):
     """Compute and store the Schmidt decomposition of a continuous bipartite quantum state.
 
     Given a bipartite wavefunction :math:`\\psi(x_1, x_2)` defined over the rectangular
@@ -137,7 +382,17 @@ class ContinuousSchmidtDecomposer:
             nb_x2: int = 100,
             keep: Optional[int] = None,
             lazy: bool = False,
-            approach: Literal["tensornetwork", "numpy"] = 'tensornetwork'
+            approach: Literal["tensornetwork", "numpy", "randomized", "gram"] = 'tensornetwork',
+            oversampling: int = 10,
+            nb_power_iterations: int = 2,
+            interpolation: Optional[Literal["linear", "cubic", "sinc", "barycentric"]] = None,
+            grid: Literal["uniform", "chebyshev", "gauss-hermite"] = 'uniform',
+            out: Optional[npt.NDArray[np.complex128]] = None,
+            block_size: Optional[int] = None,
+            n_jobs: Optional[int] = 1,
+            executor: Optional[Executor] = None,
+            mp_context: Optional[BaseContext] = None,
+            dtype: npt.DTypeLike = np.complex128
     ):
         """Initialize the decomposer with a continuous bipartite wavefunction.
 
@@ -156,9 +411,36 @@ class ContinuousSchmidtDecomposer:
                 Defaults to ``None``.
             lazy (bool, optional): If ``True``, defer computation until the results are
                 first accessed. Defaults to ``False``.
-            approach (str, optional): Backend to use for the SVD. Either ``'tensornetwork'``
-                or ``'numpy'``. Defaults to ``'tensornetwork'``.
+            approach (str, optional): Backend to use for the SVD. Either ``'tensornetwork'``,
+                ``'numpy'``, ``'randomized'``, or ``'gram'``. With ``'randomized'`` or ``'gram'``,
+                only the ``keep`` leading modes are computed. Defaults to ``'tensornetwork'``.
+            oversampling (int, optional): Oversampling of the random sketch; only used when
+                ``approach='randomized'``. Defaults to 10.
+            nb_power_iterations (int, optional): Number of power iterations; only used when
+                ``approach='randomized'``. Defaults to 2.
+            interpolation (str, optional): Kind of interpolation of the eigenmodes, either
+                ``'linear'``, ``'cubic'``, ``'sinc'``, or ``'barycentric'``. If ``None``, the kind
+                matching the grid is used. Defaults to ``None``.
+            grid (str, optional): Grid points, either ``'uniform'``, ``'chebyshev'``, or
+                ``'gauss-hermite'``. Defaults to ``'uniform'``.
+            out (numpy.ndarray, optional): Preallocated array of shape ``(nb_x1, nb_x2)``, such as a
+                :class:`numpy.memmap`, in which the discretized state is stored. Defaults to ``None``.
+            block_size (int, optional): Number of rows of the discretized state processed at a time.
+                Defaults to ``None``.
+            n_jobs (int, optional): Number of worker processes discretizing the wavefunction in
+                tiles; ``None`` uses all the CPUs. Defaults to 1.
+            executor (concurrent.futures.Executor, optional): Executor on which the wavefunction is
+                discretized, instead of a new process pool. Defaults to ``None``.
+            mp_context (multiprocessing.context.BaseContext, optional): Context starting the worker
+                processes; ``None`` uses the default start method of the platform, under which the
+                wavefunction must be picklable unless its workers are forked. Defaults to ``None``.
+            dtype (numpy.dtype, optional): Data type of the discretized wavefunction and of its SVD,
+                e.g., ``numpy.float64`` for a real wavefunction, or ``numpy.complex64`` for single
+                precision. Defaults to ``numpy.complex128``.
         """
+        # the wavefunctions and their Numba kernels are only loaded for continuous states
+        from .core.wavefunctions import WaveFunction, AnalyticMultiDimWaveFunction
+
         if not isinstance(bipartite_wavefunction, WaveFunction):
             self._bipartitle_wavefunction = AnalyticMultiDimWaveFunction(bipartite_wavefunction)
         else:
@@ -170,15 +452,24 @@ class ContinuousSchmidtDecomposer:
         self._nb_x1 = nb_x1
         self._nb_x2 = nb_x2
         self._keep = keep
-        self._lazy = lazy
         self._approach = approach
+        self._oversampling = oversampling
+        self._nb_power_iterations = nb_power_iterations
+        self._interpolation = interpolation
+        self._grid = grid
+        self._out = out
+        self._block_size = block_size
+        self._n_jobs = n_jobs
+        self._executor = executor
+        self._mp_context = mp_context
+        self._dtype = dtype
+
+        super().__init__(lazy=lazy)
+
+    def _decompose(self) -> list[ContinuousSchmidtMode]:
+        """Discretize the wavefunction, run the Schmidt decomposition, and return the results."""
+        from .core.continuous import continuous_schmidt_decomposition
 
-        self._calculated = False
-        if not self._lazy:
-            self._compute()
-
-    def _compute(self) -> None:
-        """Discretize the wavefunction and run the Schmidt decomposition, storing the results."""
         raw_decomposition_results = continuous_schmidt_decomposition(
             self._bipartitle_wavefunction,
             self._x1_lo,
@@ -188,9 +479,19 @@ class ContinuousSchmidtDecomposer:
             nb_x1=self._nb_x1,
             nb_x2=self._nb_x2,
             keep=self._keep,
-            approach=self._approach
+            approach=self._approach,
+            oversampling=self._oversampling,
+            nb_power_iterations=self._nb_power_iterations,
+            interpolation=self._interpolation,
+            grid=self._grid,
+            out=self._out,
+            block_size=self._block_size,
+            n_jobs=self._n_jobs,
+            executor=self._executor,
+            mp_context=self._mp_context,
+            dtype=self._dtype
         )
-        self._results = [
+        return [
             ContinuousSchmidtMode(
                 schmidt_coef=item[0],
                 wavefunction1=item[1],
@@ -199,38 +500,8 @@ class ContinuousSchmidtDecomposer:
             for item in raw_decomposition_results
         ]
 
-    def modes(self) -> list[ContinuousSchmidtMode]:
-        """Return all Schmidt modes.
-
-        If the decomposer was created in lazy mode and the decomposition has not yet
-        been computed, it is computed on first call.
-
-        Returns:
-            list[ContinuousSchmidtMode]: List of Schmidt modes, each containing a Schmidt
-            coefficient and the corresponding interpolating wavefunctions for both subsystems.
-        """
-        if not self._calculated:
-            # lazy mode, not calculated previously
-            self._compute()
-        return self._results
-
-    def mode_iterator(self) -> Generator[ContinuousSchmidtMode, None, None]:
-        """Iterate over all Schmidt modes one at a time.
-
-        If the decomposer was created in lazy mode and the decomposition has not yet
-        been computed, it is computed on first call.
-
-        Yields:
-            ContinuousSchmidtMode: Each Schmidt mode in turn.
-        """
-        if not self._calculated:
-            # lazy mode, not calculated previously
-            self._compute()
-        for result in self._results:
-            yield result
-
     @property
-    def bipartite_wavefuncion(self) -> WaveFunction:
+    def bipartite_wavefuncion(self) -> 'WaveFunction':
         """The bipartite wavefunction used for the decomposition.
 
         Returns:
@@ -293,19 +564,82 @@ class ContinuousSchmidtDecomposer:
         return self._nb_x2
 
     @property
-    def calculated(self) -> bool:
-        """Whether the Schmidt decomposition has been computed.
+    def approach(self) -> Literal["tensornetwork", "numpy", "randomized", "gram"]:
+        """The computational backend used for the SVD.
 
         Returns:
-            bool: ``True`` if the decomposition has been computed, ``False`` otherwise.
+            str: Either ``'tensornetwork'``, ``'numpy'``, ``'randomized'``, or ``'gram'``.
         """
-        return self._calculated
+        return self._approach
+
+
+class GaussianSchmidtDecomposer(SchmidtDecomposer):
+    """Compute and store the Schmidt decomposition of a correlated bivariate Gaussian state.
+
+    The Schmidt decomposition of the states of
+    :func:`~pyqentangle.quantumstates.harmonics.correlated_bipartite_gaussian_wavefcn` is known
+    in closed form (see
+    :func:`~pyqentangle.quantumstates.harmonics.correlated_bipartite_gaussian_schmidt_decomposition`):
+    the Schmidt coefficients form a geometric series, and the eigenmodes are scaled Hermite
+    functions. This class returns the exact modes, as analytic wavefunctions, without
+    discretizing the state or computing an SVD, and is a reference for
+    :class:`ContinuousSchmidtDecomposer`.
+
+    The decomposition can be computed eagerly (default) or lazily (deferred until the
+    first access of the results).
+    """
+
+    def __init__(
+            self,
+            gaussian: Union['CorrelatedGaussianWaveFunction', npt.NDArray[np.float64]],
+            keep: int = 10,
+            lazy: bool = False
+    ):
+        """Initialize the decomposer with a Gaussian state.
+
+        Args:
+            gaussian (CorrelatedGaussianWaveFunction or numpy.ndarray): Either the wavefunction
+                returned by :func:`~pyqentangle.quantumstates.harmonics.correlated_bipartite_gaussian_wavefcn`,
+                or its covariance matrix of shape ``(2, 2)``.
+            keep (int, optional): Number of Schmidt modes (with the largest coefficients) to
+                compute. Defaults to 10.
+            lazy (bool, optional): If ``True``, defer computation until the results are
+                first accessed. Defaults to ``False``.
+
+        Raises:
+            TypeError: If `gaussian` is a wavefunction that is not a correlated Gaussian.
+        """
+        from .core.wavefunctions import WaveFunction
+        from .quantumstates.harmonics import CorrelatedGaussianWaveFunction
+
+        if isinstance(gaussian, CorrelatedGaussianWaveFunction):
+            self._covmatrix = gaussian.covmatrix
+        elif isinstance(gaussian, WaveFunction):
+            raise TypeError("The closed-form Schmidt decomposition requires a correlated Gaussian wavefunction.")
+        else:
+            self._covmatrix = np.asarray(gaussian, dtype=np.float64)
+        self._keep = keep
+
+        super().__init__(lazy=lazy)
+
+    def _decompose(self) -> list[ContinuousSchmidtMode]:
+        """Compute the Schmidt modes in closed form and return the results."""
+        from .quantumstates.harmonics import correlated_bipartite_gaussian_schmidt_decomposition
+
+        return [
+            ContinuousSchmidtMode(
+                schmidt_coef=item[0],
+                wavefunction1=item[1],
+                wavefunction2=item[2]
+            )
+            for item in correlated_bipartite_gaussian_schmidt_decomposition(self._covmatrix, keep=self._keep)
+        ]
 
     @property
-    def approach(self) -> Literal["tensornetwork", "numpy"]:
-        """The computational backend used for the SVD.
+    def covmatrix(self) -> npt.NDArray[np.float64]:
+        """The covariance matrix of the Gaussian state.
 
         Returns:
-            str: Either ``'tensornetwork'`` or ``'numpy'``.
+            numpy.ndarray: Covariance matrix of shape ``(2, 2)``.
         """
-        return self._approach
+        return self._covmatrix
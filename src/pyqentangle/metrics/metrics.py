@@ -1,30 +1,56 @@
 
 import warnings
+from collections.abc import Iterable
+from typing import Literal, Optional, Union
 
 import numpy as np
 import numpy.typing as npt
-import tensornetwork as tn
+from scipy.linalg import eigvalsh
 
 from ..core.exceptions import InvalidQuantumStateException
-from ..schemas.schemas import SchmidtMode
-from ..core.tncompute import bipartitepurestate_partialtranspose_densitymatrix, flatten_bipartite_densitymatrix
+from ..schemas.schemas import SchmidtMode, SchmidtDecomposition
+from ..entangle import DiscreteSchmidtDecomposer
+from ..core.mps import bipartition_schmidt_coefficients
+from ..core.tncompute import bipartitepurestate_partialtranspose_densitymatrix, flatten_bipartite_densitymatrix, \
+    bipartite_densitymatrix_partialtranspose
 
 
-def schmidt_coefficients(schmidt_modes: list[SchmidtMode]) -> npt.NDArray[np.float64]:
+def schmidt_coefficients(
+        schmidt_modes: Union[list[SchmidtMode], SchmidtDecomposition, npt.NDArray[np.float64]]
+) -> npt.NDArray[np.float64]:
     """Extract the Schmidt coefficients from a list of Schmidt modes.
 
+    Arrays of Schmidt coefficients, including the ``(B, k)`` arrays returned by
+    :func:`~pyqentangle.core.schmidt.schmidt_decomposition_batch`, are returned as they are,
+    and so is the coefficient vector of a
+    :class:`~pyqentangle.schemas.schemas.SchmidtDecomposition`.
+
     Args:
-        schmidt_modes (list[SchmidtMode]): Schmidt modes as returned by the Schmidt
-            decomposition routines.
+        schmidt_modes (list[SchmidtMode], SchmidtDecomposition, or numpy.ndarray): Schmidt
+            modes as returned by the Schmidt decomposition routines, or an array of Schmidt
+            coefficients whose last axis runs over the modes.
 
     Returns:
-        npt.NDArray[numpy.float64]: 1-D array of Schmidt coefficients, one per mode,
-        in the same order as ``schmidt_modes``.
+        npt.NDArray[numpy.float64]: Array of Schmidt coefficients, one per mode along the
+        last axis, in the same order as ``schmidt_modes``.
     """
+    if isinstance(schmidt_modes, np.ndarray):
+        return schmidt_modes
+    if isinstance(schmidt_modes, SchmidtDecomposition):
+        return schmidt_modes.schmidt_coefficients
     return np.array([mode.schmidt_coef for mode in schmidt_modes])
 
 
-def entanglement_entropy(schmidt_modes: list[SchmidtMode]) -> float:
+def _squared_schmidt_coefficients(
+        schmidt_modes: Union[list[SchmidtMode], SchmidtDecomposition, npt.NDArray[np.float64]]
+) -> npt.NDArray[np.float64]:
+    """Return the squared Schmidt coefficients, i.e., the eigenvalues of the reduced density matrix."""
+    return np.square(np.real(schmidt_coefficients(schmidt_modes)))
+
+
+def entanglement_entropy(
+        schmidt_modes: Union[list[SchmidtMode], SchmidtDecomposition, npt.NDArray[np.float64]]
+) -> Union[float, npt.NDArray[np.float64]]:
     """Compute the von Neumann entanglement entropy from Schmidt modes.
 
     Uses the formula
@@ -38,21 +64,30 @@ def entanglement_entropy(schmidt_modes: list[SchmidtMode]) -> float:
     :math:`0 \\log 0` singularities.
 
     Args:
-        schmidt_modes (list[SchmidtMode]): Schmidt modes as returned by the Schmidt
-            decomposition routines.
+        schmidt_modes (list[SchmidtMode], SchmidtDecomposition, or numpy.ndarray): Schmidt
+            modes as returned by the Schmidt decomposition routines, or an array of Schmidt
+            coefficients of shape ``(k,)`` or ``(B, k)``.
 
     Returns:
-        float: Von Neumann entanglement entropy :math:`S \\geq 0`.  Returns ``0`` for a
-        product state and :math:`\\log(\\min(d_1, d_2))` for a maximally entangled state.
+        float or numpy.ndarray: Von Neumann entanglement entropy :math:`S \\geq 0`.  Returns
+        ``0`` for a product state and :math:`\\log(\\min(d_1, d_2))` for a maximally entangled
+        state.  For a batch of coefficients of shape ``(B, k)``, an array of ``B`` entropies
+        is returned.
     """
-    eigenvalues = np.real(schmidt_coefficients(schmidt_modes))
-    square_eigenvalues = np.square(np.extract(eigenvalues > 0, eigenvalues))
-    entropy = np.sum(- square_eigenvalues * np.log(square_eigenvalues))
+    square_eigenvalues = _squared_schmidt_coefficients(schmidt_modes)
+    nonzero = square_eigenvalues > 0
+    entropy = np.sum(
+        np.where(nonzero, - square_eigenvalues * np.log(np.where(nonzero, square_eigenvalues, 1.)), 0.),
+        axis=-1
+    )
     return entropy
 
 
 # Renyi's entropy
-def renyi_entanglement_entropy(schmidt_modes: list[SchmidtMode], alpha: float) -> float:
+def renyi_entanglement_entropy(
+        schmidt_modes: Union[list[SchmidtMode], SchmidtDecomposition, npt.NDArray[np.float64]],
+        alpha: float
+) -> Union[float, npt.NDArray[np.float64]]:
     """Compute the Rényi entanglement entropy of order ``alpha`` from Schmidt modes.
 
     Uses the formula
@@ -66,26 +101,71 @@ def renyi_entanglement_entropy(schmidt_modes: list[SchmidtMode], alpha: float) -
     passed, the function falls back to :func:`entanglement_entropy` and emits a warning.
 
     Args:
-        schmidt_modes (list[SchmidtMode]): Schmidt modes as returned by the Schmidt
-            decomposition routines.
+        schmidt_modes (list[SchmidtMode], SchmidtDecomposition, or numpy.ndarray): Schmidt
+            modes as returned by the Schmidt decomposition routines, or an array of Schmidt
+            coefficients of shape ``(k,)`` or ``(B, k)``.
         alpha (float): Rényi order parameter.  Must satisfy :math:`\\alpha \\geq 0` and
             :math:`\\alpha \\neq 1` (use ``alpha=1`` to obtain the von Neumann entropy via
             the fallback path).
 
     Returns:
-        float: Rényi entanglement entropy :math:`S_\\alpha`.
+        float or numpy.ndarray: Rényi entanglement entropy :math:`S_\\alpha`, or an array of
+        ``B`` entropies for a batch of coefficients of shape ``(B, k)``.
     """
     if alpha == 1:
         warnings.warn('alpha = 1, doing Shannon entanglement entropy.')
         return entanglement_entropy(schmidt_modes)
-    eigenvalues = np.real(schmidt_coefficients(schmidt_modes))
-    square_eigenvalues = np.square(np.extract(eigenvalues > 0, eigenvalues))
-    renyi_entropy = np.log(np.sum(square_eigenvalues**alpha)) / (1-alpha)
+    square_eigenvalues = _squared_schmidt_coefficients(schmidt_modes)
+    nonzero = square_eigenvalues > 0
+    renyi_entropy = np.log(
+        np.sum(np.where(nonzero, np.where(nonzero, square_eigenvalues, 1.)**alpha, 0.), axis=-1)
+    ) / (1-alpha)
     return renyi_entropy
 
 
+def multipartite_entanglement_entropies(
+        multipartitepurestate_tensor: npt.NDArray[np.complex128],
+        subsystems: Iterable[Iterable[int]],
+        dims: Optional[tuple[int, ...]] = None,
+        alpha: float = 1.
+) -> npt.NDArray[np.float64]:
+    """Compute the entanglement entropies of many bipartitions of a discrete multipartite pure state.
+
+    Each subsystem, given as a set of parties, defines the bipartition between these parties
+    and the others.  The Schmidt coefficients of all the bipartitions are computed together
+    by :func:`~pyqentangle.core.mps.bipartition_schmidt_coefficients`, which handles a
+    bipartition and its complement once, obtains all the cuts of a chain from a single SVD
+    sweep, and traces reduced density matrices down to the subsystems they contain.
+
+    Args:
+        multipartitepurestate_tensor (numpy.ndarray): N-D array of shape ``(d_0, ..., d_{N-1})``
+            whose element ``[i_0, ..., i_{N-1}]`` is the coefficient of the basis ket
+            :math:`|i_0 \\ldots i_{N-1}\\rangle`, or a state vector if `dims` is given.
+        subsystems (Iterable[Iterable[int]]): Subsystems, each an iterable of the indices of
+            its parties.
+        dims (tuple[int, ...], optional): Dimensions of the parties, to which a state vector
+            is reshaped, e.g., ``(2,) * 20`` for 20 qubits. Defaults to ``None``.
+        alpha (float, optional): Order of the Rényi entropy; ``1`` gives the von Neumann
+            entropy. Defaults to 1.
+
+    Returns:
+        numpy.ndarray: Entanglement entropy of every bipartition, in the order of `subsystems`.
+
+    Raises:
+        ValueError: If a subsystem has a party out of range or repeated.
+    """
+    if dims is not None:
+        multipartitepurestate_tensor = np.reshape(multipartitepurestate_tensor, dims)
+    spectra = bipartition_schmidt_coefficients(multipartitepurestate_tensor, subsystems)
+    if alpha == 1:
+        return np.array([entanglement_entropy(spectrum) for spectrum in spectra])
+    return np.array([renyi_entanglement_entropy(spectrum, alpha) for spectrum in spectra])
+
+
 # participation ratio
-def participation_ratio(schmidt_modes: list[SchmidtMode]) -> float:
+def participation_ratio(
+        schmidt_modes: Union[list[SchmidtMode], SchmidtDecomposition, npt.NDArray[np.float64]]
+) -> Union[float, npt.NDArray[np.float64]]:
     """Compute the participation ratio (Schmidt number) from Schmidt modes.
 
     Uses the formula
@@ -99,20 +179,87 @@ def participation_ratio(schmidt_modes: list[SchmidtMode]) -> float:
     state, providing an effective count of the contributing Schmidt modes.
 
     Args:
-        schmidt_modes (list[SchmidtMode]): Schmidt modes as returned by the Schmidt
-            decomposition routines.
+        schmidt_modes (list[SchmidtMode], SchmidtDecomposition, or numpy.ndarray): Schmidt
+            modes as returned by the Schmidt decomposition routines, or an array of Schmidt
+            coefficients of shape ``(k,)`` or ``(B, k)``.
 
     Returns:
-        float: Participation ratio :math:`K \\geq 1`.
+        float or numpy.ndarray: Participation ratio :math:`K \\geq 1`, or an array of ``B``
+        participation ratios for a batch of coefficients of shape ``(B, k)``.
     """
-    eigenvalues = np.real(schmidt_coefficients(schmidt_modes))
-    K = 1. / np.sum(np.square(np.square(eigenvalues)))
+    square_eigenvalues = _squared_schmidt_coefficients(schmidt_modes)
+    K = 1. / np.sum(np.square(square_eigenvalues), axis=-1)
     return K
 
 
 # negativity
-def negativity(bipartite_tensor: npt.NDArray[np.complex128]) -> float:
-    """Compute the negativity of a discrete bipartite pure state.
+def _densitymatrix_negativity(
+        bipartite_densitymatrix: npt.NDArray[np.complex128],
+        pt_subsys: int,
+        eigensolver: Literal["eigvalsh", "lanczos"],
+        nb_eigenvalues: int
+) -> float:
+    """Compute the negativity of a rank-4 bipartite density matrix.
+
+    Args:
+        bipartite_densitymatrix (numpy.ndarray): Rank-4 array of shape ``(d1, d2, d1, d2)``.
+        pt_subsys (int): Subsystem on which the partial transpose is taken.
+        eigensolver (str): Either ``'eigvalsh'`` or ``'lanczos'``.
+        nb_eigenvalues (int): Number of smallest eigenvalues computed by ``'lanczos'``.
+
+    Returns:
+        float: Negativity, i.e., the sum of the absolute values of the negative eigenvalues
+        of the partially transposed density matrix.
+
+    Raises:
+        ValueError: If `eigensolver` is not ``'eigvalsh'`` or ``'lanczos'``.
+    """
+    dim0, dim1 = bipartite_densitymatrix.shape[:2]
+    dim = dim0 * dim1
+
+    if eigensolver == 'eigvalsh':
+        # the transposed view generally cannot be flattened in place: reshape then makes the
+        # only copy, which the eigensolver is allowed to overwrite
+        flatten_pt = flatten_bipartite_densitymatrix(
+            bipartite_densitymatrix_partialtranspose(bipartite_densitymatrix, pt_subsys)
+        )
+        eigenvalues = eigvalsh(
+            flatten_pt,
+            overwrite_a=not np.shares_memory(flatten_pt, bipartite_densitymatrix),
+            check_finite=False
+        )
+    elif eigensolver == 'lanczos':
+        from scipy.sparse.linalg import LinearOperator, eigsh
+
+        # matrix-free product with the partial transpose, so that no (d1 d2) x (d1 d2) copy is made
+        subscripts = 'ajib,ab->ij' if pt_subsys == 0 else 'ibaj,ab->ij'
+        operator = LinearOperator(
+            (dim, dim),
+            matvec=lambda vec: np.einsum(
+                subscripts, bipartite_densitymatrix, np.reshape(vec, (dim0, dim1))
+            ).ravel(),
+            dtype=np.result_type(bipartite_densitymatrix.dtype, np.complex128)
+        )
+        eigenvalues = eigsh(operator, k=min(nb_eigenvalues, dim - 1), which='SA', return_eigenvectors=False)
+        if np.all(eigenvalues < 0):
+            warnings.warn(
+                f"All {len(eigenvalues)} computed eigenvalues are negative, so the negativity may be "
+                "underestimated. Increase nb_eigenvalues."
+            )
+    else:
+        raise ValueError(f"Eigensolver is either 'eigvalsh' or 'lanczos', not {eigensolver}.")
+
+    # the trace of the partial transpose is 1, so the trace norm is 1 + 2 * sum(|negative eigenvalues|)
+    return float(-np.sum(eigenvalues[eigenvalues < 0]))
+
+
+def negativity(
+        bipartite_state: Union[npt.NDArray[np.complex128], list[SchmidtMode], SchmidtDecomposition, DiscreteSchmidtDecomposer],
+        dense: bool = False,
+        eigensolver: Literal["eigvalsh", "lanczos"] = "eigvalsh",
+        nb_eigenvalues: int = 6
+) -> float:
+    """Compute the negativity of a discrete bipartite state.
 
     The negativity is defined as
 
@@ -124,27 +271,117 @@ def negativity(bipartite_tensor: npt.NDArray[np.complex128]) -> float:
     respect to the smaller subsystem and :math:`\\|\\cdot\\|_1` denotes the trace norm
     (sum of absolute eigenvalues).  A non-zero negativity certifies entanglement.
 
-    The partial transpose is taken over the subsystem with the smaller dimension
-    (``0`` if ``d1 < d2``, otherwise ``1``).
+    For a pure state, the eigenvalues of :math:`\\rho^{\\Gamma_A}` are
+    :math:`\\lambda_i \\lambda_j` in terms of the Schmidt coefficients, so that
+
+    .. math::
+
+        N = \\frac{\\left(\\sum_i \\lambda_i\\right)^2 - 1}{2},
+
+    which is computed from the singular values of the state tensor, or from an existing
+    Schmidt decomposition, at the cost of an SVD instead of the :math:`O((d_1 d_2)^3)` of a
+    dense eigenproblem of the :math:`d_1 d_2 \\times d_1 d_2` partially transposed density matrix.
+
+    For a (possibly mixed) density matrix, given as a rank-4 array, the partial transpose is
+    Hermitian with unit trace, so that :math:`N` is the sum of the absolute values of its
+    negative eigenvalues.  These are found either with :func:`scipy.linalg.eigvalsh`, or with
+    the Lanczos solver :func:`scipy.sparse.linalg.eigsh` applied to the partial transpose as a
+    matrix-free operator, which computes only the `nb_eigenvalues` smallest eigenvalues and
+    never builds the flattened :math:`d_1 d_2 \\times d_1 d_2` matrix.
 
     Args:
-        bipartite_tensor (npt.NDArray[numpy.complex128]): 2-D complex array of shape
-            ``(d1, d2)`` representing a normalised bipartite pure state, where element
-            ``[i, j]`` is the coefficient of the basis ket :math:`|ij\\rangle`.
+        bipartite_state (numpy.ndarray, list[SchmidtMode], SchmidtDecomposition, or DiscreteSchmidtDecomposer):
+            Either a 2-D complex array of shape ``(d1, d2)`` representing a normalised bipartite
+            pure state, where element ``[i, j]`` is the coefficient of the basis ket
+            :math:`|ij\\rangle`; or its Schmidt modes; or a decomposer of the state; or a
+            4-D complex array of shape ``(d1, d2, d1, d2)`` representing a density matrix, as
+            returned by :func:`~pyqentangle.core.tncompute.bipartitepurestate_densitymatrix`.
+        dense (bool, optional): If ``True``, build the partially transposed density matrix
+            of a pure state explicitly and sum the absolute values of its eigenvalues, over the
+            subsystem with the smaller dimension (``0`` if ``d1 < d2``, otherwise ``1``). Only
+            meant for verification, and only available if `bipartite_state` is a 2-D tensor.
+            Defaults to ``False``.
+        eigensolver (str, optional): Eigensolver used for a density matrix. Either ``'eigvalsh'``
+            (dense, all eigenvalues) or ``'lanczos'`` (matrix-free, smallest eigenvalues only).
+            Defaults to ``'eigvalsh'``.
+        nb_eigenvalues (int, optional): Number of smallest eigenvalues computed when
+            ``eigensolver='lanczos'``; a warning is issued if all of them are negative, as the
+            negative spectrum may then be truncated. Defaults to 6.
 
     Returns:
         float: Negativity :math:`N \\geq 0`.  Returns ``0`` for a separable state.
+
+    Raises:
+        ValueError: If `dense` is ``True`` but `bipartite_state` is not a pure-state tensor,
+            or if `eigensolver` is not ``'eigvalsh'`` or ``'lanczos'``.
+        InvalidQuantumStateException: If a 4-D array does not have the shape ``(d1, d2, d1, d2)``.
     """
-    dim0, dim1 = bipartite_tensor.shape
-    flatten_fullden_pt = flatten_bipartite_densitymatrix(
-        bipartitepurestate_partialtranspose_densitymatrix(
-            bipartite_tensor,
-            0 if dim0<dim1 else 1
-        )
-    )
+    if isinstance(bipartite_state, np.ndarray) and bipartite_state.ndim == 4:
+        if dense:
+            raise ValueError("The dense computation requires the pure-state tensor.")
+        dim0, dim1 = bipartite_state.shape[:2]
+        if bipartite_state.shape[2:] != (dim0, dim1):
+            raise InvalidQuantumStateException(
+                f"A density matrix must have the shape (d1, d2, d1, d2), not {bipartite_state.shape}."
+            )
+        return _densitymatrix_negativity(bipartite_state, 0 if dim0 < dim1 else 1, eigensolver, nb_eigenvalues)
+
+    if isinstance(bipartite_state, np.ndarray):
+        if dense:
+            dim0, dim1 = bipartite_state.shape
+            flatten_fullden_pt = flatten_bipartite_densitymatrix(
+                bipartitepurestate_partialtranspose_densitymatrix(
+                    bipartite_state,
+                    0 if dim0<dim1 else 1
+                )
+            )
+
+            eigenvalues = eigvalsh(flatten_fullden_pt, overwrite_a=True, check_finite=False)
+            return 0.5 * (np.sum(np.abs(eigenvalues)) - 1)
+        eigenvalues = np.linalg.svd(bipartite_state, compute_uv=False)
+    elif dense:
+        raise ValueError("The dense computation requires the state tensor.")
+    elif isinstance(bipartite_state, DiscreteSchmidtDecomposer):
+        # also available when the decomposer only computes the Schmidt coefficients
+        eigenvalues = bipartite_state.schmidt_coefficients()
+    else:
+        eigenvalues = schmidt_coefficients(bipartite_state)
+
+    return 0.5 * (np.square(np.sum(np.abs(eigenvalues))) - 1)
+
+
+def log_negativity(
+        bipartite_state: Union[npt.NDArray[np.complex128], list[SchmidtMode], SchmidtDecomposition, DiscreteSchmidtDecomposer],
+        eigensolver: Literal["eigvalsh", "lanczos"] = "eigvalsh",
+        nb_eigenvalues: int = 6
+) -> float:
+    """Compute the logarithmic negativity of a discrete bipartite state.
+
+    The logarithmic negativity is defined as
+
+    .. math::
+
+        E_N(\\rho) = \\log \\|\\rho^{\\Gamma_A}\\|_1 = \\log (2N + 1),
 
-    eigenvalues = np.linalg.eigvals(flatten_fullden_pt)
-    return 0.5 * (np.sum(np.abs(eigenvalues)) - 1)
+    where :math:`N` is the negativity computed by :func:`negativity`.  The natural logarithm
+    is used, as for :func:`entanglement_entropy`.  For a pure state, it equals the Rényi
+    entanglement entropy of order :math:`1/2`.
+
+    Args:
+        bipartite_state (numpy.ndarray, list[SchmidtMode], SchmidtDecomposition, or DiscreteSchmidtDecomposer):
+            Pure-state tensor of shape ``(d1, d2)``, its Schmidt modes, a decomposer of the
+            state, or a density matrix of shape ``(d1, d2, d1, d2)``. See :func:`negativity`.
+        eigensolver (str, optional): Eigensolver used for a density matrix. Either ``'eigvalsh'``
+            or ``'lanczos'``. Defaults to ``'eigvalsh'``.
+        nb_eigenvalues (int, optional): Number of smallest eigenvalues computed when
+            ``eigensolver='lanczos'``. Defaults to 6.
+
+    Returns:
+        float: Logarithmic negativity :math:`E_N \\geq 0`.  Returns ``0`` for a separable state.
+    """
+    return float(np.log(
+        2 * negativity(bipartite_state, eigensolver=eigensolver, nb_eigenvalues=nb_eigenvalues) + 1
+    ))
 
 
 # concurrence
@@ -178,6 +415,8 @@ def concurrence(bipartite_tensor: npt.NDArray[np.complex128]) -> float:
     if dim0 != 2 and dim1 != 2:
         raise InvalidQuantumStateException('Both or one of the subsystems have more than one bases.')
 
+    import tensornetwork as tn
+
     # Levi-Civita symbol
     epsilon = np.array([[0., 1.], [-1., 0.]])
 
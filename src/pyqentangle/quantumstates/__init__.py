@@ -1,3 +1,19 @@
 
+from importlib import import_module
+
 from . import bipartite
-from . import harmonics
+
+_lazy_submodules = {'harmonics'}
+
+
+def __getattr__(name):
+    # the harmonic states are evaluated with Numba, which is slow to import
+    if name in _lazy_submodules:
+        value = import_module('.' + name, __name__)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _lazy_submodules)
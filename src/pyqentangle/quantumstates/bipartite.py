@@ -1,9 +1,11 @@
 
+from typing import Union
+
 import numpy as np
 import numpy.typing as npt
 
 
-def create_singlet() -> npt.NDArray[np.complex128]:
+def create_singlet(dtype: npt.DTypeLike = np.float64) -> Union[npt.NDArray[np.float64], npt.NDArray[np.complex128]]:
     """Create a two-qubit singlet state tensor.
 
     Returns the bipartite state tensor for the singlet state
@@ -13,8 +15,12 @@ def create_singlet() -> npt.NDArray[np.complex128]:
     Note: the returned tensor is **not** normalized; multiply by
     :math:`1/\\sqrt{2}` to obtain the normalized singlet state.
 
+    Args:
+        dtype (numpy.dtype, optional): Data type of the tensor. The coefficients are real, so
+            that a real type gives real Schmidt modes. Defaults to ``numpy.float64``.
+
     Returns:
         numpy.ndarray: A ``(2, 2)`` array representing the singlet state tensor.
     """
     return np.array([[0., 1.],
-                     [1., 0.]])
+                     [1., 0.]], dtype=dtype)
@@ -1,17 +1,16 @@
 
-from math import sqrt, pi
 from functools import lru_cache
+from typing import Union
 
 import numpy as np
 import numpy.typing as npt
 import numba as nb
-from scipy.special import hermite
 
 from ..core.exceptions import InvalidMatrix
 from ..core.wavefunctions import Analytic1DWaveFunction, AnalyticMultiDimWaveFunction, WaveFunction
 
 
-@nb.njit(nb.float64(nb.float64))
+@nb.njit(nb.float64(nb.float64), cache=True)
 def sqrt_gaussian_function_value(x: float) -> float:
     """Evaluate the square-root Gaussian function at a given point.
 
@@ -37,7 +36,7 @@ def disentangled_gaussian_wavefcn() -> WaveFunction:
     return AnalyticMultiDimWaveFunction(lambda x: sqrt_gaussian_function_value(x[0]) * sqrt_gaussian_function_value(x[1]))
 
 
-@nb.njit(nb.float64(nb.float64[:, :], nb.float64, nb.float64))
+@nb.njit(nb.float64(nb.float64[:, :], nb.float64, nb.float64), cache=True)
 def correlated_bipartite_gaussian_value(covmatrix: npt.NDArray[np.float64], x1: float, x2: float) -> float:
     """Evaluate a normalized correlated bivariate Gaussian wavefunction at a given point.
 
@@ -53,9 +52,75 @@ def correlated_bipartite_gaussian_value(covmatrix: npt.NDArray[np.float64], x1:
     Returns:
         float: The wavefunction amplitude at ``(x1, x2)``.
     """
-    norm = 2 * np.pi / np.sqrt(np.linalg.det(covmatrix))
-    const = 1 / np.sqrt(norm)
-    return const * np.exp(-0.25 * np.array([[x1, x2]]) @ covmatrix @ np.array([[x1], [x2]]))[0, 0]
+    # 2 x 2 determinant and quadratic form written out, to avoid temporary arrays
+    det = covmatrix[0, 0] * covmatrix[1, 1] - covmatrix[0, 1] * covmatrix[1, 0]
+    const = np.sqrt(np.sqrt(det) / (2 * np.pi))
+    quadratic_form = covmatrix[0, 0] * x1 * x1 + (covmatrix[0, 1] + covmatrix[1, 0]) * x1 * x2 + covmatrix[1, 1] * x2 * x2
+    return const * np.exp(-0.25 * quadratic_form)
+
+
+@nb.vectorize([nb.float64(nb.float64, nb.float64, nb.float64, nb.float64, nb.float64, nb.float64)], cache=True)
+def correlated_bipartite_gaussian_ufunc(
+        x1: float,
+        x2: float,
+        const: float,
+        coef11: float,
+        coef12: float,
+        coef22: float
+) -> float:
+    """Evaluate a bivariate Gaussian with precomputed coefficients, as a NumPy ufunc.
+
+    Computes :math:`C \\exp(-(c_{11} x_1^2 + c_{12} x_1 x_2 + c_{22} x_2^2)/4)` in a single fused
+    loop over whole coordinate arrays, which are broadcast together, without any temporary
+    array. This function is compiled with Numba.
+
+    Args:
+        x1 (numpy.ndarray or float): Coordinates of the first subsystem.
+        x2 (numpy.ndarray or float): Coordinates of the second subsystem.
+        const (float): Normalization constant :math:`C`.
+        coef11 (float): Coefficient :math:`c_{11}` of :math:`x_1^2`.
+        coef12 (float): Coefficient :math:`c_{12}` of :math:`x_1 x_2`.
+        coef22 (float): Coefficient :math:`c_{22}` of :math:`x_2^2`.
+
+    Returns:
+        numpy.ndarray or float: The values of the Gaussian.
+    """
+    return const * np.exp(-0.25 * (coef11 * x1 * x1 + coef12 * x1 * x2 + coef22 * x2 * x2))
+
+
+class CorrelatedGaussianWaveFunction(AnalyticMultiDimWaveFunction):
+    """A normalized correlated bivariate Gaussian wavefunction.
+
+    Evaluates the same values as :func:`correlated_bipartite_gaussian_value`, with the
+    normalization and the coefficients of the quadratic form computed once per covariance
+    matrix, and over whole coordinate arrays by :func:`correlated_bipartite_gaussian_ufunc`,
+    so that the wavefunction is vectorized. It keeps the covariance matrix, so that the
+    Schmidt decomposition of the state can be obtained in closed form by
+    :func:`correlated_bipartite_gaussian_schmidt_decomposition`.
+    """
+
+    def __init__(self, covmatrix: npt.NDArray[np.float64]):
+        """Initialize the Gaussian wavefunction.
+
+        Args:
+            covmatrix (numpy.ndarray): Symmetric covariance matrix of shape ``(2, 2)``.
+        """
+        self._covmatrix = covmatrix
+        const = np.sqrt(np.sqrt(np.linalg.det(covmatrix)) / (2 * np.pi))
+        coef11, coef12, coef22 = covmatrix[0, 0], covmatrix[0, 1] + covmatrix[1, 0], covmatrix[1, 1]
+        super().__init__(
+            lambda x: correlated_bipartite_gaussian_ufunc(x[0], x[1], const, coef11, coef12, coef22),
+            vectorized=True
+        )
+
+    @property
+    def covmatrix(self) -> npt.NDArray[np.float64]:
+        """The covariance matrix of the Gaussian.
+
+        Returns:
+            numpy.ndarray: Covariance matrix of shape ``(2, 2)``.
+        """
+        return self._covmatrix
 
 
 def correlated_bipartite_gaussian_wavefcn(covmatrix: np.ndarray) -> WaveFunction:
@@ -65,13 +130,71 @@ def correlated_bipartite_gaussian_wavefcn(covmatrix: np.ndarray) -> WaveFunction
         covmatrix (numpy.ndarray): Covariance matrix of shape ``(2, 2)``.
 
     Returns:
-        WaveFunction: A wavefunction of two variables.
+        WaveFunction: A wavefunction of two variables, as a :class:`CorrelatedGaussianWaveFunction`.
     """
     if not covmatrix.shape == (2, 2):
         raise InvalidMatrix(f"Invalid matrix shape: {covmatrix.shape}; desired shape: (2, 2)")
     if covmatrix[0, 1] != covmatrix[1, 0]:
         raise InvalidMatrix("Not a symmetric covariance matrix")
-    return AnalyticMultiDimWaveFunction(lambda x: correlated_bipartite_gaussian_value(covmatrix, x[0], x[1]))
+    return CorrelatedGaussianWaveFunction(covmatrix)
+
+
+def correlated_bipartite_gaussian_schmidt_decomposition(
+        covmatrix: npt.NDArray[np.float64],
+        keep: int = 10
+) -> list[tuple[float, WaveFunction, WaveFunction]]:
+    """Compute the Schmidt decomposition of a correlated bivariate Gaussian state in closed form.
+
+    The state :math:`\\psi(x_1, x_2) \\propto \\exp(-(a x_1^2 + 2b x_1 x_2 + c x_2^2)/4)` of
+    :func:`correlated_bipartite_gaussian_wavefcn`, with :math:`a`, :math:`b`, and :math:`c` the
+    elements of `covmatrix`, is matched to Mehler's formula, which gives
+
+    .. math::
+
+        \\psi(x_1, x_2) = \\sum_n \\lambda_n \\, \\sqrt{\\alpha} \\psi_n(\\alpha x_1) \\,
+            \\mathrm{sgn}(\\mu)^n \\sqrt{\\beta} \\psi_n(\\beta x_2),
+        \\quad \\lambda_n = \\sqrt{1 - \\mu^2} \\, |\\mu|^n,
+
+    where :math:`\\psi_n` are the Hermite functions, :math:`r = b / \\sqrt{ac}`,
+    :math:`\\mu = (\\sqrt{1 - r^2} - 1) / r`, and
+    :math:`\\alpha^2 = a(1 - \\mu^2) / (2(1 + \\mu^2))`,
+    :math:`\\beta^2 = c(1 - \\mu^2) / (2(1 + \\mu^2))`.  No grid and no SVD are needed, and the
+    result is exact; the Schmidt coefficients form a geometric series.
+
+    Args:
+        covmatrix (numpy.ndarray): Symmetric positive-definite covariance matrix of shape ``(2, 2)``.
+        keep (int, optional): Number of Schmidt modes with the largest coefficients to return.
+            Defaults to 10.
+
+    Returns:
+        list[tuple[float, WaveFunction, WaveFunction]]: List of tuples, where each contains a Schmidt
+        coefficient, the wavefunction of the eigenmode of the first subsystem, and the
+        wavefunction of the eigenmode of the second subsystem.
+
+    Raises:
+        InvalidMatrix: If `covmatrix` is not a symmetric positive-definite matrix of shape ``(2, 2)``.
+    """
+    if not covmatrix.shape == (2, 2):
+        raise InvalidMatrix(f"Invalid matrix shape: {covmatrix.shape}; desired shape: (2, 2)")
+    if covmatrix[0, 1] != covmatrix[1, 0]:
+        raise InvalidMatrix("Not a symmetric covariance matrix")
+    a, b, c = covmatrix[0, 0], covmatrix[0, 1], covmatrix[1, 1]
+    if a <= 0 or c <= 0 or a * c - b * b <= 0:
+        raise InvalidMatrix("Not a positive-definite covariance matrix")
+
+    r = b / np.sqrt(a * c)
+    mu = (np.sqrt(1 - r * r) - 1) / r if r != 0 else 0.
+    alpha = np.sqrt(0.5 * a * (1 - mu * mu) / (1 + mu * mu))
+    beta = np.sqrt(0.5 * c * (1 - mu * mu) / (1 + mu * mu))
+    sign = -1. if mu < 0 else 1.
+
+    return [
+        (np.sqrt(1 - mu * mu) * np.power(abs(mu), n),
+         Analytic1DWaveFunction(lambda x, n=n: np.sqrt(alpha) * hermite_function(n, alpha * np.asarray(x)), to_vectorize=False),
+         Analytic1DWaveFunction(lambda x, n=n: sign ** n * np.sqrt(beta) * hermite_function(n, beta * np.asarray(x)), to_vectorize=False)
+         )
+        for n in range(keep)
+    ]
 
 
 @lru_cache(maxsize=100)
@@ -93,19 +216,84 @@ def tail_factorial(n: int, accumulator: int = 1) -> int:
         return tail_factorial(n-1, accumulator * n)
 
 
+@nb.njit(nb.float64[:](nb.int64, nb.float64[:]), cache=True)
+def hermite_function_array(n: int, xs: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Evaluate the normalized Hermite function of order `n` at many points.
+
+    The Hermite function :math:`\\psi_n(x) = (2^n n! \\sqrt{\\pi})^{-1/2} H_n(x) e^{-x^2/2}` is
+    computed by the three-term recurrence
+
+    .. math::
+
+        \\psi_{k+1}(x) = \\sqrt{\\frac{2}{k+1}} \\, x \\, \\psi_k(x) - \\sqrt{\\frac{k}{k+1}} \\, \\psi_{k-1}(x),
+
+    starting from :math:`\\psi_0(x) = \\pi^{-1/4} e^{-x^2/2}`. The Gaussian factor is applied
+    at the end as a logarithm, and the recurrence is rescaled whenever it grows large, so
+    that neither :math:`2^n n!` nor :math:`H_n(x)` overflow, and :math:`e^{-x^2/2}` does not
+    underflow, even for large `n`. This function is JIT-compiled with Numba for performance.
+
+    Args:
+        n (int): Order of the Hermite function.
+        xs (numpy.ndarray): 1-D array of points at which to evaluate the function.
+
+    Returns:
+        numpy.ndarray: Values of :math:`\\psi_n` at `xs`.
+    """
+    values = np.empty(len(xs))
+    for i in range(len(xs)):
+        x = xs[i]
+        previous, current, log_scale = 0., np.power(np.pi, -0.25), 0.
+        for k in range(n):
+            previous, current = current, np.sqrt(2. / (k + 1)) * x * current - np.sqrt(k / (k + 1.)) * previous
+            magnitude = max(abs(current), abs(previous))
+            if magnitude > 1e100:
+                previous /= magnitude
+                current /= magnitude
+                log_scale += np.log(magnitude)
+        if current == 0.:
+            values[i] = 0.
+        else:
+            values[i] = np.sign(current) * np.exp(np.log(abs(current)) + log_scale - 0.5 * x * x)
+    return values
+
+
+def hermite_function(
+        n: int,
+        x: Union[npt.NDArray[np.float64], float]
+) -> Union[npt.NDArray[np.float64], float]:
+    """Evaluate the normalized Hermite function of order `n`.
+
+    The Hermite functions are the eigenstates of the harmonic oscillator with
+    :math:`m = \\omega = \\hbar = 1`. See :func:`hermite_function_array`.
+
+    Args:
+        n (int): Order of the Hermite function.
+        x (numpy.ndarray or float): Point(s) at which to evaluate the function.
+
+    Returns:
+        numpy.ndarray or float: Value(s) of :math:`\\psi_n` at `x`, of the shape of `x`.
+    """
+    xs = np.asarray(x, dtype=np.float64)
+    values = hermite_function_array(n, xs.ravel())
+    return values[0] if xs.ndim == 0 else values.reshape(xs.shape)
+
+
 # m = omega = hbar = 1
+@lru_cache(maxsize=100)
 def harmonic_wavefcn(n: int) -> WaveFunction:
     """Return the normalized wavefunction of a harmonic oscillator, where $n$ denotes
     that it is an n-th excited state, or ground state for $n=0$.
 
+    The wavefunction is evaluated over whole arrays of coordinates by :func:`hermite_function`,
+    and is cached for each `n`.
+
     Args:
         n (int): Quantum number of the excited state.
 
     Returns:
         WaveFunction: A normalized wavefunction.
     """
-    const = 1/sqrt(2**n * tail_factorial(n)) * 1/sqrt(sqrt(pi))
-    return Analytic1DWaveFunction(lambda x: const * np.exp(-0.5*x*x) * hermite(n)(x))
+    return Analytic1DWaveFunction(lambda x: hermite_function(n, x), to_vectorize=False)
 
 
 # excited interaction states
@@ -113,11 +301,15 @@ def coupled_excited_harmonics(n: int) -> WaveFunction:
     """Return a bipartitite wavefunction, with ground state of center of mass,
     but excited state for the interaction.
 
+    The wavefunction is vectorized, so that a whole grid is evaluated in a single call.
+
     Args:
         n (int): Quantum harmonic state number for the interaction.
 
     Returns:
         WaveFunction: Wavefunction of two variables.
     """
-    # note: put a non-vectorize function
-    return AnalyticMultiDimWaveFunction(lambda x: harmonic_wavefcn(0)(0.5*(x[0]+x[1]))[0] * harmonic_wavefcn(n)(x[0]-x[1])[0])
+    return AnalyticMultiDimWaveFunction(
+        lambda x: hermite_function(0, 0.5*(x[0]+x[1])) * hermite_function(n, x[0]-x[1]),
+        vectorized=True
+    )
@@ -1,2 +1,2 @@
 
-from .schemas import DiscreteSchmidtMode, ContinuousSchmidtMode
+from .schemas import DiscreteSchmidtMode, ContinuousSchmidtMode, SchmidtDecomposition, MatrixProductState
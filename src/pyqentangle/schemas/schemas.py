@@ -1,11 +1,14 @@
 
 from dataclasses import dataclass
 from abc import ABC
+from typing import Union, Iterator, TYPE_CHECKING
 
 import numpy as np
 import numpy.typing as npt
 
-from ..core.wavefunctions import WaveFunction
+if TYPE_CHECKING:
+    # not imported at run time, so that the discrete decomposition does not load numba
+    from ..core.wavefunctions import WaveFunction
 
 
 @dataclass
@@ -28,7 +31,10 @@ class DiscreteSchmidtMode(SchmidtMode):
     """A Schmidt mode for a discrete bipartite quantum system.
 
     Extends :class:`SchmidtMode` with the eigenvectors of both subsystems
-    as complex-valued NumPy arrays.
+    as real- or complex-valued NumPy arrays, in the precision of the decomposed tensor.
+    A mode unpacks and indexes like the ``(schmidt_coef, mode1, mode2)`` tuples that
+    :func:`~pyqentangle.core.schmidt.schmidt_decomposition` used to return, so that
+    ``for coef, mode1, mode2 in schmidt_decomposition(tensor)`` and ``modes[0][0]`` keep working.
 
     Attributes:
         schmidt_coef (float): The Schmidt coefficient (singular value) for this mode.
@@ -36,8 +42,17 @@ class DiscreteSchmidtMode(SchmidtMode):
         mode2 (numpy.ndarray): Eigenvector of the second subsystem.
     """
 
-    mode1: npt.NDArray[np.complex128]
-    mode2: npt.NDArray[np.complex128]
+    mode1: npt.NDArray[np.inexact]
+    mode2: npt.NDArray[np.inexact]
+
+    def __iter__(self) -> Iterator[Union[float, npt.NDArray[np.inexact]]]:
+        return iter((self.schmidt_coef, self.mode1, self.mode2))
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[float, npt.NDArray[np.inexact], tuple]:
+        return (self.schmidt_coef, self.mode1, self.mode2)[index]
+
+    def __len__(self) -> int:
+        return 3
 
 
 @dataclass
@@ -54,5 +69,221 @@ class ContinuousSchmidtMode(SchmidtMode):
         wavefunction2 (WaveFunction): Eigenmode wavefunction of the second subsystem.
     """
 
-    wavefunction1: WaveFunction
-    wavefunction2: WaveFunction
+    wavefunction1: 'WaveFunction'
+    wavefunction2: 'WaveFunction'
+
+
+class SchmidtDecomposition:
+    """Array-backed Schmidt decomposition of a discrete bipartite quantum system.
+
+    Holds the Schmidt coefficients as one vector and the eigenmodes of the two subsystems
+    as the columns of two matrices, instead of one object per mode.  The object behaves as a
+    sequence of :class:`DiscreteSchmidtMode`: indexing with an integer or iterating
+    materializes the modes on demand, with eigenvectors that are views of the matrices;
+    slicing returns another :class:`SchmidtDecomposition` sharing the same memory.
+
+    Attributes:
+        schmidt_coefficients (numpy.ndarray): Schmidt coefficients of shape ``(k,)``,
+            in descending order.
+        modes1 (numpy.ndarray): Matrix of shape ``(d1, k)`` whose ``n``-th column is the
+            eigenvector of the first subsystem for the ``n``-th Schmidt coefficient.
+        modes2 (numpy.ndarray): Matrix of shape ``(d2, k)`` whose ``n``-th column is the
+            eigenvector of the second subsystem for the ``n``-th Schmidt coefficient.
+    """
+
+    __slots__ = ('_schmidt_coefficients', '_modes1', '_modes2')
+
+    def __init__(
+            self,
+            schmidt_coefficients: npt.NDArray[np.floating],
+            modes1: npt.NDArray[np.inexact],
+            modes2: npt.NDArray[np.inexact]
+    ):
+        """Initialize the Schmidt decomposition.
+
+        Args:
+            schmidt_coefficients (numpy.ndarray): Schmidt coefficients of shape ``(k,)``.
+            modes1 (numpy.ndarray): Eigenvectors of the first subsystem as columns, of shape ``(d1, k)``.
+            modes2 (numpy.ndarray): Eigenvectors of the second subsystem as columns, of shape ``(d2, k)``.
+        """
+        self._schmidt_coefficients = schmidt_coefficients
+        self._modes1 = modes1
+        self._modes2 = modes2
+
+    @property
+    def schmidt_coefficients(self) -> npt.NDArray[np.floating]:
+        """Schmidt coefficients, in descending order.
+
+        Returns:
+            numpy.ndarray: 1-D array of Schmidt coefficients.
+        """
+        return self._schmidt_coefficients
+
+    @property
+    def modes1(self) -> npt.NDArray[np.inexact]:
+        """Eigenvectors of the first subsystem, one per column.
+
+        Returns:
+            numpy.ndarray: Matrix of shape ``(d1, k)``.
+        """
+        return self._modes1
+
+    @property
+    def modes2(self) -> npt.NDArray[np.inexact]:
+        """Eigenvectors of the second subsystem, one per column.
+
+        Returns:
+            numpy.ndarray: Matrix of shape ``(d2, k)``.
+        """
+        return self._modes2
+
+    def mode1(self, k: int) -> npt.NDArray[np.inexact]:
+        """Return the eigenvector of the first subsystem for the ``k``-th Schmidt coefficient.
+
+        Args:
+            k (int): Index of the Schmidt mode.
+
+        Returns:
+            numpy.ndarray: View of the ``k``-th column of :attr:`modes1`.
+        """
+        return self._modes1[:, k]
+
+    def mode2(self, k: int) -> npt.NDArray[np.inexact]:
+        """Return the eigenvector of the second subsystem for the ``k``-th Schmidt coefficient.
+
+        Args:
+            k (int): Index of the Schmidt mode.
+
+        Returns:
+            numpy.ndarray: View of the ``k``-th column of :attr:`modes2`.
+        """
+        return self._modes2[:, k]
+
+    def __len__(self) -> int:
+        return len(self._schmidt_coefficients)
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[DiscreteSchmidtMode, "SchmidtDecomposition"]:
+        if isinstance(item, slice):
+            return SchmidtDecomposition(
+                self._schmidt_coefficients[item], self._modes1[:, item], self._modes2[:, item]
+            )
+        return DiscreteSchmidtMode(
+            schmidt_coef=self._schmidt_coefficients[item],
+            mode1=self._modes1[:, item],
+            mode2=self._modes2[:, item]
+        )
+
+    def __iter__(self) -> Iterator[DiscreteSchmidtMode]:
+        for k in range(len(self)):
+            yield self[k]
+
+    def __repr__(self) -> str:
+        return f"SchmidtDecomposition(schmidt_coefficients={self._schmidt_coefficients!r}, " \
+               f"dims=({self._modes1.shape[0]}, {self._modes2.shape[0]}))"
+
+
+class MatrixProductState:
+    """Matrix product state (tensor train) of a discrete multipartite quantum system.
+
+    The state of :math:`N` parties is stored as :math:`N` site tensors :math:`A^{[k]}` of
+    shapes ``(r_{k-1}, d_k, r_k)``, with :math:`r_{-1} = r_{N-1} = 1`, such that
+
+    .. math::
+
+        \\psi_{i_0 i_1 \\ldots i_{N-1}} = A^{[0]}_{i_0} A^{[1]}_{i_1} \\cdots A^{[N-1]}_{i_{N-1}},
+
+    where all the site tensors but the last are left-canonical (isometries).  The Schmidt
+    coefficients of the :math:`N - 1` bipartitions ``(0..k | k+1..N-1)`` are kept alongside.
+
+    Attributes:
+        tensors (list[numpy.ndarray]): The :math:`N` site tensors.
+        schmidt_coefficients (list[numpy.ndarray]): The retained Schmidt coefficients of every
+            cut, in descending order; the ``k``-th array is the spectrum of the cut after party ``k``.
+        discarded_weights (numpy.ndarray): Fraction of the squared norm discarded at every cut
+            by the truncation, of shape ``(N - 1,)``.
+    """
+
+    __slots__ = ('_tensors', '_schmidt_coefficients', '_discarded_weights')
+
+    def __init__(
+            self,
+            tensors: list[npt.NDArray[np.inexact]],
+            schmidt_coefficients: list[npt.NDArray[np.floating]],
+            discarded_weights: npt.NDArray[np.floating]
+    ):
+        """Initialize the matrix product state.
+
+        Args:
+            tensors (list[numpy.ndarray]): Site tensors of shapes ``(r_{k-1}, d_k, r_k)``.
+            schmidt_coefficients (list[numpy.ndarray]): Schmidt coefficients of the ``N - 1`` cuts.
+            discarded_weights (numpy.ndarray): Discarded weights of the ``N - 1`` cuts.
+        """
+        self._tensors = tensors
+        self._schmidt_coefficients = schmidt_coefficients
+        self._discarded_weights = discarded_weights
+
+    @property
+    def tensors(self) -> list[npt.NDArray[np.inexact]]:
+        """Site tensors, of shapes ``(r_{k-1}, d_k, r_k)``.
+
+        Returns:
+            list[numpy.ndarray]: The :math:`N` site tensors.
+        """
+        return self._tensors
+
+    @property
+    def schmidt_coefficients(self) -> list[npt.NDArray[np.floating]]:
+        """Schmidt coefficients of the cuts between consecutive parties, in descending order.
+
+        Returns:
+            list[numpy.ndarray]: The :math:`N - 1` entanglement spectra.
+        """
+        return self._schmidt_coefficients
+
+    @property
+    def discarded_weights(self) -> npt.NDArray[np.floating]:
+        """Fraction of the squared norm discarded at every cut.
+
+        Returns:
+            numpy.ndarray: Array of shape ``(N - 1,)``.
+        """
+        return self._discarded_weights
+
+    @property
+    def physical_dimensions(self) -> tuple[int, ...]:
+        """Dimensions :math:`d_k` of the parties.
+
+        Returns:
+            tuple[int, ...]: The :math:`N` local dimensions.
+        """
+        return tuple(tensor.shape[1] for tensor in self._tensors)
+
+    @property
+    def bond_dimensions(self) -> tuple[int, ...]:
+        """Bond dimensions :math:`r_k` between consecutive parties.
+
+        Returns:
+            tuple[int, ...]: The :math:`N - 1` bond dimensions.
+        """
+        return tuple(tensor.shape[2] for tensor in self._tensors[:-1])
+
+    def to_tensor(self) -> npt.NDArray[np.inexact]:
+        """Contract the site tensors back into the full state tensor.
+
+        Returns:
+            numpy.ndarray: Array of shape ``(d_0, ..., d_{N-1})``.
+        """
+        state = self._tensors[0].reshape(-1, self._tensors[0].shape[2])
+        for tensor in self._tensors[1:]:
+            state = (state @ tensor.reshape(tensor.shape[0], -1)).reshape(-1, tensor.shape[2])
+        return state.reshape(self.physical_dimensions)
+
+    def __len__(self) -> int:
+        return len(self._tensors)
+
+    def __iter__(self) -> Iterator[npt.NDArray[np.inexact]]:
+        return iter(self._tensors)
+
+    def __repr__(self) -> str:
+        return f"MatrixProductState(physical_dimensions={self.physical_dimensions}, " \
+               f"bond_dimensions={self.bond_dimensions})"
@@ -1,14 +1,29 @@
 
+import warnings
+
 import numpy as np
 from scipy.integrate import quad
 import pytest
 
+from pyqentangle.core.continuous import continuous_schmidt_decomposition
 from pyqentangle.core.wavefunctions import AnalyticMultiDimWaveFunction
-from pyqentangle.entangle import ContinuousSchmidtDecomposer
+from pyqentangle.entangle import ContinuousSchmidtDecomposer, GaussianSchmidtDecomposer
+from pyqentangle.quantumstates.harmonics import correlated_bipartite_gaussian_wavefcn
 
 
 normsq = lambda x: x*np.conj(x)
 
+# two coupled harmonic oscillators, whose Schmidt coefficients are sqrt(1 - rho^2) rho^n
+coupled_oscillators = AnalyticMultiDimWaveFunction(
+    lambda x: np.exp(-0.5 * (x[0] + x[1]) ** 2) * np.exp(-(x[0] - x[1]) ** 2) * np.sqrt(np.sqrt(8.) / np.pi),
+    vectorized=True
+)
+coupled_oscillators_rho = 3 - 2*np.sqrt(2)
+
+
+def coupled_oscillators_coef(n):
+    return np.sqrt(1 - coupled_oscillators_rho ** 2) * coupled_oscillators_rho ** n
+
 
 def test_entangled_oscillators():
     wavefcn = AnalyticMultiDimWaveFunction(
@@ -41,3 +56,107 @@ def test_entangled_oscillators():
         )
         assert norm1 == pytest.approx(1., abs=1e-2)
         assert norm2 == pytest.approx(1., abs=1e-2)
+
+
+def test_entangled_oscillators_randomized():
+    decompositions = ContinuousSchmidtDecomposer(
+        coupled_oscillators, -10., 10., -10., 10., keep=5, approach='randomized'
+    ).modes()
+    assert len(decompositions) == 5
+    for i in range(5):
+        assert decompositions[i].schmidt_coef == pytest.approx(coupled_oscillators_coef(i))
+
+
+@pytest.mark.parametrize('interpolation', ['cubic', 'sinc'])
+def test_entangled_oscillators_small_grid_interpolation(interpolation):
+    # the first Schmidt mode is the Gaussian sqrt(alpha) pi^(-1/4) exp(-alpha^2 x^2 / 2), with alpha^2 = 2 sqrt(2)
+    alpha = np.power(2., 0.75)
+    expected_mode = lambda x: np.sqrt(alpha) * np.exp(-0.5 * alpha**2 * x**2) / np.sqrt(np.sqrt(np.pi))
+    xs = np.linspace(-4.9, 4.9, 301)
+
+    decompositions = ContinuousSchmidtDecomposer(
+        coupled_oscillators, -10., 10., -10., 10., nb_x1=41, nb_x2=41, keep=3, interpolation=interpolation
+    ).modes()
+    mode = decompositions[0].wavefunction1(xs)
+    mode = mode * np.sign(np.real(mode[150]))
+    np.testing.assert_allclose(np.real(mode), expected_mode(xs), atol=1e-2)
+
+
+@pytest.mark.parametrize('grid, nb_x', [('chebyshev', 80), ('gauss-hermite', 40)])
+def test_entangled_oscillators_quadrature_grid(grid, nb_x):
+    decompositions = ContinuousSchmidtDecomposer(
+        coupled_oscillators, -8., 8., -8., 8., nb_x1=nb_x, nb_x2=nb_x, keep=6, approach='numpy', grid=grid
+    ).modes()
+    for i in range(6):
+        assert decompositions[i].schmidt_coef == pytest.approx(coupled_oscillators_coef(i), rel=1e-5)
+
+    schmidt_fcn1 = decompositions[0].wavefunction1
+    norm1, err1 = quad(lambda x1: np.real(normsq(schmidt_fcn1(x1))), -8, 8, limit=200)
+    assert norm1 == pytest.approx(1., abs=1e-3)
+
+
+@pytest.mark.parametrize('storage', ['memory', 'memmap'])
+def test_entangled_oscillators_out_of_core(storage, tmp_path):
+    if storage == 'memmap':
+        tensor = np.memmap(tmp_path / 'tensor.dat', dtype=np.complex128, mode='w+', shape=(150, 120))
+    else:
+        tensor = np.zeros((150, 120), dtype=np.complex128)
+    decompositions = ContinuousSchmidtDecomposer(
+        coupled_oscillators, -10., 10., -10., 10., nb_x1=150, nb_x2=120, keep=4, approach='randomized',
+        out=tensor, block_size=32
+    ).modes()
+    assert len(decompositions) == 4
+    for i in range(4):
+        assert coupled_oscillators_coef(i) == pytest.approx(decompositions[i].schmidt_coef, rel=1e-3)
+    assert np.abs(tensor[75, 60]) > 0.
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+def test_entangled_oscillators_real_single_precision(dtype):
+    decompositions = ContinuousSchmidtDecomposer(
+        coupled_oscillators, -10., 10., -10., 10., keep=5, approach='numpy', dtype=dtype
+    ).modes()
+    for i in range(5):
+        assert coupled_oscillators_coef(i) == pytest.approx(decompositions[i].schmidt_coef, rel=1e-3)
+    # real eigenmodes are interpolated as real functions, in double precision
+    assert decompositions[0].wavefunction1(np.linspace(-1., 1., 5)).dtype == np.float64
+
+
+@pytest.mark.parametrize('offdiag', [0.5, -0.5, 0.])
+def test_gaussian_closed_form_decomposition(offdiag):
+    covmatrix = np.array([[2., offdiag], [offdiag, 1.]])
+    wavefcn = correlated_bipartite_gaussian_wavefcn(covmatrix)
+    modes = GaussianSchmidtDecomposer(wavefcn, keep=30).modes()
+    assert len(modes) == 30
+    assert sum(mode.schmidt_coef ** 2 for mode in modes) == pytest.approx(1.)
+
+    # the modes reconstruct the state
+    for x1, x2 in [(0.3, -0.7), (-1.2, 0.4)]:
+        reconstructed = sum(
+            mode.schmidt_coef * mode.wavefunction1(x1)[0] * mode.wavefunction2(x2)[0] for mode in modes
+        )
+        assert reconstructed == pytest.approx(wavefcn(np.array([x1, x2])))
+
+    # agreement with the numerical decomposition
+    numerical_modes = ContinuousSchmidtDecomposer(
+        wavefcn, -10., 10., -10., 10., nb_x1=150, nb_x2=150, keep=4, approach='numpy'
+    ).modes()
+    for mode, numerical_mode in zip(modes, numerical_modes):
+        assert mode.schmidt_coef == pytest.approx(numerical_mode.schmidt_coef, abs=1e-8)
+
+    with pytest.raises(TypeError):
+        GaussianSchmidtDecomposer(AnalyticMultiDimWaveFunction(lambda x: 1.))
+
+
+def test_gram_rank_deficient_grid():
+    # a separable state has a single non-zero Schmidt coefficient
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        modes = continuous_schmidt_decomposition(
+            lambda x: np.exp(-x[0] ** 2 - x[1] ** 2), -5., 5., -5., 5., nb_x1=10, nb_x2=30, approach='gram'
+        )
+    assert modes[0][0] == pytest.approx(1.)
+    xs = np.linspace(-4., 4., 9)
+    for coef, wavefunction1, wavefunction2 in modes:
+        assert np.all(np.isfinite(wavefunction1(xs)))
+        assert np.all(np.isfinite(wavefunction2(xs)))
@@ -0,0 +1,81 @@
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from pyqentangle.core.wavefunctions import AnalyticMultiDimWaveFunction
+from pyqentangle.entangle import ContinuousSchmidtDecomposer, DiscreteSchmidtDecomposer
+
+
+class CountingFunction:
+    def __init__(self):
+        self.nb_calls = 0
+
+    def __call__(self, x):
+        self.nb_calls += 1
+        return np.exp(-0.5 * (x[0] + x[1]) ** 2) * np.exp(-(x[0] - x[1]) ** 2) * np.sqrt(np.sqrt(8.) / np.pi)
+
+
+def test_continuous_memoization():
+    fcn = CountingFunction()
+    decomposer = ContinuousSchmidtDecomposer(
+        AnalyticMultiDimWaveFunction(fcn, vectorized=True), -10., 10., -10., 10., keep=5, lazy=True
+    )
+    assert not decomposer.calculated
+    assert fcn.nb_calls == 0
+
+    modes = decomposer.modes()
+    assert decomposer.calculated
+    assert fcn.nb_calls == 1
+    assert decomposer.modes() is modes
+    assert len(list(decomposer.mode_iterator())) == 5
+    assert fcn.nb_calls == 1
+
+    decomposer.invalidate()
+    assert not decomposer.calculated
+    new_modes = decomposer.modes()
+    assert new_modes is not modes
+    assert fcn.nb_calls == 2
+    assert new_modes[0].schmidt_coef == pytest.approx(modes[0].schmidt_coef)
+
+
+def test_compute_async():
+    tensor = np.array([[0., np.sqrt(0.6)*1j], [np.sqrt(0.4)*1j, 0.]])
+    decomposer = DiscreteSchmidtDecomposer(tensor, lazy=True, approach='numpy')
+    future = decomposer.compute_async()
+    assert decomposer.compute_async() is future
+    modes = decomposer.modes()
+    assert decomposer.calculated
+    assert future.result() is modes
+    assert modes[0].schmidt_coef == pytest.approx(np.sqrt(0.6))
+    assert decomposer.compute_async().result() is modes
+
+    fcn = CountingFunction()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        decomposer = ContinuousSchmidtDecomposer(fcn, -10., 10., -10., 10., nb_x1=30, nb_x2=30, keep=3, lazy=True)
+        decomposer.compute_async(executor)
+        assert len(decomposer.modes()) == 3
+    assert fcn.nb_calls == 900
+
+
+def test_failed_async_computation_is_not_cached():
+    nb_calls = []
+
+    def flaky(x):
+        nb_calls.append(1)
+        if len(nb_calls) == 1:
+            raise RuntimeError("transient failure")
+        return np.exp(-0.5 * (x[0] + x[1]) ** 2) * np.exp(-(x[0] - x[1]) ** 2) * np.sqrt(np.sqrt(8.) / np.pi)
+
+    decomposer = ContinuousSchmidtDecomposer(
+        AnalyticMultiDimWaveFunction(flaky, vectorized=True), -10., 10., -10., 10., keep=3, lazy=True
+    )
+    decomposer.compute_async()
+    with pytest.raises(RuntimeError):
+        decomposer.modes()
+    assert not decomposer.calculated
+
+    # the next access recomputes instead of re-raising the cached failure
+    assert len(list(decomposer.mode_iterator())) == 3
+    assert decomposer.calculated
@@ -13,3 +13,140 @@ def test_schmidt_decomposition():
         assert pyqentangle.entanglement_entropy(modes) == pytest.approx(0.6730116670092563)
         assert pyqentangle.participation_ratio(modes) == pytest.approx(1.9230769230769227)
         assert pyqentangle.negativity(tensor) == pytest.approx(0.489897948556636)
+
+
+def test_randomized_schmidt_decomposition():
+    rng = np.random.default_rng(42)
+    # low-rank state with decaying Schmidt coefficients
+    coefs = 0.5 ** np.arange(8)
+    vecs1, _ = np.linalg.qr(rng.standard_normal((200, 8)) + 1j * rng.standard_normal((200, 8)))
+    vecs2, _ = np.linalg.qr(rng.standard_normal((150, 8)) + 1j * rng.standard_normal((150, 8)))
+    tensor = vecs1 @ np.diag(coefs) @ vecs2.T
+    tensor /= np.linalg.norm(tensor)
+
+    full_modes = pyqentangle.DiscreteSchmidtDecomposer(tensor, approach='numpy').modes()
+    randomized_modes = pyqentangle.DiscreteSchmidtDecomposer(tensor, approach='randomized', keep=5).modes()
+    assert len(randomized_modes) == 5
+    for full_mode, randomized_mode in zip(full_modes, randomized_modes):
+        assert randomized_mode.schmidt_coef == pytest.approx(full_mode.schmidt_coef)
+        # eigenmodes are defined up to a phase
+        overlap = np.vdot(full_mode.mode1, randomized_mode.mode1)
+        assert np.abs(overlap) == pytest.approx(1.)
+        np.testing.assert_array_almost_equal(randomized_mode.mode2 * overlap, full_mode.mode2)
+
+    # reading the tensor in blocks of rows gives the same decomposition
+    unblocked = pyqentangle.core.schmidt.schmidt_decomposition_randomized(tensor, 5, random_state=1)
+    blocked = pyqentangle.core.schmidt.schmidt_decomposition_randomized(tensor, 5, random_state=1, block_size=16)
+    np.testing.assert_allclose(blocked.schmidt_coefficients, unblocked.schmidt_coefficients)
+    np.testing.assert_allclose(blocked.modes1, unblocked.modes1, atol=1e-10)
+    np.testing.assert_allclose(blocked.modes2, unblocked.modes2, atol=1e-10)
+
+
+def test_array_backed_schmidt_decomposition():
+    tensor = np.array([[np.sqrt(0.5), 0.0, 0.0], [0.0, np.sqrt(0.3)*1.j, 0.0], [0.0, 0.0, np.sqrt(0.2)]])
+    decomposition = pyqentangle.schmidt_decomposition(tensor, approach='numpy')
+    assert isinstance(decomposition, pyqentangle.schemas.SchmidtDecomposition)
+    assert len(decomposition) == 3
+    np.testing.assert_array_almost_equal(decomposition.schmidt_coefficients, np.sqrt([0.5, 0.3, 0.2]))
+
+    # modes are views of the mode matrices
+    assert np.shares_memory(decomposition.mode1(1), decomposition.modes1)
+    assert np.shares_memory(decomposition[1].mode2, decomposition.modes2)
+
+    modes = list(decomposition)
+    assert all(isinstance(mode, pyqentangle.schemas.DiscreteSchmidtMode) for mode in modes)
+    reconstructed = sum(mode.schmidt_coef * np.outer(mode.mode1, mode.mode2) for mode in modes)
+    np.testing.assert_array_almost_equal(reconstructed, tensor)
+
+    truncated = decomposition[:2]
+    assert isinstance(truncated, pyqentangle.schemas.SchmidtDecomposition)
+    assert len(truncated) == 2
+    assert np.shares_memory(truncated.modes1, decomposition.modes1)
+
+    assert pyqentangle.entanglement_entropy(decomposition) == \
+        pytest.approx(pyqentangle.entanglement_entropy(modes))
+
+    # the modes unpack as (coefficient, mode1, mode2) tuples
+    for (coef, mode1, mode2), mode in zip(decomposition, modes):
+        assert coef == mode.schmidt_coef
+        np.testing.assert_array_equal(mode1, mode.mode1)
+        np.testing.assert_array_equal(mode2, mode.mode2)
+        assert len(mode) == 3
+        assert mode[0] == mode.schmidt_coef
+        np.testing.assert_array_equal(mode[1], mode.mode1)
+        np.testing.assert_array_equal(mode[-1], mode.mode2)
+
+
+@pytest.mark.parametrize('approach', ['numpy', 'tensornetwork', 'randomized', 'gram'])
+def test_schmidt_decomposition_precision(approach):
+    singlet = pyqentangle.quantumstates.bipartite.create_singlet() / np.sqrt(2)
+    real_modes = pyqentangle.schmidt_decomposition(singlet, approach=approach)
+    assert real_modes.modes1.dtype == np.float64
+    np.testing.assert_allclose(real_modes.schmidt_coefficients, [np.sqrt(0.5)] * 2)
+
+    single_modes = pyqentangle.schmidt_decomposition(singlet, approach=approach, dtype=np.complex64)
+    assert single_modes.modes1.dtype == np.complex64
+    assert single_modes.schmidt_coefficients.dtype == np.float32
+    np.testing.assert_allclose(single_modes.schmidt_coefficients, [np.sqrt(0.5)] * 2, rtol=1e-6)
+    assert pyqentangle.entanglement_entropy(single_modes) == pytest.approx(np.log(2.), rel=1e-6)
+
+
+@pytest.mark.parametrize('shape', [(6, 6), (4, 50), (50, 4)])
+@pytest.mark.parametrize('method', ['auto', 'svd', 'eigvalsh'])
+def test_schmidt_coefficients_only(shape, method):
+    rng = np.random.default_rng(3)
+    tensor = rng.standard_normal(shape) + 1j * rng.standard_normal(shape)
+    tensor /= np.linalg.norm(tensor)
+    expected = pyqentangle.schmidt_decomposition(tensor, approach='numpy').schmidt_coefficients
+
+    coefs = pyqentangle.schmidt_coefficients_only(tensor, method=method)
+    np.testing.assert_allclose(coefs, expected, atol=1e-12)
+    np.testing.assert_allclose(pyqentangle.schmidt_coefficients_only(tensor, keep=2, method=method), expected[:2])
+
+    with pytest.raises(ValueError):
+        pyqentangle.schmidt_coefficients_only(tensor, method='qr')
+
+
+def test_schmidt_coefficients_only_auto_resolves_small_coefficients():
+    # a tall state whose smallest Schmidt coefficients are lost in the eigenvalues of its Gram matrix
+    rng = np.random.default_rng(5)
+    expected = np.array([1., 1e-6, 1e-10])
+    modes1 = np.linalg.qr(rng.standard_normal((3, 3)))[0]
+    modes2 = np.linalg.qr(rng.standard_normal((60, 3)))[0]
+    tensor = (modes1 * expected) @ modes2.T
+
+    np.testing.assert_allclose(pyqentangle.schmidt_coefficients_only(tensor, method='auto'), expected, rtol=1e-6)
+    assert pyqentangle.schmidt_coefficients_only(tensor, method='eigvalsh')[2] != pytest.approx(1e-10, rel=1e-2)
+
+
+def test_decomposer_without_modes():
+    tensor = np.array([[0., np.sqrt(0.7)], [np.sqrt(0.3), 0.]])
+    decomposer = pyqentangle.DiscreteSchmidtDecomposer(tensor, compute_modes=False)
+    np.testing.assert_allclose(decomposer.schmidt_coefficients(), [np.sqrt(0.7), np.sqrt(0.3)])
+    assert pyqentangle.entanglement_entropy(decomposer.schmidt_coefficients()) == \
+        pytest.approx(pyqentangle.entanglement_entropy(pyqentangle.DiscreteSchmidtDecomposer(tensor).modes()))
+    with pytest.raises(ValueError):
+        decomposer.modes()
+
+
+@pytest.mark.parametrize('shape', [(3, 400), (400, 3), (5, 5)])
+def test_gram_schmidt_decomposition(shape):
+    rng = np.random.default_rng(5)
+    tensor = rng.standard_normal(shape) + 1j * rng.standard_normal(shape)
+    tensor /= np.linalg.norm(tensor)
+    full = pyqentangle.schmidt_decomposition(tensor, approach='numpy')
+
+    gram = pyqentangle.schmidt_decomposition(tensor, approach='gram')
+    assert gram.modes1.shape == full.modes1.shape
+    assert gram.modes2.shape == full.modes2.shape
+    np.testing.assert_allclose(gram.schmidt_coefficients, full.schmidt_coefficients, atol=1e-12)
+    np.testing.assert_allclose(gram.modes1 * gram.schmidt_coefficients @ gram.modes2.T, tensor, atol=1e-12)
+    np.testing.assert_allclose(gram.modes2.conj().T @ gram.modes2, np.eye(min(shape)), atol=1e-10)
+
+    truncated = pyqentangle.schmidt_decomposition(tensor, approach='gram', keep=2)
+    assert len(truncated) == 2
+    for full_mode, gram_mode in zip(full, truncated):
+        # eigenmodes are defined up to a phase
+        overlap = np.vdot(full_mode.mode1, gram_mode.mode1)
+        assert np.abs(overlap) == pytest.approx(1.)
+        np.testing.assert_allclose(gram_mode.mode2 * overlap, full_mode.mode2, atol=1e-10)
@@ -0,0 +1,123 @@
+
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from pyqentangle.core.continuous import discretize_continuous_bipartitesys, quadrature_grid
+from pyqentangle.core.wavefunctions import AnalyticMultiDimWaveFunction
+
+
+def test_vectorized_discretization():
+    f = lambda x: np.exp(-0.5 * (x[0] + x[1]) ** 2) * np.exp(-(x[0] - x[1]) ** 2) * (1 + 0.5j * x[0])
+    scalar_wavefcn = AnalyticMultiDimWaveFunction(f)
+    vectorized_wavefcn = AnalyticMultiDimWaveFunction(f, vectorized=True)
+    assert not scalar_wavefcn.vectorized
+    assert vectorized_wavefcn.vectorized
+
+    scalar_tensor = discretize_continuous_bipartitesys(scalar_wavefcn, -5, 5, -4, 4, nb_x1=30, nb_x2=20)
+    vectorized_tensor = discretize_continuous_bipartitesys(vectorized_wavefcn, -5, 5, -4, 4, nb_x1=30, nb_x2=20)
+    assert vectorized_tensor.shape == (30, 20)
+    np.testing.assert_array_almost_equal(scalar_tensor, vectorized_tensor)
+
+
+def test_vectorized_arithmetics():
+    wavefcn1 = AnalyticMultiDimWaveFunction(lambda x: np.exp(-x[0]**2 - x[1]**2), vectorized=True)
+    wavefcn2 = AnalyticMultiDimWaveFunction(lambda x: 1.0, vectorized=True)
+    combined = 0.5 * wavefcn1 + wavefcn2
+    assert combined.vectorized
+    assert not (wavefcn1 + AnalyticMultiDimWaveFunction(lambda x: 1.0)).vectorized
+
+    tensor = discretize_continuous_bipartitesys(combined, -1, 1, -1, 1, nb_x1=3, nb_x2=3)
+    assert tensor[1, 1] == 1.5
+    assert tensor[0, 0] == 0.5 * np.exp(-2.) + 1.
+
+
+def test_quadrature_grids():
+    for nb_x in [5, 6, 21]:
+        xarray, weights = quadrature_grid(-1., 3., nb_x, grid='chebyshev')
+        assert xarray[0] == pytest.approx(-1.)
+        assert xarray[-1] == pytest.approx(3.)
+        assert np.all(np.diff(xarray) > 0)
+        assert np.sum(weights) == pytest.approx(4.)
+        assert np.sum(weights * xarray**4) == pytest.approx((3.**5 + 1.) / 5.)
+
+    for nb_x in [30, 1000]:
+        xarray, weights = quadrature_grid(-8., 8., nb_x, grid='gauss-hermite')
+        assert xarray[0] == pytest.approx(-8.)
+        assert xarray[-1] == pytest.approx(8.)
+        assert np.all(np.isfinite(weights))
+        assert np.sum(weights * np.exp(-xarray**2)) == pytest.approx(np.sqrt(np.pi))
+
+    xarray, weights = quadrature_grid(-2., 2., 11)
+    np.testing.assert_array_almost_equal(xarray, np.linspace(-2., 2., 11))
+    np.testing.assert_array_almost_equal(weights, np.full(11, 0.4))
+
+    with pytest.raises(ValueError):
+        quadrature_grid(-2., 2., 11, grid='legendre')
+
+
+def test_blocked_discretization(tmp_path):
+    wavefcn = AnalyticMultiDimWaveFunction(
+        lambda x: np.exp(-0.5 * (x[0] + x[1]) ** 2) * np.exp(-(x[0] - x[1]) ** 2) * (1 + 0.5j * x[0]),
+        vectorized=True
+    )
+    tensor = discretize_continuous_bipartitesys(wavefcn, -5, 5, -4, 4, nb_x1=30, nb_x2=20)
+
+    out = np.memmap(tmp_path / 'tensor.dat', dtype=np.complex128, mode='w+', shape=(30, 20))
+    blocked_tensor = discretize_continuous_bipartitesys(
+        wavefcn, -5, 5, -4, 4, nb_x1=30, nb_x2=20, out=out, block_size=7
+    )
+    assert blocked_tensor is out
+    np.testing.assert_array_equal(blocked_tensor, tensor)
+
+    with pytest.raises(ValueError):
+        discretize_continuous_bipartitesys(wavefcn, -5, 5, -4, 4, nb_x1=30, nb_x2=20, out=np.empty((20, 30)))
+
+
+def _picklable_wavefcn(x):
+    return np.exp(-0.5 * (x[0] + x[1]) ** 2) * np.exp(-(x[0] - x[1]) ** 2) * (1 + 0.5j * x[0])
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='fork is not available')
+def test_parallel_discretization(tmp_path):
+    f = lambda x: np.exp(-0.5 * (x[0] + x[1]) ** 2) * np.exp(-(x[0] - x[1]) ** 2) * (1 + 0.5j * x[0])
+    scalar_wavefcn = AnalyticMultiDimWaveFunction(f)
+    vectorized_wavefcn = AnalyticMultiDimWaveFunction(f, vectorized=True)
+    tensor = discretize_continuous_bipartitesys(vectorized_wavefcn, -5, 5, -4, 4, nb_x1=30, nb_x2=20)
+
+    # lambda functions need not be picklable for a forked process pool
+    fork_context = multiprocessing.get_context('fork')
+    for wavefcn in [scalar_wavefcn, vectorized_wavefcn]:
+        parallel_tensor = discretize_continuous_bipartitesys(
+            wavefcn, -5, 5, -4, 4, nb_x1=30, nb_x2=20, n_jobs=2, block_size=4, mp_context=fork_context
+        )
+        np.testing.assert_array_almost_equal(parallel_tensor, tensor)
+
+    # tiles are written directly into a memory-mapped output
+    out = np.memmap(tmp_path / 'tensor.dat', dtype=np.complex128, mode='w+', shape=(30, 20))
+    discretize_continuous_bipartitesys(
+        vectorized_wavefcn, -5, 5, -4, 4, nb_x1=30, nb_x2=20, out=out, n_jobs=2, mp_context=fork_context
+    )
+    np.testing.assert_array_equal(out, tensor)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        threaded_tensor = discretize_continuous_bipartitesys(
+            vectorized_wavefcn, -5, 5, -4, 4, nb_x1=30, nb_x2=20, executor=executor
+        )
+    np.testing.assert_array_equal(threaded_tensor, tensor)
+
+
+def test_parallel_discretization_spawned_workers():
+    wavefcn = AnalyticMultiDimWaveFunction(_picklable_wavefcn, vectorized=True)
+    tensor = discretize_continuous_bipartitesys(wavefcn, -5, 5, -4, 4, nb_x1=30, nb_x2=20)
+
+    # a picklable function is sent to workers started without fork
+    parallel_tensor = discretize_continuous_bipartitesys(
+        wavefcn, -5, 5, -4, 4, nb_x1=30, nb_x2=20, n_jobs=2, mp_context=multiprocessing.get_context('spawn')
+    )
+    np.testing.assert_array_equal(parallel_tensor, tensor)
+
+    with pytest.raises(ValueError):
+        discretize_continuous_bipartitesys(wavefcn, -5, 5, -4, 4, nb_x1=30, nb_x2=20, n_jobs=0)
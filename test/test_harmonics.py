@@ -1,9 +1,13 @@
 
+from math import factorial
+
 import numpy as np
-from scipy.integrate import dblquad
+from scipy.integrate import dblquad, trapezoid
+from scipy.special import hermite
 import pytest
 
-from pyqentangle.quantumstates.harmonics import disentangled_gaussian_wavefcn, coupled_excited_harmonics, correlated_bipartite_gaussian_wavefcn
+from pyqentangle.quantumstates.harmonics import disentangled_gaussian_wavefcn, coupled_excited_harmonics, correlated_bipartite_gaussian_wavefcn, \
+    harmonic_wavefcn, hermite_function, correlated_bipartite_gaussian_value
 
 
 normsq = lambda x: x*np.conj(x)
@@ -29,3 +33,43 @@ def test_excited_states():
         norm, err = dblquad(lambda x1, x2: normsq(wavefcn(np.array([x1, x2]))),
                             -100, 100, lambda x2: -100, lambda x2: 100)
         assert norm == pytest.approx(1, abs=abs(err))
+
+
+def test_hermite_functions():
+    xs = np.linspace(-6., 6., 101)
+    for n in range(6):
+        expected = hermite(n)(xs) * np.exp(-0.5 * xs * xs) / np.sqrt(2.**n * factorial(n) * np.sqrt(np.pi))
+        np.testing.assert_allclose(harmonic_wavefcn(n)(xs), expected, atol=1e-12)
+    assert hermite_function(3, 0.7) == pytest.approx(harmonic_wavefcn(3)(np.array([0.7]))[0])
+
+    # stable beyond the overflow of 2^n n!, and beyond the underflow of exp(-x^2/2)
+    n = 400
+    xs = np.linspace(-35., 35., 20001)
+    values = hermite_function(n, xs)
+    assert np.all(np.isfinite(values))
+    assert trapezoid(values * values, xs) == pytest.approx(1., rel=1e-6)
+    assert trapezoid(values * hermite_function(n - 2, xs), xs) == pytest.approx(0., abs=1e-6)
+
+
+def test_vectorized_excited_states():
+    coordinates = np.random.default_rng(0).uniform(-3., 3., (50, 2))
+    for n in range(4):
+        wavefcn = coupled_excited_harmonics(n)
+        assert wavefcn.vectorized
+        expected = np.array([
+            hermite_function(0, 0.5 * (x1 + x2)) * hermite_function(n, x1 - x2) for x1, x2 in coordinates
+        ])
+        np.testing.assert_allclose(wavefcn(coordinates), expected)
+
+
+def test_vectorized_correlated_bipartite_gaussian():
+    covmatrix = np.array([[2., 0.5], [0.5, 1.]])
+    wavefcn = correlated_bipartite_gaussian_wavefcn(covmatrix)
+    assert wavefcn.vectorized
+    coordinates = np.random.default_rng(1).uniform(-3., 3., (40, 2))
+    expected = np.array([correlated_bipartite_gaussian_value(covmatrix, x1, x2) for x1, x2 in coordinates])
+    np.testing.assert_allclose(wavefcn(coordinates), expected)
+    assert wavefcn(coordinates[0]) == pytest.approx(expected[0])
+
+    quadratic_form = coordinates[0] @ covmatrix @ coordinates[0]
+    assert expected[0] == pytest.approx(np.exp(-0.25 * quadratic_form) * np.sqrt(np.sqrt(np.linalg.det(covmatrix)) / (2 * np.pi)))
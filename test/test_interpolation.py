@@ -4,6 +4,7 @@ import pytest
 
 from pyqentangle.core.interpolate import numerical_continuous_function, numerical_continuous_interpolation
 from pyqentangle.core.wavefunctions import InterpolatingWaveFunction
+from pyqentangle.core.exceptions import OutOfRangeException, UnequalLengthException
 
 
 def test_interpolation():
@@ -45,3 +46,60 @@ def test_interpolation_complex():
     assert wavefunction(1.5) == pytest.approx(1.5+1.5j)
     assert wavefunction(2.5) == pytest.approx(2.5+2.5j)
     np.testing.assert_array_almost_equal(wavefunction(np.array([1.5, 2.5])), np.array([1.5+1.5j, 2.5+2.5j]))
+
+
+def test_interpolation_batch():
+    xarray = np.linspace(-3., 3., 61)
+    yarray = np.exp(-xarray**2) * (1. + 0.5j * xarray)
+    wavefunction = InterpolatingWaveFunction(xarray, yarray)
+    xs = np.random.default_rng(0).uniform(-3., 3., size=(4, 25))
+    xs[0, 0], xs[0, 1] = -3., 3.
+    values = wavefunction(xs)
+    assert values.shape == (4, 25)
+    expected = np.interp(xs, xarray, np.real(yarray)) + 1j * np.interp(xs, xarray, np.imag(yarray))
+    np.testing.assert_array_almost_equal(values, expected)
+    assert wavefunction(3.) == pytest.approx(yarray[-1])
+
+    with pytest.raises(OutOfRangeException):
+        wavefunction(np.array([0., 3.5]))
+    with pytest.raises(OutOfRangeException):
+        wavefunction(-3.1)
+    with pytest.raises(UnequalLengthException):
+        InterpolatingWaveFunction(xarray, yarray[:-1])
+
+
+def test_interpolation_uniform_grid():
+    xarray = np.linspace(-10., 10., 201)
+    yarray = np.exp(-0.5 * xarray**2) * np.exp(1j * xarray)
+    uniform_wavefunction = InterpolatingWaveFunction(xarray, yarray)
+    assert uniform_wavefunction.uniform
+
+    perturbed_xarray = xarray.copy()
+    perturbed_xarray[100] += 1e-3
+    nonuniform_wavefunction = InterpolatingWaveFunction(perturbed_xarray, yarray)
+    assert not nonuniform_wavefunction.uniform
+
+    xs = np.concatenate([np.random.default_rng(1).uniform(-10., 10., size=500), xarray])
+    expected = np.interp(xs, xarray, np.real(yarray)) + 1j * np.interp(xs, xarray, np.imag(yarray))
+    np.testing.assert_array_almost_equal(uniform_wavefunction(xs), expected)
+    assert uniform_wavefunction(10.) == pytest.approx(yarray[-1])
+    assert uniform_wavefunction(-10.) == pytest.approx(yarray[0])
+
+
+def test_higher_order_interpolation():
+    f = lambda x: np.exp(-0.5 * x**2) * (1. + 1j * x)
+    xarray = np.linspace(-10., 10., 41)
+    xs = np.linspace(-9.9, 9.9, 1001)
+    errors = {}
+    for kind in ['linear', 'cubic', 'sinc']:
+        wavefunction = InterpolatingWaveFunction(xarray, f(xarray), kind=kind)
+        assert wavefunction.kind == kind
+        np.testing.assert_array_almost_equal(wavefunction(xarray), f(xarray))
+        errors[kind] = np.max(np.abs(wavefunction(xs) - f(xs)))
+    assert errors['cubic'] < 0.1 * errors['linear']
+    assert errors['sinc'] < 1e-6
+
+    with pytest.raises(ValueError):
+        InterpolatingWaveFunction(np.array([0., 1., 3.]), np.array([0., 1., 2.]), kind='sinc')
+    with pytest.raises(ValueError):
+        InterpolatingWaveFunction(xarray, f(xarray), kind='quintic')
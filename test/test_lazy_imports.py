@@ -0,0 +1,35 @@
+
+import subprocess
+import sys
+
+import pyqentangle
+
+
+def test_numpy_decomposition_does_not_import_heavy_modules():
+    code = (
+        "import sys\n"
+        "import numpy as np\n"
+        "import pyqentangle\n"
+        "pyqentangle.schmidt_decomposition(np.eye(3) / np.sqrt(3), approach='numpy')\n"
+        "print(' '.join(module for module in ('numba', 'tensornetwork') if module in sys.modules))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == ''
+
+
+def test_lazy_attributes():
+    assert 'ContinuousSchmidtDecomposer' in dir(pyqentangle)
+    assert {'__name__', 'core', 'quantumstates'} <= set(dir(pyqentangle))
+    assert pyqentangle.negativity is pyqentangle.metrics.metrics.negativity
+    assert pyqentangle.quantumstates.harmonics.harmonic_wavefcn(0)(0.) > 0.
+
+
+def test_star_import_exposes_lazy_names():
+    namespace = {}
+    exec('from pyqentangle import *', namespace)
+    for name in pyqentangle._lazy_attributes:
+        assert namespace[name] is getattr(pyqentangle, name)
+    assert namespace['quantumstates'] is pyqentangle.quantumstates
+    assert namespace['schmidt_decomposition'] is pyqentangle.schmidt_decomposition
@@ -31,3 +31,82 @@ def test_renyi_entanglement_entropies():
     }
     for alpha, entropy in alpha_to_entropies.items():
         assert pyqentangle.renyi_entanglement_entropy(schmidt_modes, alpha) / shannon == pytest.approx(entropy)
+
+
+def test_batch_metrics():
+    thetas = np.linspace(0., 0.5*np.pi, 7)
+    tensors = np.zeros((len(thetas), 2, 3), dtype=np.complex128)
+    tensors[:, 0, 1] = np.cos(thetas)
+    tensors[:, 1, 0] = 1j * np.sin(thetas)
+
+    coefficients, modes1, modes2 = pyqentangle.schmidt_decomposition_batch(tensors)
+    assert coefficients.shape == (7, 2)
+    assert modes1.shape == (7, 2, 2)
+    assert modes2.shape == (7, 3, 2)
+    np.testing.assert_array_almost_equal(
+        np.einsum('bik,bk,bjk->bij', modes1, coefficients, modes2),
+        tensors
+    )
+
+    entropies = pyqentangle.entanglement_entropy(coefficients)
+    renyi_entropies = pyqentangle.renyi_entanglement_entropy(coefficients, 2.)
+    participation_ratios = pyqentangle.participation_ratio(coefficients)
+    assert entropies.shape == (7,)
+    for i, tensor in enumerate(tensors):
+        modes = pyqentangle.DiscreteSchmidtDecomposer(tensor, approach='numpy').modes()
+        assert entropies[i] == pytest.approx(pyqentangle.entanglement_entropy(modes), abs=1e-12)
+        assert renyi_entropies[i] == pytest.approx(pyqentangle.renyi_entanglement_entropy(modes, 2.))
+        assert participation_ratios[i] == pytest.approx(pyqentangle.participation_ratio(modes))
+    assert entropies[0] == 0.
+    assert entropies[-1] == pytest.approx(0., abs=1e-12)
+    assert entropies[3] == pytest.approx(shannon)
+
+
+def test_negativity_from_schmidt_coefficients():
+    rng = np.random.default_rng(3)
+    for dims in [(2, 2), (3, 5), (6, 4)]:
+        state = rng.standard_normal(dims) + 1j * rng.standard_normal(dims)
+        state /= np.linalg.norm(state)
+        dense_negativity = pyqentangle.negativity(state, dense=True)
+        assert pyqentangle.negativity(state) == pytest.approx(dense_negativity)
+
+        decomposer = pyqentangle.DiscreteSchmidtDecomposer(state, approach='numpy')
+        assert pyqentangle.negativity(decomposer) == pytest.approx(dense_negativity)
+        assert pyqentangle.negativity(decomposer.modes()) == pytest.approx(dense_negativity)
+        assert pyqentangle.negativity(list(decomposer.modes())) == pytest.approx(dense_negativity)
+
+        spectrum_only = pyqentangle.DiscreteSchmidtDecomposer(state, compute_modes=False)
+        assert pyqentangle.negativity(spectrum_only) == pytest.approx(dense_negativity)
+        assert pyqentangle.log_negativity(spectrum_only) == pytest.approx(np.log(2 * dense_negativity + 1))
+
+    assert pyqentangle.negativity(np.array([[1., 0.], [0., 0.]])) == pytest.approx(0.)
+    with pytest.raises(ValueError):
+        pyqentangle.negativity(schmidt_modes, dense=True)
+
+
+def test_densitymatrix_negativity():
+    from pyqentangle.core.tncompute import bipartitepurestate_densitymatrix
+
+    rng = np.random.default_rng(5)
+    state = rng.standard_normal((4, 6)) + 1j * rng.standard_normal((4, 6))
+    state /= np.linalg.norm(state)
+    densitymatrix = bipartitepurestate_densitymatrix(state)
+    pure_negativity = pyqentangle.negativity(state)
+    assert pyqentangle.negativity(densitymatrix) == pytest.approx(pure_negativity)
+    assert pyqentangle.negativity(densitymatrix, eigensolver='lanczos', nb_eigenvalues=12) \
+        == pytest.approx(pure_negativity)
+    assert pyqentangle.log_negativity(densitymatrix) == pytest.approx(log(2 * pure_negativity + 1))
+
+    # Werner state p |Phi+><Phi+| + (1 - p) I / 4 is entangled for p > 1/3, with N = (3p - 1) / 4
+    bell = np.array([[1., 0.], [0., 1.]]) / np.sqrt(2)
+    for p in [0.2, 0.5, 0.9]:
+        werner = p * bipartitepurestate_densitymatrix(bell) \
+            + (1 - p) * np.reshape(np.eye(4), (2, 2, 2, 2)) / 4
+        assert pyqentangle.negativity(werner) == pytest.approx(max(0., (3 * p - 1) / 4), abs=1e-12)
+        assert pyqentangle.negativity(werner, eigensolver='lanczos', nb_eigenvalues=2) \
+            == pytest.approx(max(0., (3 * p - 1) / 4), abs=1e-10)
+
+    with pytest.raises(ValueError):
+        pyqentangle.negativity(densitymatrix, eigensolver='arpack')
+    with pytest.raises(pyqentangle.InvalidQuantumStateException):
+        pyqentangle.negativity(np.zeros((2, 3, 3, 2)))
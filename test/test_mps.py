@@ -0,0 +1,82 @@
+
+import numpy as np
+import pytest
+
+import pyqentangle
+
+
+def random_state(dims, seed=0):
+    rng = np.random.default_rng(seed)
+    tensor = rng.standard_normal(dims) + 1j * rng.standard_normal(dims)
+    return tensor / np.linalg.norm(tensor)
+
+
+def test_ghz_spectra():
+    ghz = np.zeros((2, 2, 2, 2))
+    ghz[0, 0, 0, 0] = ghz[1, 1, 1, 1] = 1 / np.sqrt(2)
+    decomposer = pyqentangle.MultipartiteDecomposer(ghz, max_discarded_weight=1e-12)
+    for spectrum in decomposer.entanglement_spectra():
+        np.testing.assert_allclose(spectrum, [1 / np.sqrt(2), 1 / np.sqrt(2)])
+    assert decomposer.mps().bond_dimensions == (2, 2, 2)
+
+    # the bipartite Schmidt modes are not defined for a multipartite state
+    with pytest.raises(ValueError, match='mps'):
+        decomposer.modes()
+    with pytest.raises(ValueError, match='mps'):
+        decomposer.mode_iterator()
+
+
+def test_spectra_match_bipartite_decompositions():
+    dims = (2, 3, 4, 3)
+    tensor = random_state(dims)
+    mps = pyqentangle.MultipartiteDecomposer(tensor).mps()
+    assert len(mps) == 4
+    assert mps.physical_dimensions == dims
+    for cut, spectrum in enumerate(mps.schmidt_coefficients):
+        bipartite = tensor.reshape(int(np.prod(dims[:cut + 1])), -1)
+        coefs = pyqentangle.schmidt_decomposition(bipartite, approach='numpy').schmidt_coefficients
+        np.testing.assert_allclose(spectrum, coefs, atol=1e-12)
+    np.testing.assert_allclose(mps.to_tensor(), tensor, atol=1e-12)
+    np.testing.assert_allclose(mps.discarded_weights, 0.)
+    # the site tensors but the last are left-canonical
+    for site in mps.tensors[:-1]:
+        matrix = site.reshape(-1, site.shape[2])
+        np.testing.assert_allclose(matrix.conj().T @ matrix, np.eye(site.shape[2]), atol=1e-12)
+
+
+def test_truncation():
+    tensor = random_state((4, 4, 4, 4))
+    mps = pyqentangle.MultipartiteDecomposer(tensor, max_rank=3).mps()
+    assert max(mps.bond_dimensions) == 3
+    assert np.all(mps.discarded_weights > 0)
+
+    mps = pyqentangle.MultipartiteDecomposer(tensor, max_discarded_weight=0.05).mps()
+    assert np.all(mps.discarded_weights <= 0.05)
+    fidelity = np.abs(np.vdot(tensor, mps.to_tensor())) ** 2 / np.linalg.norm(mps.to_tensor()) ** 2
+    assert fidelity > 1 - np.sum(mps.discarded_weights)
+
+
+def test_invalid_tensor():
+    with pytest.raises(ValueError):
+        pyqentangle.mps_decomposition(np.ones(4))
+
+
+def test_multipartite_entanglement_entropies():
+    dims = (2, 3, 2, 2, 3)
+    tensor = random_state(dims, seed=1)
+    subsystems = [[0], [0, 1], [2, 3, 4], [1, 3], [3], [1], [0, 2, 4], [4, 0], [], [0, 1, 2, 3, 4]]
+    entropies = pyqentangle.multipartite_entanglement_entropies(tensor.ravel(), subsystems, dims=dims)
+
+    for subsystem, entropy in zip(subsystems, entropies):
+        rest = [party for party in range(len(dims)) if party not in subsystem]
+        dim = int(np.prod([dims[party] for party in subsystem]))
+        matrix = np.transpose(tensor, list(subsystem) + rest).reshape(dim, -1)
+        modes = pyqentangle.schmidt_decomposition(matrix, approach='numpy')
+        assert entropy == pytest.approx(pyqentangle.entanglement_entropy(modes), abs=1e-10)
+
+    renyi = pyqentangle.multipartite_entanglement_entropies(tensor, [[1, 3], [3]], alpha=2.)
+    for subsystem, entropy in zip([[1, 3], [3]], renyi):
+        rest = [party for party in range(len(dims)) if party not in subsystem]
+        matrix = np.transpose(tensor, subsystem + rest).reshape(int(np.prod([dims[p] for p in subsystem])), -1)
+        coefs = np.linalg.svd(matrix, compute_uv=False)
+        assert entropy == pytest.approx(pyqentangle.renyi_entanglement_entropy(coefs, 2.))
@@ -3,7 +3,8 @@ import numpy as np
 import pytest
 
 from pyqentangle.core.tncompute import bipartitepurestate_densitymatrix, \
-    bipartitepurestate_partialtranspose_densitymatrix, flatten_bipartite_densitymatrix
+    bipartitepurestate_partialtranspose_densitymatrix, flatten_bipartite_densitymatrix, \
+    bipartite_densitymatrix_partialtranspose
 
 
 tensor = np.array([[0., np.sqrt(0.6) * 1j], [np.sqrt(0.4) * 1j, 0.]])
@@ -53,3 +54,30 @@ def test_flatten():
     assert flatten_fullden_pt1[0, 3] == pytest.approx(np.sqrt(0.6*0.4)+0j)
     assert flatten_fullden_pt1[3, 0] == pytest.approx(np.sqrt(0.6*0.4)+0j)
     assert flatten_fullden_pt1[2, 2] == pytest.approx(0.4+0j)
+
+
+@pytest.mark.parametrize('dims', [(2, 2), (3, 5)])
+def test_numpy_tensornetwork_backends(dims):
+    rng = np.random.default_rng(11)
+    state = rng.standard_normal(dims) + 1j * rng.standard_normal(dims)
+    state /= np.linalg.norm(state)
+
+    fullden = bipartitepurestate_densitymatrix(state)
+    np.testing.assert_allclose(fullden, bipartitepurestate_densitymatrix(state, backend='tensornetwork'))
+    for pt_subsys in [0, 1]:
+        fullden_pt = bipartitepurestate_partialtranspose_densitymatrix(state, pt_subsys)
+        np.testing.assert_allclose(
+            fullden_pt,
+            bipartitepurestate_partialtranspose_densitymatrix(state, pt_subsys, backend='tensornetwork')
+        )
+        np.testing.assert_allclose(
+            flatten_bipartite_densitymatrix(fullden_pt),
+            flatten_bipartite_densitymatrix(fullden_pt, backend='tensornetwork')
+        )
+
+    # views instead of copies
+    assert np.shares_memory(flatten_bipartite_densitymatrix(fullden), fullden)
+    assert np.shares_memory(bipartite_densitymatrix_partialtranspose(fullden, 0), fullden)
+
+    with pytest.raises(ValueError):
+        bipartitepurestate_densitymatrix(state, backend='torch')
@@ -81,3 +81,43 @@ def test_fifteen_levels():
 
     assert np.trace(reddenmat0) == pytest.approx(1.0)
     assert np.trace(reddenmat1) == pytest.approx(1.0)
+
+
+def test_reduced_density_matrix_backends():
+    rng = np.random.default_rng(2)
+    tensor = rng.standard_normal((3, 4)) + 1j * rng.standard_normal((3, 4))
+    for kept in [0, 1]:
+        np.testing.assert_allclose(
+            pyqentangle.core.tncompute.bipartitepurestate_reduceddensitymatrix(tensor, kept),
+            pyqentangle.core.tncompute.bipartitepurestate_reduceddensitymatrix(tensor, kept, backend='tensornetwork')
+        )
+
+
+def test_reduced_density_matrix_from_schmidt_decomposition():
+    rng = np.random.default_rng(8)
+    # a state of Schmidt rank 3 on a 6 x 40 grid
+    tensor = (rng.standard_normal((6, 3)) + 1j * rng.standard_normal((6, 3))) \
+        @ (rng.standard_normal((3, 40)) + 1j * rng.standard_normal((3, 40)))
+    tensor /= np.linalg.norm(tensor)
+    decomposition = pyqentangle.schmidt_decomposition(tensor, approach='numpy', keep=3)
+
+    for kept in [0, 1]:
+        reddenmat = pyqentangle.core.tncompute.bipartitepurestate_reduceddensitymatrix(tensor, kept)
+        np.testing.assert_allclose(reddenmat, np.conj(reddenmat.T))
+        np.testing.assert_allclose(
+            pyqentangle.core.tncompute.schmidt_reduceddensitymatrix(decomposition, kept),
+            reddenmat,
+            atol=1e-12
+        )
+
+        single_reddenmat = pyqentangle.core.tncompute.bipartitepurestate_reduceddensitymatrix(
+            tensor, kept, dtype=np.complex64
+        )
+        assert single_reddenmat.dtype == np.complex64
+        np.testing.assert_allclose(single_reddenmat, reddenmat, atol=1e-6)
+
+    real_tensor = np.real(tensor)
+    np.testing.assert_allclose(
+        pyqentangle.core.tncompute.bipartitepurestate_reduceddensitymatrix(real_tensor, 0),
+        real_tensor @ real_tensor.T
+    )